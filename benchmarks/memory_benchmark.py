@@ -0,0 +1,112 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from argparse import ArgumentParser
+from tracemalloc import start as start_tracing, stop as stop_tracing, get_traced_memory
+from gc import collect as collect_garbage
+
+# determine where we are running (needed to patch PYTHON_PATH)
+BENCHMARK_PATH = abspath( __file__ )
+BENCHMARK_DIRECTORY = dirname( BENCHMARK_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( BENCHMARK_DIRECTORY, ".." ) )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode import PostcodeParser
+
+## Measures how much memory parsed postcode objects use.
+#  @remarks compares the (slotted) postcode objects against the same attributes held in a
+#    per-instance __dict__, which is how postcodes were laid out before they were slotted.
+class MemoryBenchmark(object):
+
+    ## Stand-in for a postcode object that stores its attributes in a __dict__.
+    class DictLayout(object):
+        pass
+
+    ## Generates distinct, valid, standard postcode strings.
+    #  @param count the number of postcode strings to generate.
+    #  @returns a list of postcode strings; this may be shorter than count (~20 million can be made).
+    @staticmethod
+    def GeneratePostcodes(count):
+        from itertools import islice, product
+        from string import ascii_uppercase
+        is_valid = PostcodeParser().is_valid
+        units = [ a + b for a, b in product("ABDEFGHJLNPQRSTUWXYZ", repeat=2) ]
+        areas = list(ascii_uppercase) + [ a + b for a, b in product(ascii_uppercase, repeat=2) ]
+        outwards = ( f"{a}{d}" for a in areas for d in range(1, 10) )
+        outwards = ( o for o in outwards if is_valid(f"{o} 1AB") )
+        all_postcodes = ( f"{o} {s}{u}" for o in outwards for s in range(10) for u in units )
+        return list( islice(all_postcodes, count) )
+
+    ## Gets every slot declared on a class, and its bases.
+    #  @param cls the class to get the slots of.
+    #  @returns a list of slot names.
+    @staticmethod
+    def GetSlotNames(cls):
+        return [ n for c in cls.__mro__ for n in getattr(c, '__slots__', ()) if n != '__weakref__' ]
+
+    ## Copies a postcodes attributes into a new object with the given layout.
+    #  @param postcode the postcode to copy.
+    #  @param target_class the class of object to copy the attributes into.
+    #  @returns the new object; its attribute values are shared with the original postcode.
+    @staticmethod
+    def CopyInto(postcode, target_class):
+        copy = object.__new__(target_class)
+        for slot_name in MemoryBenchmark.GetSlotNames(postcode.__class__):
+            object.__setattr__(copy, slot_name, getattr(postcode, slot_name))
+        return copy
+
+    ## Measures the memory allocated while creating a number of objects.
+    #  @param factory function called to create the objects (the results are kept alive).
+    #  @returns a tuple of (objects, bytes allocated).
+    @staticmethod
+    def Measure(factory):
+        collect_garbage()
+        start_tracing()
+        objects = factory()
+        allocated, _ = get_traced_memory()
+        stop_tracing()
+        return objects, allocated
+
+    ## Runs the benchmark.
+    #  @param count the number of postcodes to parse.
+    def run(self, count):
+
+        postcode_strings = MemoryBenchmark.GeneratePostcodes(count)
+
+        if len(postcode_strings) < count:
+            print(f"only {len(postcode_strings)} distinct postcodes can be generated, not {count}.")
+            count = len(postcode_strings)
+        parser = PostcodeParser()
+
+        parse_results, parsed_bytes = MemoryBenchmark.Measure( lambda: parser.parse_many(postcode_strings) )
+        postcodes = [ r.postcode for r in parse_results ]
+        postcode_class = postcodes[0].__class__
+
+        # copy the attributes into each layout, sharing the attribute values so only the 
+        # cost of the objects themselves is being measured.
+        measure_layout = lambda target_class: MemoryBenchmark.Measure( lambda: [ 
+            MemoryBenchmark.CopyInto(p, target_class) for p in postcodes ] )[1] / count
+
+        slotted_bytes = measure_layout(postcode_class)
+        dict_bytes = measure_layout(MemoryBenchmark.DictLayout)
+
+        print(f"parsed {count} standard postcodes")
+        print(f"  per postcode; slotted layout:     {slotted_bytes:>8.1f} bytes")
+        print(f"  per postcode; __dict__ layout:    {dict_bytes:>8.1f} bytes")
+        print(f"  saving per postcode:              {dict_bytes - slotted_bytes:>8.1f} bytes ({1 - slotted_bytes / dict_bytes:.0%})")
+        print(f"  per parse_many result (all in):   {parsed_bytes / count:>8.1f} bytes")
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point, run the benchmark.
+    ##
+
+    argument_parser = ArgumentParser(description="Measures the memory used by parsed postcodes.")
+    argument_parser.add_argument("--count", type=int, default=100000, help="the number of postcodes to parse.")
+    arguments = argument_parser.parse_args()
+    MemoryBenchmark().run(arguments.count)
@@ -0,0 +1,89 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from argparse import ArgumentParser
+from timeit import repeat
+
+# determine where we are running (needed to patch PYTHON_PATH)
+BENCHMARK_PATH = abspath( __file__ )
+BENCHMARK_DIRECTORY = dirname( BENCHMARK_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( BENCHMARK_DIRECTORY, ".." ) )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode import PostcodeParser
+from wintersdeep_postcode.postcode_types import StandardPostcode
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode_validator import StandardPostcodeValidator
+
+## Measures how long it takes to validate standard postcodes.
+#  @remarks compares StandardPostcode.Validate, and a validator compiled from every rule without
+#    the outward code cache, against applying each Check* rule in turn using both the frozenset
+#    rule tables and the lists they used to be loaded as.
+class ValidatorBenchmark(object):
+
+    ## A sample of postcodes to validate, a mixture of valid and invalid ones.
+    Postcodes = [ "N1C 4DN", "SW1A 1AA", "WR1 2AX", "EH12 9ZZ", "HX10 2XX", "LL9 2XX", 
+        "XI1 2XX", "N1S 2CX", "BL10 2XX", "M1 1AE", "B33 8TH", "CR2 6XH" ]
+
+    ## Validates a postcode by calling each Check* rule in turn (how Validate used to work).
+    #  @param validator the validator class whose rules should be used.
+    #  @param postcode the postcode to be validated.
+    #  @returns a list of the faults observed.
+    @staticmethod
+    def ValidatePerRule(validator, postcode):
+        validation_steps = [ (f, getattr(validator, name)) for f, name in StandardPostcode.ValidationSteps ]
+        return [ fault for fault, check in validation_steps if check(postcode) ]
+
+    ## Creates a validator class that uses lists (rather than frozensets) for its rule tables.
+    #  @returns a class derived from StandardPostcodeValidator.
+    @staticmethod
+    def CreateListTableValidator():
+        list_tables = { name: sorted( getattr(StandardPostcodeValidator, name) ) 
+            for name in StandardPostcodeValidator.RuleTables }
+        return type("ListTableValidator", (StandardPostcodeValidator,), list_tables)
+
+    ## Times a function over every sample postcode.
+    #  @param function the function to call with each postcode.
+    #  @param postcodes the postcodes to call the function with.
+    #  @param iterations the number of times to validate every postcode.
+    #  @returns the best time taken per postcode, in nanoseconds.
+    @staticmethod
+    def Time(function, postcodes, iterations):
+        run = lambda: [ function(p) for p in postcodes ]
+        best_time = min( repeat(run, number=iterations, repeat=5) )
+        return best_time / ( iterations * len(postcodes) ) * 1e9
+
+    ## Runs the benchmark.
+    #  @param iterations the number of times to validate every postcode.
+    def run(self, iterations):
+
+        parser = PostcodeParser(validate=False)
+        postcodes = [ parser(p) for p in ValidatorBenchmark.Postcodes ]
+        list_validator = ValidatorBenchmark.CreateListTableValidator()
+        per_rule = ValidatorBenchmark.ValidatePerRule
+        compiled = StandardPostcodeValidator.CompileValidator(StandardPostcode.ValidationSteps)
+
+        timings = [
+            ( "per rule, list tables",      lambda p: per_rule(list_validator, p) ),
+            ( "per rule, frozenset tables", lambda p: per_rule(StandardPostcodeValidator, p) ),
+            ( "StandardPostcode.Validate",  StandardPostcode.Validate ),
+            ( "compiled validator, uncached", lambda p: compiled(p.outward_area, p.outward_district, p.outward_subdistrict, p.inward_unit) ),
+        ]
+
+        for description, function in timings:
+            nanoseconds = ValidatorBenchmark.Time(function, postcodes, iterations)
+            print(f"  {description:<30} {nanoseconds:>8.0f} ns per postcode")
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point, run the benchmark.
+    ##
+
+    argument_parser = ArgumentParser(description="Measures the time taken to validate standard postcodes.")
+    argument_parser.add_argument("--iterations", type=int, default=2000, help="the number of times to validate each postcode.")
+    arguments = argument_parser.parse_args()
+    ValidatorBenchmark().run(arguments.iterations)
@@ -26,6 +26,10 @@ setup(
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6"
+    python_requires=">=3.6",
+    extras_require={
+        "numpy": [ "numpy" ],
+        "pandas": [ "pandas" ],
+    }
 )
 
@@ -157,7 +157,29 @@ class TestForcesPostcode(TestCase):
             faults = ForcesPostcode.Validate(postcode)
             self.assertTrue(expected_fault in faults)
 
+    ## Checks that postcodes survive a round trip through their integer encoding, in order.
+    def test__ForcesPostcode_to_int(self):
 
+        test_list = [ "BF1 1AA", "BF1 2XX", "BF2 1AA", "BFPO 0", "BFPO 1", "BFPO 1234", "BFPO 9999" ]
+
+        postcodes = [ self.createForcesPostcode(test_string) for test_string in test_list ]
+        integers = [ p.to_int() for p in postcodes ]
+
+        self.assertEqual( integers, sorted(integers) )
+        self.assertLess( integers[-1], 2 ** 31 )
+
+        for test_string, integer in zip(test_list, integers):
+            postcode = ForcesPostcode.from_int(integer)
+            self.assertIsInstance(postcode, ForcesPostcode)
+            self.assertEqual( str(postcode), test_string )
+            self.assertEqual( postcode.to_int(), integer )
+
+        from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode import StandardPostcode
+        invalid_integers = [ -1, StandardPostcode.EncodeComponents("B", 1, "", 1, "AA"),
+            StandardPostcode.EncodeComponents("BF", 1, "A", 1, "AA"), ForcesPostcode.BfpoIntegerBase + 10000 ]
+
+        for invalid_integer in invalid_integers:
+            self.assertRaises(ValueError, ForcesPostcode.from_int, invalid_integer)
 
 
 if __name__ ==  "__main__":
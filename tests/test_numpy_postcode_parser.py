@@ -0,0 +1,109 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from unittest import TestCase, SkipTest
+
+# determine where we are running (needed to patch PYTHON_PATH)
+TEST_CASE_PATH = abspath( __file__ )
+TEST_CASE_DIRECTORY = dirname( TEST_CASE_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( TEST_CASE_DIRECTORY, ".." ) )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode import PostcodeParser
+
+## Unit Test class for NumpyPostcodeParser
+#  @remarks numpy is optional, these tests are skipped if it isn't installed.
+class TestNumpyPostcodeParser(TestCase):
+
+    ## Sets up static memebers that are reused over tests.
+    #  @param cls the class that is invoking this method.
+    @classmethod
+    def setUpClass(cls):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest("numpy is not installed; NumpyPostcodeParser is optional.")
+        from wintersdeep_postcode.numpy_postcode_parser import NumpyPostcodeParser
+        cls.NumpyPostcodeParser = NumpyPostcodeParser
+
+    ## Creates a randomised corpus of (mostly) postcode shaped strings.
+    #  @param count the number of strings to create.
+    #  @returns a list of strings.
+    @staticmethod
+    def CreateCorpus(count):
+
+        from random import Random
+        from string import ascii_uppercase, digits
+
+        random = Random(1701)
+        letter = lambda: random.choice(ascii_uppercase)
+        digit = lambda: random.choice(digits)
+
+        shapes = [
+            lambda: f"{letter()}{digit()} {digit()}{letter()}{letter()}",
+            lambda: f"{letter()}{digit()}{digit()} {digit()}{letter()}{letter()}",
+            lambda: f"{letter()}{digit()}{letter()} {digit()}{letter()}{letter()}",
+            lambda: f"{letter()}{letter()}{digit()} {digit()}{letter()}{letter()}",
+            lambda: f"{letter()}{letter()}{digit()}{digit()}{digit()}{letter()}{letter()}",
+            lambda: f"{letter()}{letter()}{digit()}{letter()} {digit()}{letter()}{letter()}".lower(),
+            lambda: f"BF{digit()} {digit()}{letter()}{letter()}",
+            lambda: f"BFPO {random.randint(1, 9999)}",
+            lambda: random.choice([ "GIR 0AA", "SAN TA1", "ASCN 1ZZ", "NOT A POSTCODE", "" ]),
+        ]
+
+        return [ random.choice(shapes)() for _ in range(count) ]
+
+    ## tests that the results are the same as the scalar parser produces, for a range of options.
+    def test__NumpyPostcodeParser_parse_array__matches_parser(self):
+
+        test_list = self.CreateCorpus(20000)
+
+        for parser_options in [ {}, { 'ignored_faults': [ 201, 211, 401 ] }, { 'validate': False },
+                { 'fail_fast': True }, { 'use_scanners': False } ]:
+
+            postcode_parser = PostcodeParser(output='record', **parser_options)
+            numpy_parser = self.NumpyPostcodeParser(postcode_parser)
+            results = numpy_parser.parse_array(test_list)
+
+            self.assertEqual( results.shape, ( len(test_list), ) )
+
+            for row, parse_result in zip(results.tolist(), postcode_parser.parse_many(test_list)):
+                postcode_type, area, district, subdistrict, sector, unit, is_valid, fault_mask = row
+                self.assertEqual(is_valid, parse_result.is_success)
+                record = parse_result.postcode
+                if record is None:
+                    self.assertEqual(postcode_type, "")
+                    continue
+                self.assertEqual( ( postcode_type, area, district, subdistrict, sector, unit ),
+                    ( record.postcode_type, record.area or "", -1 if record.district is None else record.district,
+                        record.subdistrict or "", -1 if record.sector is None else record.sector, record.unit or "" ) )
+                if not postcode_parser.fail_fast:
+                    self.assertEqual(fault_mask, record.fault_mask)
+
+    ## tests that the shape of the input is kept, and strings that aren't postcodes are reported.
+    def test__NumpyPostcodeParser_parse_array__shape(self):
+
+        import numpy
+
+        numpy_parser = self.NumpyPostcodeParser()
+        results = numpy_parser.parse_array( numpy.array([ [ "N1C 4DN", "n1c4dn" ], [ "HX10 2CI", "NOPE" ] ]) )
+
+        self.assertEqual( results.shape, ( 2, 2 ) )
+        self.assertEqual( results['is_valid'].tolist(), [ [ True, True ], [ False, False ] ] )
+        self.assertEqual( results['fault_mask'][1, 0], 0b110000000001 )
+        self.assertEqual( results['postcode_type'][1, 1], "" )
+        self.assertEqual( ( results['district'][1, 1], results['sector'][1, 1] ), ( -1, -1 ) )
+        self.assertEqual( numpy_parser.parse_array([]).shape, ( 0, ) )
+
+if __name__ ==  "__main__":
+
+    ##
+    ## if this file is the main entry point, run the contained tests.
+    ##
+
+    from unittest import main as unit_test_entry_point
+    unit_test_entry_point()
@@ -0,0 +1,82 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from unittest import TestCase, SkipTest
+
+# determine where we are running (needed to patch PYTHON_PATH)
+TEST_CASE_PATH = abspath( __file__ )
+TEST_CASE_DIRECTORY = dirname( TEST_CASE_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( TEST_CASE_DIRECTORY, ".." ) )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode import PostcodeParser
+
+## Unit Test class for PostcodeSeriesAccessor
+#  @remarks pandas is optional, these tests are skipped if it isn't installed.
+class TestPandasPostcodeAccessor(TestCase):
+
+    ## Sets up static memebers that are reused over tests.
+    #  @param cls the class that is invoking this method.
+    @classmethod
+    def setUpClass(cls):
+        try:
+            import pandas
+        except ImportError:
+            raise SkipTest("pandas is not installed; PostcodeSeriesAccessor is optional.")
+        import wintersdeep_postcode.pandas_postcode_accessor
+        cls.Series = pandas.Series(
+            [ "N1C 4DN", "n1c4dn", "HX10 2CI", None, "BFPO 1234", "GIR 0AA", "NOT A POSTCODE", "N1C 4DN" ],
+            index=[ 10, 11, 12, 13, 14, 15, 16, 17 ], name="pc" )
+
+    ## tests that parse returns typed columns, with the same answers as the parser.
+    def test__PostcodeSeriesAccessor_parse(self):
+
+        for parser_options in [ {}, { 'ignored_faults': [ 201, 211, 212 ] } ]:
+
+            postcode_parser = PostcodeParser(output='record', **parser_options)
+            results = self.Series.postcode.parse(postcode_parser)
+
+            self.assertEqual( list(results.index), list(self.Series.index) )
+            self.assertEqual( str(results['area'].dtype), "category" )
+            self.assertEqual( str(results['district'].dtype), "Int16" )
+            self.assertEqual( str(results['sector'].dtype), "Int8" )
+            self.assertEqual( str(results['is_valid'].dtype), "bool" )
+
+            for value, (_, row) in zip(self.Series, results.iterrows()):
+                parse_result = postcode_parser.try_parse(value) if isinstance(value, str) else None
+                record = parse_result.postcode if parse_result else None
+                self.assertEqual( row['is_valid'], bool(parse_result and parse_result.is_success) )
+                if record is None:
+                    self.assertTrue( row.drop([ 'is_valid', 'fault_mask' ]).isna().all() )
+                    continue
+                self.assertEqual( ( row['postcode_type'], row['area'], row['fault_mask'] ),
+                    ( record.postcode_type, record.area, record.fault_mask ) )
+
+    ## tests normalize, is_valid and the component properties.
+    def test__PostcodeSeriesAccessor_methods(self):
+
+        accessor = self.Series.postcode
+
+        self.assertEqual( accessor.normalize().fillna("").tolist(), [ "N1C 4DN", "N1C 4DN", "", "", "BFPO 1234",
+            "GIR 0AA", "", "N1C 4DN" ] )
+        self.assertEqual( str(accessor.normalize().dtype), "string" )
+        self.assertEqual( accessor.normalize('unspaced')[11], "N1C4DN" )
+        self.assertEqual( accessor.is_valid().tolist(), [ True, True, False, False, True, True, False, True ] )
+        self.assertEqual( accessor.area.tolist()[:3], [ "N", "N", "HX" ] )
+        self.assertEqual( accessor.outward.tolist()[:3], [ "N1C", "N1C", "HX10" ] )
+        self.assertEqual( accessor.faults[12], 0b110000000001 )
+        self.assertEqual( accessor.area.name, "pc" )
+        self.assertRaises( ValueError, accessor.normalize, 'not-a-format' )
+
+if __name__ ==  "__main__":
+
+    ##
+    ## if this file is the main entry point, run the contained tests.
+    ##
+
+    from unittest import main as unit_test_entry_point
+    unit_test_entry_point()
@@ -0,0 +1,57 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from unittest import TestCase
+
+# determine where we are running (needed to patch PYTHON_PATH)
+TEST_CASE_PATH = abspath( __file__ )
+TEST_CASE_DIRECTORY = dirname( TEST_CASE_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( TEST_CASE_DIRECTORY, ".." ) )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode.parse_result import ParseResult
+
+## Unit Test class for ParseResult
+class TestParseResult(TestCase):
+
+    ## Tests that status values haven't changed as this would constitute breaking changes.
+    def test__ParseResult__status_values(self):
+        self.assertEqual( ParseResult.Success, 'success' )
+        self.assertEqual( ParseResult.ParseFailed, 'parse-failed' )
+        self.assertEqual( ParseResult.ValidationFailed, 'validation-failed' )
+
+    ## Tests that parse results are constructed properly, and behave as a tuple.
+    def test__ParseResult_ctor(self):
+
+        mock_postcode = object()
+        parse_result = ParseResult(ParseResult.Success, mock_postcode, (201,))
+
+        self.assertEqual( parse_result.status, ParseResult.Success )
+        self.assertIs( parse_result.postcode, mock_postcode )
+        self.assertEqual( parse_result.fault_ids, (201,) )
+        self.assertTrue( parse_result.is_success )
+
+        status, postcode, fault_ids = parse_result
+        self.assertIs( postcode, mock_postcode )
+
+        # results are shared, so shouldn't be modifiable.
+        self.assertRaises( AttributeError, setattr, parse_result, "status", ParseResult.ParseFailed )
+        self.assertRaises( AttributeError, setattr, parse_result, "other", None )
+
+    ## Tests that only successful results report success.
+    def test__ParseResult_is_success(self):
+        self.assertFalse( ParseResult(ParseResult.ParseFailed, None, ()).is_success )
+        self.assertFalse( ParseResult(ParseResult.ValidationFailed, object(), (201,)).is_success )
+
+if __name__ ==  "__main__":
+
+    ##
+    ## if this file is the main entry point, run the contained tests.
+    ##
+
+    from unittest import main as unit_test_entry_point
+    unit_test_entry_point()
@@ -0,0 +1,105 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from unittest import TestCase
+
+# determine where we are running (needed to patch PYTHON_PATH)
+TEST_CASE_PATH = abspath( __file__ )
+TEST_CASE_DIRECTORY = dirname( TEST_CASE_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( TEST_CASE_DIRECTORY, ".." ) )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode.parse_result_cache import ParseResultCache
+
+## Unit Test class for ParseResultCache
+class TestParseResultCache(TestCase):
+
+    ## tests that the cache rejects sizes it can't honour.
+    def test__ParseResultCache_ctor__bad_size(self):
+        for bad_size in [ 0, -1, 1.5, "10", None ]:
+            self.assertRaises(ValueError, ParseResultCache, str, bad_size)
+
+    ## tests that results are served from the cache, and counted, as expected.
+    def test__ParseResultCache_call(self):
+
+        calls = []
+        cache = ParseResultCache( lambda s: calls.append(s) or s.lower(), 2 )
+
+        self.assertEqual( cache("A"), "a" )
+        self.assertEqual( cache("A"), "a" )
+        self.assertEqual( calls, [ "A" ] )
+        self.assertEqual( cache.info(), (1, 1, 0, 2, 1) )
+
+        # non-string input is never cached (or counted).
+        self.assertEqual( cache(b"B"), b"b" )
+        self.assertEqual( cache(b"B"), b"b" )
+        self.assertEqual( calls, [ "A", b"B", b"B" ] )
+        self.assertEqual( len(cache), 1 )
+
+    ## tests that the least recently used result is evicted when the cache is full.
+    def test__ParseResultCache_eviction(self):
+
+        calls = []
+        cache = ParseResultCache( lambda s: calls.append(s) or s, 2 )
+
+        cache("A")
+        cache("B")
+        cache("A")  # A is now more recently used than B...
+        cache("C")  # ... so B is evicted to make room for C.
+        self.assertEqual( cache.info(), (1, 3, 1, 2, 2) )
+
+        cache("A")
+        cache("B")
+        self.assertEqual( calls, [ "A", "B", "C", "B" ] )
+        self.assertEqual( cache.info(), (2, 4, 2, 2, 2) )
+
+    ## tests that clearing the cache removes its results and statistics.
+    def test__ParseResultCache_clear(self):
+
+        cache = ParseResultCache( str, 10 )
+        cache("A")
+        cache("A")
+        cache.clear()
+        self.assertEqual( cache.info(), (0, 0, 0, 10, 0) )
+
+    ## tests that the cache stays consistent when it is shared between threads.
+    def test__ParseResultCache_threads(self):
+
+        from threading import Thread
+
+        cache = ParseResultCache( str.lower, 50 )
+        input_strings = [ f"POSTCODE {i % 80}" for i in range(2000) ]
+        errors = []
+
+        def worker():
+            try:
+                for input_string in input_strings:
+                    self.assertEqual( cache(input_string), input_string.lower() )
+            except Exception as ex:
+                errors.append(ex)
+
+        threads = [ Thread(target=worker) for _ in range(8) ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        hits, misses, evictions, max_size, size = cache.info()
+        self.assertEqual( errors, [] )
+        self.assertEqual( hits + misses, len(threads) * len(input_strings) )
+        self.assertLessEqual( size, max_size )
+        # threads that miss on the same input both parse it, but it is only held once.
+        self.assertLessEqual( size, misses - evictions )
+
+if __name__ ==  "__main__":
+
+    ##
+    ## if this file is the main entry point, run the contained tests.
+    ##
+
+    from unittest import main as unit_test_entry_point
+    unit_test_entry_point()
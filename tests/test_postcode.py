@@ -50,6 +50,72 @@ class TestPostcode(TestCase):
         postcode = Postcode(fake_regex)
         self.assertEqual(postcode.postcode_type, "unspecified")
 
+    ## tests that parsed postcodes can't be modified, so are safe to share.
+    def test__Postcode_immutable(self):
+
+        from operator import setitem
+        from wintersdeep_postcode import parse_postcode
+
+        for postcode_string, attribute_names in [
+            ( "N1C 4DN", [ "outward_area", "outward_district", "outward_subdistrict", "inward_sector", "inward_unit" ] ),
+            ( "BF1 2XX", [ "outward_area", "outward_district", "inward_sector", "inward_unit", "bfpo", "is_bfpo_format" ] ),
+            ( "GIR 0AA", [ "special_case", "postcode_parts" ] ),
+        ]:
+            postcode = parse_postcode(postcode_string)
+            for attribute_name in attribute_names + [ "is_validated", "validation_faults", "postcode_type" ]:
+                self.assertRaises(AttributeError, setattr, postcode, attribute_name, None)
+            self.assertRaises(TypeError, setitem, postcode.validation_faults, 201, "")
+            self.assertEqual(str(postcode), postcode_string)
+
+    ## tests that postcodes are slotted, so don't carry the overhead of a per-instance __dict__.
+    def test__Postcode_slots(self):
+
+        from wintersdeep_postcode import parse_postcode
+
+        for postcode_string in [ "N1C 4DN", "BF1 2XX", "BFPO 12", "GIR 0AA" ]:
+            postcode = parse_postcode(postcode_string)
+            self.assertFalse( hasattr(postcode, "__dict__"), postcode_string )
+            self.assertRaises( AttributeError, setattr, postcode, "unexpected_attribute", None )
+
+    ## tests that postcodes compare, hash and sort by value, in postal hierarchy order.
+    def test__Postcode_comparison(self):
+
+        from wintersdeep_postcode import PostcodeParser
+
+        parser = PostcodeParser(validate=False)
+        sorted_strings = [ "A1 1AA", "A1A 1AA", "A10 1AA", "AA1 1AA", "BF1 2XX", "N1C 4DN", 
+            "ZZ99 9ZZ", "BFPO 12", "BFPO 1234", "GIR 0AA" ]
+
+        postcodes = [ parser(s) for s in reversed(sorted_strings) ]
+        self.assertEqual( [ str(p) for p in sorted(postcodes) ], sorted_strings )
+
+        postcodes_again = [ parser(s.lower()) for s in sorted_strings ]
+        self.assertEqual( set(postcodes), set(postcodes_again) )
+        self.assertEqual( len( set(postcodes + postcodes_again) ), len(sorted_strings) )
+
+        lesser, greater = parser("N1C 4DN"), parser("N1C 4DP")
+        self.assertTrue( lesser == parser("n1c4dn") and lesser != greater )
+        self.assertTrue( lesser < greater and lesser <= greater and greater > lesser and greater >= lesser )
+        self.assertFalse( lesser == "N1C 4DN" )
+        self.assertRaises( TypeError, lambda: lesser < "N1C 4DN" )
+
+    ## tests that the string forms of a postcode are only built once, and then reused.
+    def test__Postcode_string_cache(self):
+
+        from wintersdeep_postcode import PostcodeParser
+
+        parser = PostcodeParser(validate=False)
+
+        for postcode_string, outward_code, inward_code in [ ("N1C 4DN", "N1C", "4DN"), 
+                ("BF1 2XX", "BF1", "2XX"), ("BFPO 12", "BFPO", "12"), ("GIR 0AA", "GIR", "0AA") ]:
+            postcode = parser(postcode_string)
+            self.assertEqual( ( postcode.outward_code, postcode.inward_code, str(postcode) ),
+                ( outward_code, inward_code, postcode_string ) )
+            self.assertIs( str(postcode), str(postcode) )
+            self.assertIs( postcode.outward_code, postcode.outward_code )
+            self.assertIs( postcode.inward_code, postcode.inward_code )
+            self.assertRaises( AttributeError, setattr, postcode, "outward_code", "" )
+
     ## test the repr function of the postcode.
     def test__Postcode_repr(self):
         from wintersdeep_postcode import parse_postcode
@@ -331,6 +331,82 @@ class TestPostcodeParser(TestCase):
         self.assertEqual( len(parser_list), 1 )
         self.assertIs( parser_list[0][1], test_type)
 
+    ## tests that the dispatch regex combines the parser list, and can identify which
+    #  postcode type matched while respecting the priority order of the list.
+    def test__PostcodeParser_build_dispatch_regex(self):
+
+        from wintersdeep_postcode.postcode_types import StandardPostcode, ForcesPostcode, SpecialCasePostcode
+
+        parser_list = PostcodeParser._get_parser_regex_list(r"(?:\ ?)")
+        dispatch_regex, dispatch_factories = PostcodeParser._build_dispatch_regex(parser_list)
+
+        test_list = [
+            ("N1C 4DN",     StandardPostcode),
+            ("N1C4DN",      StandardPostcode),
+            ("BF1 2XX",     ForcesPostcode),        # would also be a structurally valid standard postcode.
+            ("BFPO 1234",   ForcesPostcode),
+            ("XM4 5HQ",     SpecialCasePostcode),   # would also be a structurally valid standard postcode.
+            ("GIR 0AA",     SpecialCasePostcode),
+        ]
+
+        for test_string, expected_factory in test_list:
+            regex_match = dispatch_regex.match(test_string)
+            self.assertIsNotNone(regex_match, test_string)
+            self.assertIs(dispatch_factories[regex_match.lastindex], expected_factory, test_string)
+
+        self.assertIsNone( dispatch_regex.match("NOT A POSTCODE") )
+
+        # if the standard parser is the priority it should win for shared input.
+        standard_first = PostcodeParser._get_parser_regex_list(r"(?:\ ?)", [ "standard", "forces" ])
+        dispatch_regex, dispatch_factories = PostcodeParser._build_dispatch_regex(standard_first)
+        regex_match = dispatch_regex.match("BF1 2XX")
+        self.assertIs(dispatch_factories[regex_match.lastindex], StandardPostcode)
+
+    ## tests that regexes which cannot be safely combined are not, and that the parser
+    #  still works by falling back to matching each regex in turn.
+    def test__PostcodeParser_build_dispatch_regex__collision(self):
+
+        from wintersdeep_postcode.postcode_types import ForcesPostcode
+
+        parser_list = PostcodeParser._get_parser_regex_list(r"(?:\ ?)", [ "forces", "forces" ])
+        self.assertEqual( PostcodeParser._build_dispatch_regex(parser_list), (None, None) )
+
+        dispatch_stages = PostcodeParser._build_dispatch_stages(parser_list, 'tolerant')
+        self.assertEqual( len(dispatch_stages), 2 )
+
+        postcode_parser = PostcodeParser(postcode_types=[ "forces", "forces" ])
+        self.assertIsInstance( postcode_parser.parse("BF1 2AA"), ForcesPostcode )
+
+    ## tests that the dispatch stages use scanners where they are available (and allowed), 
+    #  and that the priority order of the postcode types is still respected.
+    def test__PostcodeParser_build_dispatch_stages(self):
+
+        from wintersdeep_postcode.postcode_types import StandardPostcode, ForcesPostcode, SpecialCasePostcode
+
+        parser_list = PostcodeParser._get_parser_regex_list(r"(?:\ ?)")
+
+        # special and forces are combined into one regex, standard uses its scanner.
+        dispatch_stages = PostcodeParser._build_dispatch_stages(parser_list, 'tolerant')
+        self.assertEqual( len(dispatch_stages), 2 )
+
+        # without scanners, everything can be combined into one regex.
+        dispatch_stages = PostcodeParser._build_dispatch_stages(parser_list, 'tolerant', use_scanners=False)
+        self.assertEqual( len(dispatch_stages), 1 )
+
+        test_list = [
+            ("N1C 4DN",     StandardPostcode),
+            ("BF1 2XX",     ForcesPostcode),        # would also be a structurally valid standard postcode.
+            ("XM4 5HQ",     SpecialCasePostcode),   # would also be a structurally valid standard postcode.
+        ]
+
+        for use_scanners in [ True, False ]:
+            postcode_parser = PostcodeParser(use_scanners=use_scanners)
+            for test_string, expected_type in test_list:
+                self.assertIsInstance( postcode_parser.parse(test_string), expected_type )
+
+        postcode_parser = PostcodeParser(postcode_types=[ "standard", "forces" ])
+        self.assertIsInstance( postcode_parser.parse("BF1 2XX"), StandardPostcode )
+
     ## tests that the postcode parser respects the validate keyword argument
     def test__PostcodeParser_ctor__validate_keyword(self):
         
@@ -398,6 +474,359 @@ class TestPostcodeParser(TestCase):
                 self.assertEqual( len(ex.postcode.validation_faults), 1)
                 self.assertFalse(ex.postcode.is_validated)
 
+    ## tests that try_parse reports the outcome of parsing without raising exceptions.
+    def test__PostcodeParser_try_parse(self):
+
+        from wintersdeep_postcode.parse_result import ParseResult
+        from wintersdeep_postcode.postcode_types import StandardPostcode
+
+        postcode_parser = PostcodeParser()
+
+        parse_result = postcode_parser.try_parse("N1C 4DN")
+        self.assertEqual( parse_result.status, ParseResult.Success )
+        self.assertEqual( str(parse_result.postcode), "N1C 4DN" )
+        self.assertEqual( parse_result.fault_ids, () )
+
+        for malformed_input in [ "LL20 XXX", "", None, 1 ]:
+            parse_result = postcode_parser.try_parse(malformed_input)
+            self.assertEqual( parse_result, (ParseResult.ParseFailed, None, ()) )
+
+        parse_result = postcode_parser.try_parse("HX10 2XX")
+        self.assertEqual( parse_result.status, ParseResult.ValidationFailed )
+        self.assertFalse( parse_result.postcode.is_validated )
+        self.assertEqual( parse_result.fault_ids, ( int(StandardPostcode.ExpectedSingleDigitDistrict), ) )
+
+        # ignored faults are still reported, but don't fail the result.
+        postcode_parser = PostcodeParser(ignored_faults=[ StandardPostcode.ExpectedSingleDigitDistrict ])
+        parse_result = postcode_parser.try_parse("HX10 2XX")
+        self.assertEqual( parse_result.status, ParseResult.Success )
+        self.assertTrue( parse_result.postcode.is_validated )
+        self.assertEqual( parse_result.fault_ids, ( int(StandardPostcode.ExpectedSingleDigitDistrict), ) )
+
+        # and without validation, nothing will be reported at all.
+        postcode_parser = PostcodeParser(validate=False)
+        parse_result = postcode_parser.try_parse("HX10 2XX")
+        self.assertEqual( parse_result.status, ParseResult.Success )
+        self.assertEqual( parse_result.fault_ids, () )
+
+    ## tests that parse_many and parse_iter give the same results as try_parse, in order.
+    def test__PostcodeParser_parse_many(self):
+
+        from wintersdeep_postcode.parse_result import ParseResult
+
+        test_list = [ "N1C 4DN", "LL20 XXX", None, "HX10 2XX", " bf1 2xx ", "GIR 0AA", "" ]
+        postcode_parser = PostcodeParser()
+        expected_results = [ postcode_parser.try_parse(test_string) for test_string in test_list ]
+
+        parse_many_results = postcode_parser.parse_many(test_list)
+        self.assertIsInstance( parse_many_results, list )
+
+        # parse_iter should be lazy, and accept any iterable (here, a generator).
+        parse_iter_results = postcode_parser.parse_iter( s for s in test_list )
+        self.assertFalse( isinstance(parse_iter_results, list) )
+        parse_iter_results = list(parse_iter_results)
+
+        for results in [ parse_many_results, parse_iter_results ]:
+            self.assertEqual( len(results), len(expected_results) )
+            for result, expected_result in zip(results, expected_results):
+                self.assertIsInstance( result, ParseResult )
+                self.assertEqual( result.status, expected_result.status )
+                self.assertEqual( result.fault_ids, expected_result.fault_ids )
+                self.assertEqual( repr(result.postcode), repr(expected_result.postcode) )
+
+        self.assertEqual( postcode_parser.parse_many([]), [] )
+
+    ## tests that postcodes only keep the regex match that created them when asked to.
+    def test__PostcodeParser_ctor__retain_regex_match(self):
+
+        test_list = [ "N1C 4DN", "BF1 2XX", "BFPO 12", "GIR 0AA", "XM4 5HQ" ]
+
+        for use_scanners in [ True, False ]:
+
+            postcode_parser = PostcodeParser(use_scanners=use_scanners)
+            retaining_parser = PostcodeParser(use_scanners=use_scanners, retain_regex_match=True)
+
+            for test_string in test_list:
+
+                postcode = postcode_parser(test_string)
+                self.assertIsNone( postcode._original_regex_match )
+                self.assertEqual( str(postcode), test_string )
+
+                # scanners never create a match, everything else should have one.
+                retained_postcode = retaining_parser(test_string)
+                if use_scanners and retained_postcode.postcode_type == "standard":
+                    self.assertIsNone( retained_postcode._original_regex_match )
+                else:
+                    self.assertEqual( retained_postcode._original_regex_match.group(0), test_string )
+
+    ## tests that the parser can cache results, and that cached results are shared.
+    def test__PostcodeParser_cache_size(self):
+
+        from wintersdeep_postcode.exceptions import ValidationError
+
+        postcode_parser = PostcodeParser()
+        self.assertIsNone( postcode_parser.cache_info() )
+        postcode_parser.cache_clear()
+        self.assertIsNot( postcode_parser("N1C 4DN"), postcode_parser("N1C 4DN") )
+
+        postcode_parser = PostcodeParser(cache_size=2)
+        postcode = postcode_parser("N1C 4DN")
+        self.assertIs( postcode_parser("N1C 4DN"), postcode )
+        self.assertIs( postcode_parser.try_parse("N1C 4DN").postcode, postcode )
+        self.assertEqual( postcode_parser.cache_info(), (2, 1, 0, 2, 1) )
+
+        # the cache is keyed on the raw input.
+        self.assertIsNot( postcode_parser(" n1c 4dn"), postcode )
+        self.assertEqual( postcode_parser.cache_info(), (2, 2, 0, 2, 2) )
+
+        # failures are cached (and raise) just like successes.
+        for _ in range(2):
+            self.assertRaises( ValidationError, postcode_parser, "HX10 2XX" )
+        self.assertEqual( postcode_parser.cache_info(), (3, 3, 1, 2, 2) )
+
+        postcode_parser.cache_clear()
+        self.assertEqual( postcode_parser.cache_info(), (0, 0, 0, 2, 0) )
+        self.assertRaises( ValueError, PostcodeParser, cache_size=-1 )
+
+        # results are shared between callers, so caller defined (possibly mutable) ones can't be cached.
+        self.assertRaises( ValueError, PostcodeParser, cache_size=10, result_factory=list )
+        self.assertIsNotNone( PostcodeParser(cache_size=10, output='record').result_cache )
+
+    ## tests that the parser can share one instance of each distinct postcode.
+    def test__PostcodeParser_intern_size(self):
+
+        from wintersdeep_postcode.parse_result import ParseResult
+
+        postcode_parser = PostcodeParser()
+        self.assertIsNone( postcode_parser.postcode_registry )
+        self.assertIsNot( postcode_parser("N1C 4DN"), postcode_parser("N1C 4DN") )
+
+        postcode_parser = PostcodeParser(intern_size=10)
+        postcode = postcode_parser("N1C 4DN")
+        self.assertIs( postcode_parser(" n1c4dn "), postcode )
+        self.assertIs( postcode_parser.try_parse("N1C 4DN").postcode, postcode )
+        self.assertIsNot( postcode_parser("N1C 4DP"), postcode )
+
+        # shared postcodes report the same outcome as the first time they were parsed.
+        for input_string in [ "HX10 2XX", "hx10 2xx" ]:
+            status, failed_postcode, fault_ids = postcode_parser.try_parse(input_string)
+            self.assertEqual( status, ParseResult.ValidationFailed )
+            self.assertEqual( set(fault_ids), set(failed_postcode.validation_faults) )
+        self.assertIs( postcode_parser.try_parse("HX10 2XX").postcode, failed_postcode )
+
+        postcode_parser = PostcodeParser(intern_size=10, validate=False)
+        self.assertIs( postcode_parser("HX10 2XX"), postcode_parser("HX102XX") )
+        self.assertRaises( ValueError, PostcodeParser, intern_size=-1 )
+
+        # only postcode objects are shared, so other outputs can't be interned.
+        self.assertRaises( ValueError, PostcodeParser, intern_size=10, output='record' )
+        self.assertRaises( ValueError, PostcodeParser, intern_size=10, output='tuple' )
+        self.assertRaises( ValueError, PostcodeParser, intern_size=10, result_factory=tuple )
+
+    ## tests that the parser can return records, which match the postcodes it would otherwise return.
+    def test__PostcodeParser_output(self):
+
+        from wintersdeep_postcode.postcode_record import PostcodeRecord
+        from wintersdeep_postcode.parse_result import ParseResult
+        from wintersdeep_postcode.exceptions import ValidationError, ParseError
+
+        test_list = [ "N1C 4DN", "n1c4dn", "HX10 2XX", "BF1 2XX", "BF3 2XX", "BFPO 12", "GIR 0AA", 
+            "XM4 5HQ", "NOT A POSTCODE" ]
+
+        for parser_options in [ {}, { 'use_scanners': False }, { 'validate': False }, { 'ignored_faults': [ 201 ] } ]:
+
+            postcode_parser = PostcodeParser(**parser_options)
+            record_parser = PostcodeParser(output='record', **parser_options)
+            tuple_parser = PostcodeParser(output='tuple', **parser_options)
+
+            for test_string in test_list:
+
+                status, postcode, fault_ids = postcode_parser.try_parse(test_string)
+                record_result = record_parser.try_parse(test_string)
+                tuple_result = tuple_parser.try_parse(test_string)
+                self.assertEqual( ( record_result.status, record_result.fault_ids ), ( status, fault_ids ) )
+
+                if postcode is None:
+                    self.assertIsNone( record_result.postcode )
+                    self.assertIsNone( tuple_result.postcode )
+                    self.assertRaises( ParseError, record_parser, test_string )
+                    continue
+
+                expected_record = PostcodeRecord( postcode.postcode_type, *postcode.get_components(), 
+                    postcode.is_validated, fault_ids )
+                self.assertEqual( record_result.postcode, expected_record, test_string )
+                self.assertIsInstance( record_result.postcode, PostcodeRecord )
+                self.assertEqual( tuple_result.postcode, tuple(expected_record) )
+                self.assertIs( tuple_result.postcode.__class__, tuple )
+
+                # validation errors still describe their faults using a postcode.
+                if status == ParseResult.ValidationFailed:
+                    with self.assertRaises(ValidationError) as error_context:
+                        record_parser(test_string)
+                    self.assertEqual( str(error_context.exception.postcode), str(postcode) )
+                else:
+                    self.assertEqual( tuple_parser(test_string), tuple(expected_record) )
+
+        self.assertRaises( ValueError, PostcodeParser, output='unknown' )
+
+    ## tests that the parser can create caller defined results.
+    def test__PostcodeParser_result_factory(self):
+
+        from wintersdeep_postcode.postcode_record import PostcodeRecord
+
+        created_results = []
+
+        class CustomResult(object):
+            def __init__(self, *fields):
+                self.fields = fields
+                created_results.append(self)
+
+        postcode_parser = PostcodeParser(result_factory=CustomResult, ignored_faults=[ 201 ])
+        result_objects = postcode_parser.parse_many([ "N1C 4DN", "HX10 2XX", "BFPO 12", "NOT A POSTCODE" ])
+
+        self.assertEqual( [ r.postcode for r in result_objects[:3] ], created_results )
+        self.assertIsNone( result_objects[3].postcode )
+        self.assertEqual( PostcodeRecord(*created_results[0].fields), 
+            ( 'standard', 'N', 1, 'C', 4, 'DN', True, () ) )
+        self.assertEqual( PostcodeRecord(*created_results[1].fields), 
+            ( 'standard', 'HX', 10, '', 2, 'XX', True, ( 201, ) ) )
+        self.assertIsInstance( postcode_parser("GIR 0AA"), CustomResult )
+
+        self.assertRaises( TypeError, PostcodeParser, result_factory="not callable" )
+        self.assertRaises( ValueError, PostcodeParser, result_factory=CustomResult, output='record' )
+
+    ## tests that is_valid gives the same answer as parse, without creating a result.
+    def test__PostcodeParser_is_valid(self):
+
+        test_list = [ "N1C 4DN", " n1c4dn ", "HX10 2XX", "LL9 2XX", "BF1 2XX", "BF3 2XX", "BFPO 12", 
+            "GIR 0AA", "NOT A POSTCODE", "" ]
+
+        for parser_options in [ {}, { 'use_scanners': False }, { 'validate': False }, 
+                { 'ignored_faults': [ 201 ] }, { 'whitespace': 'strict' }, { 'output': 'record' } ]:
+
+            postcode_parser = PostcodeParser(**parser_options)
+            expected_mask = bytearray( r.is_success for r in postcode_parser.parse_many(test_list) )
+
+            self.assertEqual( [ postcode_parser.is_valid(s) for s in test_list ], list( map(bool, expected_mask) ) )
+            self.assertEqual( postcode_parser.is_valid_many(test_list), expected_mask, parser_options )
+            self.assertEqual( postcode_parser.is_valid_many( iter([]) ), bytearray() )
+
+    ## tests that normalize gives the postcode string parse would have, in each format.
+    def test__PostcodeParser_normalize(self):
+
+        test_list = [
+            ( " n1c4dn ",   "N1C 4DN",   "N1C4DN",   "N1C 4DN" ),
+            ( "N1 4DN",     "N1 4DN",    "N14DN",    "N1  4DN" ),
+            ( "sw1a1aa",    "SW1A 1AA",  "SW1A1AA",  "SW1A1AA" ),
+            ( "BF12XX",     "BF1 2XX",   "BF12XX",   "BF1 2XX" ),
+            ( "bfpo 12",    "BFPO 12",   "BFPO12",   "BFPO12" ),
+            ( "GIR0AA",     "GIR 0AA",   "GIR0AA",   "GIR 0AA" ),
+            ( "LL9 2XX",    None,        None,       None ),
+            ( "NOT A POSTCODE", None,    None,       None ),
+        ]
+
+        postcode_parser = PostcodeParser()
+        input_strings = [ t[0] for t in test_list ]
+
+        for format_index, output_format in enumerate([ 'spaced', 'unspaced', 'fixed' ], 1):
+            expected_strings = [ t[format_index] for t in test_list ]
+            self.assertEqual( [ postcode_parser.normalize(s, output_format) for s in input_strings ], expected_strings )
+            self.assertEqual( postcode_parser.normalize_many(input_strings, output_format), expected_strings )
+
+        # normalized strings are exactly those parse would have given.
+        for parser_options in [ {}, { 'use_scanners': False }, { 'validate': False }, { 'ignored_faults': [ 201 ] } ]:
+            postcode_parser = PostcodeParser(**parser_options)
+            expected_strings = [ str(r.postcode) if r.is_success else None for r in postcode_parser.parse_many(input_strings) ]
+            self.assertEqual( postcode_parser.normalize_many(input_strings), expected_strings, parser_options )
+
+        self.assertRaises( ValueError, postcode_parser.normalize, "N1C 4DN", "unknown" )
+
+    ## tests that a fail fast parser reaches the same outcome, reporting only the first fault that matters.
+    def test__PostcodeParser_fail_fast(self):
+
+        test_list = [ "N1C 4DN", "HX10 2XX", "HX10 2AB", "AA1Z 2CX", "BF3 2XX", "GIR 0AA", "NOT A POSTCODE" ]
+
+        for ignored_faults in [ [], [ 201 ], [ 201, 208 ], [ 401 ] ]:
+
+            postcode_parser = PostcodeParser(ignored_faults=ignored_faults)
+            fail_fast_parser = PostcodeParser(ignored_faults=ignored_faults, fail_fast=True)
+            record_parser = PostcodeParser(ignored_faults=ignored_faults, fail_fast=True, output='tuple')
+
+            for test_string in test_list:
+                status, _, fault_ids = postcode_parser.try_parse(test_string)
+                expected_fault_ids = tuple( f for f in fault_ids if not f in ignored_faults )[:1]
+                self.assertEqual( fail_fast_parser.try_parse(test_string)[::2], (status, expected_fault_ids) )
+                self.assertEqual( record_parser.try_parse(test_string)[::2], (status, expected_fault_ids) )
+
+    ## tests that outward validation caching and the outward fault table are options of each parser.
+    def test__PostcodeParser_outward_validation_options(self):
+
+        test_list = [ "N1C 4DN", "HX10 2XX", "HX10 2AB", "AA1Z 2CX", "XI1 2CX", "BF3 2XX", "GIR 0AA", "NOT A POSTCODE" ]
+        expected_results = PostcodeParser().parse_many(test_list)
+
+        for options in [ { 'outward_cache_size': 1 }, { 'outward_cache_size': None },
+                { 'outward_fault_table': True }, { 'outward_fault_table': 'preload' } ]:
+            postcode_parser = PostcodeParser(**options)
+            self.assertEqual( postcode_parser.parse_many(test_list), expected_results, options )
+            self.assertEqual( [ postcode_parser.is_valid(s) for s in test_list ],
+                [ r.status == 'success' for r in expected_results ], options )
+
+        # one parser's options don't change how any other parser validates.
+        self.assertEqual( PostcodeParser().parse_many(test_list), expected_results )
+
+        for options in [ { 'outward_cache_size': 0 }, { 'outward_cache_size': "10" },
+                { 'outward_fault_table': 'lazy' } ]:
+            self.assertRaises(ValueError, PostcodeParser, **options)
+
+    ## tests that postcodes, records and results all give the same fault bitmask.
+    def test__PostcodeParser_fault_mask(self):
+
+        postcode_parser = PostcodeParser(ignored_faults=[ 201, 401 ])
+        record_parser = PostcodeParser(ignored_faults=[ 201, 401 ], output='record')
+
+        for test_string, expected_mask in [ ("N1C 4DN", 0), ("HX10 2CI", 0b110000000001), ("BF3 2XX", 0b1) ]:
+            parse_result = postcode_parser.try_parse(test_string)
+            record_result = record_parser.try_parse(test_string)
+            self.assertEqual( parse_result.fault_mask, expected_mask )
+            self.assertEqual( parse_result.postcode.fault_mask, expected_mask )
+            self.assertEqual( record_result.fault_mask, expected_mask )
+            self.assertEqual( record_result.postcode.fault_mask, expected_mask )
+
+            postcode = parse_result.postcode
+            expected_faults = tuple( postcode.validation_faults.faults.values() )
+            self.assertEqual( postcode.GetFaultsFromMask(expected_mask), expected_faults )
+
+    ## tests that columns hold the same postcodes the parser would otherwise return.
+    def test__PostcodeParser_parse_columns(self):
+
+        test_list = [ "N1C 4DN", "n1c4dn", "HX10 2CI", "BF1 2XX", "BF3 2XX", "BFPO 1234", "GIR 0AA", 
+            "NOT A POSTCODE", "SW1A 1AA" ]
+
+        for parser_options in [ {}, { 'ignored_faults': [ 201 ] }, { 'use_scanners': False } ]:
+
+            postcode_parser = PostcodeParser(output='record', **parser_options)
+            expected_results = postcode_parser.parse_many(test_list)
+            postcode_columns = postcode_parser.parse_columns( iter(test_list) )
+
+            self.assertEqual( len(postcode_columns), len(test_list) )
+            self.assertEqual( [ postcode_columns.get_record(i) for i in range( len(test_list) ) ], 
+                [ r.postcode for r in expected_results ] )
+            self.assertEqual( postcode_columns.is_valid, bytearray( r.is_success for r in expected_results ) )
+            self.assertEqual( list(postcode_columns.fault_masks), [ r.fault_mask for r in expected_results ] )
+
+        # strings are shared between rows.
+        self.assertEqual( postcode_columns.area_codes[0], postcode_columns.area_codes[1] )
+        self.assertEqual( postcode_columns.strings[ postcode_columns.area_codes[0] ], "N" )
+        self.assertEqual( postcode_columns.type_codes[7], 0 )
+        self.assertEqual( ( postcode_columns.districts[7], postcode_columns.sectors[7] ), ( -1, -1 ) )
+        self.assertEqual( postcode_columns.districts[5], 1234 )
+
+        # each row is 16 bytes, on every platform.
+        row_columns = [ postcode_columns.type_codes, postcode_columns.area_codes, postcode_columns.districts,
+            postcode_columns.subdistrict_codes, postcode_columns.sectors, postcode_columns.unit_codes,
+            postcode_columns.fault_masks ]
+        self.assertEqual( sum( c.itemsize for c in row_columns ) + 1, 16 )
+
     ## attempts to parse every postcode in the UK to check we are good.
     #  @remarks will only do this if the relevant file is available.
     def test_parse_all_current_uk_postcodes__if_available(self):
@@ -0,0 +1,73 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from unittest import TestCase
+
+# determine where we are running (needed to patch PYTHON_PATH)
+TEST_CASE_PATH = abspath( __file__ )
+TEST_CASE_DIRECTORY = dirname( TEST_CASE_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( TEST_CASE_DIRECTORY, ".." ) )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode.postcode_registry import PostcodeRegistry
+from wintersdeep_postcode import PostcodeParser
+
+## Unit Test class for PostcodeRegistry
+class TestPostcodeRegistry(TestCase):
+
+    ## Sets up static memebers that are reused over tests.
+    #  @param cls the class that is invoking this method.
+    @classmethod
+    def setUpClass(cls):
+        cls.Parser = PostcodeParser(validate=False)
+
+    ## tests that the registry rejects sizes it can't honour.
+    def test__PostcodeRegistry_ctor__bad_size(self):
+        for bad_size in [ 0, -1, 1.5, "10", None ]:
+            self.assertRaises(ValueError, PostcodeRegistry, bad_size)
+
+    ## tests that registered postcodes can be found by their key, and have their strings interned.
+    def test__PostcodeRegistry_register(self):
+
+        from sys import intern
+
+        registry = PostcodeRegistry(10)
+        postcodes = [ self.Parser(s) for s in [ "N1C 4DN", "BF1 2XX", "BFPO 12", "GIR 0AA" ] ]
+
+        for postcode in postcodes:
+            self.assertIsNone( registry.get( postcode._get_postcode_key() ) )
+            self.assertIs( registry.register(postcode), postcode )
+            self.assertIs( registry.get( postcode._get_postcode_key() ), postcode )
+            self.assertIs( str(postcode), intern( str(postcode) ) )
+
+        self.assertIs( postcodes[0].inward_unit, intern("DN") )
+        self.assertEqual( len(registry), 4 )
+
+        registry.clear()
+        self.assertEqual( len(registry), 0 )
+
+    ## tests that the registry doesn't keep postcodes alive, and forgets the oldest when full.
+    def test__PostcodeRegistry_bounds(self):
+
+        registry = PostcodeRegistry(2)
+        postcodes = [ registry.register( self.Parser(s) ) for s in [ "N1C 4DN", "N1C 4DP", "N1C 4DQ" ] ]
+        self.assertEqual( len(registry), 2 )
+        self.assertIsNone( registry.get( postcodes[0]._get_postcode_key() ) )
+
+        postcode_key = postcodes[1]._get_postcode_key()
+        del postcodes[1]
+        self.assertIsNone( registry.get(postcode_key) )
+        self.assertEqual( len(registry), 1 )
+
+if __name__ ==  "__main__":
+
+    ##
+    ## if this file is the main entry point, run the contained tests.
+    ##
+
+    from unittest import main as unit_test_entry_point
+    unit_test_entry_point()
@@ -38,6 +38,32 @@ class TestPostcodeTypesModule(TestCase):
         self.assertTrue( all( isinstance(t[0], str) and issubclass(t[1], Postcode) \
             for t in postcode_type_map.items() ) )
 
+    ## tests that integer encoded postcodes are decoded as the expected type.
+    def test__postcode_types__postcode_from_int(self):
+
+        from wintersdeep_postcode.postcode_types import postcode_from_int
+        from wintersdeep_postcode.postcode_types import StandardPostcode, ForcesPostcode, SpecialCasePostcode
+
+        test_list = [
+            ( StandardPostcode.EncodeComponents("N", 1, "C", 4, "DN"), StandardPostcode, "N1C 4DN" ),
+            ( StandardPostcode.EncodeComponents("BF", 1, "", 2, "AB"), ForcesPostcode, "BF1 2AB" ),
+            ( ForcesPostcode.BfpoIntegerBase + 1234, ForcesPostcode, "BFPO 1234" ),
+            ( SpecialCasePostcode.IntegerBase + SpecialCasePostcode.GetIntegerCodes().index("GIR 0AA"),
+                SpecialCasePostcode, "GIR 0AA" ),
+        ]
+
+        # the integer ranges of each type follow on from each other.
+        self.assertEqual( ForcesPostcode.BfpoIntegerBase, StandardPostcode.IntegerCodeLimit )
+        self.assertEqual( SpecialCasePostcode.IntegerBase, 
+            ForcesPostcode.BfpoIntegerBase + ForcesPostcode.BfpoIntegerCount )
+
+        for integer, expected_type, expected_string in test_list:
+            postcode = postcode_from_int(integer)
+            self.assertIsInstance(postcode, expected_type)
+            self.assertEqual(str(postcode), expected_string)
+
+        self.assertRaises(ValueError, postcode_from_int, -1)
+
 
 if __name__ ==  "__main__":
 
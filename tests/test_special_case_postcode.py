@@ -128,6 +128,25 @@ class TestSpecialCasePostcode(TestCase):
                 postcode_obj = SpecialCasePostcode(regex_match)
                 self.assertEqual(str(postcode_obj), postcode)
 
+    ## Checks that every special case example survives a round trip through its integer encoding.
+    def test__SpecialCasePostcode_to_int(self):
+
+        integer_codes = SpecialCasePostcode.GetIntegerCodes()
+        self.assertIn("GIR 0AA", integer_codes)
+        self.assertEqual(integer_codes, sorted(integer_codes))
+
+        for code_index, example in enumerate(integer_codes):
+            integer = SpecialCasePostcode.IntegerBase + code_index
+            postcode = SpecialCasePostcode.from_int(integer)
+            self.assertEqual( str(postcode), example )
+            self.assertEqual( postcode.to_int(), integer )
+
+        for invalid_integer in [ SpecialCasePostcode.IntegerBase - 1, SpecialCasePostcode.IntegerBase + len(integer_codes) ]:
+            self.assertRaises(ValueError, SpecialCasePostcode.from_int, invalid_integer)
+
+        regex_match = self.NormalRegex.match("SCP XX5")
+        self.assertRaises(ValueError, SpecialCasePostcode(regex_match).to_int)
+
 
 if __name__ ==  "__main__":
 
@@ -15,6 +15,7 @@ if not PROJECT_ROOT_DIRECTORY in python_path:
 
 # project imports
 from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode import StandardPostcode
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode_validator import StandardPostcodeValidator
 
 ## Unit Test class for the StandardPostcode class
 class TestStandardPostcode(TestCase):
@@ -173,8 +174,69 @@ class TestStandardPostcode(TestCase):
             faults = StandardPostcode.Validate(postcode)
             self.assertTrue(expected_fault in faults)
 
-
-
+    ## Checks that outward code validation results are remembered, and reused between postcodes.
+    def test__StandardPostcode_Validate__outward_cache(self):
+
+        test_list = [ "HX10 2XX", "HX10 2AB", "HX10 9CD", "N1C 4DN", "N1C 1AA" ]
+        postcodes = [ self.createStandardPostcode(test_string) for test_string in test_list ]
+        validator = StandardPostcodeValidator.CompileValidator(StandardPostcode.ValidationSteps)
+        expected_faults = [ validator( p.outward_area, p.outward_district, 
+            p.outward_subdistrict, p.inward_unit ) for p in postcodes ]
+
+        validation_plan = StandardPostcode.CompileValidationPlan(outward_cache_size=1)
+        self.assertEqual( [ validation_plan(*p.get_components()) for p in postcodes ], expected_faults )
+        self.assertEqual( validation_plan.outward_validator.cache_info()[:4], (3, 2, 1, 1) )
+
+        validation_plan = StandardPostcode.CompileValidationPlan(outward_cache_size=None)
+        self.assertEqual( [ validation_plan(*p.get_components()) for p in postcodes * 2 ], expected_faults * 2 )
+        self.assertEqual( validation_plan.outward_validator.cache_info()[:2], (8, 2) )
+
+        # plans don't share their caches with each other, or with Validate.
+        self.assertEqual( StandardPostcode.CompileValidationPlan().outward_validator.cache_info()[:2], (0, 0) )
+        self.assertEqual( [ StandardPostcode.Validate(p) for p in postcodes ], expected_faults )
+
+    ## Checks that validation plans only report the faults they weren't told to skip.
+    def test__StandardPostcode_CompileValidationPlan(self):
+
+        test_list = [ "HX10 2XX", "HX10 2AB", "AA1Z 2CX", "N1C 4DN", "Q1 1AA", "EC1Z 1VA", "BL0 1CC" ]
+        postcodes = [ self.createStandardPostcode(test_string) for test_string in test_list ]
+        all_fault_ids = [ int(fault) for fault, _ in StandardPostcode.ValidationSteps ]
+
+        for skipped_faults in [ (), all_fault_ids[:1], all_fault_ids[::2], all_fault_ids ]:
+            for fail_fast, outward_fault_table in [ (False, False), (True, False), (False, True), (True, 'preload') ]:
+                validation_plan = StandardPostcode.CompileValidationPlan(skipped_faults, fail_fast, 
+                    outward_fault_table=outward_fault_table)
+                for postcode in postcodes:
+                    expected_faults = [ f for f in StandardPostcode.Validate(postcode) if not int(f) in skipped_faults ]
+                    expected_faults = expected_faults[:1] if fail_fast else expected_faults
+                    self.assertEqual( list( validation_plan(*postcode.get_components()) ), expected_faults )
+
+    ## Checks that postcodes survive a round trip through their integer encoding, in order.
+    def test__StandardPostcode_to_int(self):
+
+        test_list = [ "A0 0AA", "A1 1AA", "A1A 1AA", "A1Z 9ZZ", "A10 1AA", "AA1 1AA", 
+            "B1 1AA", "N1C 4DN", "SW1A 1AA", "ZZ99 9ZZ" ]
+
+        postcodes = [ self.createStandardPostcode(test_string) for test_string in test_list ]
+        integers = [ p.to_int() for p in postcodes ]
+
+        self.assertEqual( integers, sorted(integers) )
+        self.assertEqual( len(set(integers)), len(integers) )
+        self.assertEqual( integers[0], 0 )
+        self.assertEqual( integers[-1], StandardPostcode.IntegerCodeLimit - 1 )
+        self.assertLess( StandardPostcode.IntegerCodeLimit, 2 ** 31 )
+
+        for test_string, integer in zip(test_list, integers):
+            postcode = StandardPostcode.from_int(integer)
+            self.assertIsInstance(postcode, StandardPostcode)
+            self.assertEqual( str(postcode), test_string )
+            self.assertEqual( postcode.to_int(), integer )
+
+        for invalid_integer in [ -1, StandardPostcode.IntegerCodeLimit ]:
+            self.assertRaises(ValueError, StandardPostcode.from_int, invalid_integer)
+
+        for invalid_components in [ ("A", 10, "A", 1, "AA"), ("AAA", 1, "", 1, "AA"), ("A", 1, "", 1, "A1") ]:
+            self.assertRaises(ValueError, StandardPostcode.EncodeComponents, *invalid_components)
 
 if __name__ ==  "__main__":
 
@@ -0,0 +1,103 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from unittest import TestCase
+
+# determine where we are running (needed to patch PYTHON_PATH)
+TEST_CASE_PATH = abspath( __file__ )
+TEST_CASE_DIRECTORY = dirname( TEST_CASE_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( TEST_CASE_DIRECTORY, "..") )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode import StandardPostcode
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode_outward_table import StandardPostcodeOutwardTable
+
+## Unit Test class for the StandardPostcodeOutwardTable class
+class TestStandardPostcodeOutwardTable(TestCase):
+
+    ## Gets every structurally possible outward code.
+    #  @returns a list of (area, district, subdistrict) tuples.
+    @staticmethod
+    def allOutwardCodes():
+        table = StandardPostcodeOutwardTable
+        district_parts = [ (d, s) for d in range(10) for s in table.SubdistrictIndexes ]
+        district_parts += [ (d, "") for d in range(10, 100) ]
+        return [ (a, d, s) for a in table.AreaIndexes for d, s in district_parts ]
+
+    ## tests that every outward code is given its own entry in the table.
+    def test__StandardPostcodeOutwardTable_GetEntryIndex(self):
+
+        outward_codes = self.allOutwardCodes()
+        entry_indexes = { StandardPostcodeOutwardTable.GetEntryIndex(*o) for o in outward_codes }
+        self.assertEqual( len(outward_codes), StandardPostcodeOutwardTable.EntryCount )
+        self.assertEqual( entry_indexes, set( range(StandardPostcodeOutwardTable.EntryCount) ) )
+
+        for invalid_outward_code in [ ("ABC", 1, ""), ("a", 1, ""), ("A", 100, ""), ("A", -1, ""), 
+                ("A", 10, "A"), ("A", 1, "AB") ]:
+            self.assertIsNone( StandardPostcodeOutwardTable.GetEntryIndex(*invalid_outward_code) )
+
+    ## tests that every entry index maps back onto the outward code it was created from.
+    def test__StandardPostcodeOutwardTable_GetOutwardCode(self):
+
+        for outward_code in self.allOutwardCodes():
+            entry_index = StandardPostcodeOutwardTable.GetEntryIndex(*outward_code)
+            self.assertEqual( StandardPostcodeOutwardTable.GetOutwardCode(entry_index), outward_code )
+
+        for invalid_entry_index in [ -1, StandardPostcodeOutwardTable.EntryCount ]:
+            self.assertRaises( ValueError, StandardPostcodeOutwardTable.GetOutwardCode, invalid_entry_index )
+
+    ## tests that the table gives the same results as evaluating every rule, for every outward code.
+    def test__StandardPostcodeOutwardTable_conformance(self):
+
+        validation_steps = StandardPostcode.OutwardValidationSteps
+        outward_table = StandardPostcodeOutwardTable(validation_steps, preload=True)
+        self.assertNotIn( 0, outward_table.entries )
+
+        for outward_code in self.allOutwardCodes():
+            expected_faults = tuple( outward_table.validator(*outward_code) )
+            self.assertEqual( outward_table.lookup(*outward_code), expected_faults, outward_code )
+
+    ## tests that entries are only calculated when they are first needed.
+    def test__StandardPostcodeOutwardTable_lazy(self):
+
+        outward_table = StandardPostcodeOutwardTable(StandardPostcode.OutwardValidationSteps)
+        self.assertEqual( outward_table.entries.count(0), StandardPostcodeOutwardTable.EntryCount )
+
+        self.assertEqual( outward_table.lookup("HX", 10, ""), ( StandardPostcode.ExpectedSingleDigitDistrict, ) )
+        self.assertEqual( outward_table.lookup("N", 1, "C"), () )
+        self.assertEqual( outward_table.entries.count(0), StandardPostcodeOutwardTable.EntryCount - 2 )
+
+        # things that don't fit in the table are still validated, they just aren't remembered.
+        self.assertEqual( outward_table.lookup("XIX", 1, ""), ( StandardPostcode.UnusedCharacterInFirstPosition, 
+            StandardPostcode.UnusedCharacterInSecondPosition ) )
+        self.assertEqual( outward_table.entries.count(0), StandardPostcodeOutwardTable.EntryCount - 2 )
+
+    ## tests that validation plans using the table validate the same way as StandardPostcode.Validate.
+    def test__StandardPostcode_CompileValidationPlan__outward_fault_table(self):
+
+        from wintersdeep_postcode import PostcodeParser
+
+        test_list = [ "N1C 4DN", "SW1A 1AA", "HX10 2XX", "XI1 2CX", "EH12 9ZZ", "N1S 2XX", "AA1Z 2XC" ]
+        parser = PostcodeParser(validate=False)
+        postcodes = [ parser(test_string) for test_string in test_list ]
+        expected_faults = [ StandardPostcode.Validate(p) for p in postcodes ]
+
+        for outward_fault_table in [ True, 'preload' ]:
+            validation_plan = StandardPostcode.CompileValidationPlan(outward_fault_table=outward_fault_table)
+            self.assertEqual( [ validation_plan(*p.get_components()) for p in postcodes ], expected_faults )
+
+        # each plan has its own table, and Validate is unaffected by either.
+        self.assertEqual( [ StandardPostcode.Validate(p) for p in postcodes ], expected_faults )
+
+if __name__ ==  "__main__":
+
+    ##
+    ## if this file is the main entry point, run the contained tests.
+    ##
+
+    from unittest import main as unit_test_entry_point
+    unit_test_entry_point()
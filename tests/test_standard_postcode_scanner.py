@@ -0,0 +1,147 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from unittest import TestCase
+from random import Random
+
+# determine where we are running (needed to patch PYTHON_PATH)
+TEST_CASE_PATH = abspath( __file__ )
+TEST_CASE_DIRECTORY = dirname( TEST_CASE_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( TEST_CASE_DIRECTORY, "..") )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode.postcode_parser import PostcodeParser
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode import StandardPostcode
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode_scanner import StandardPostcodeScanner
+
+## Unit Test class for the StandardPostcodeScanner class
+class TestStandardPostcodeScanner(TestCase):
+
+    ## The whitespace strategies the scanner is expected to support.
+    WhitespaceStrategies = [ 'strict', 'tolerant', 'lenient' ]
+
+    ## Gets the parts of a standard postcode using its regular expression.
+    #  @param parse_regex the standard postcode regex to parse the input with.
+    #  @param input_string the string to parse.
+    #  @returns a tuple of (area, district, subdistrict, sector, unit), or None if it didn't match.
+    @staticmethod
+    def regexComponents(parse_regex, input_string):
+        regex_match = parse_regex.match(input_string)
+        if not regex_match:
+            return None
+        postcode = StandardPostcode(regex_match)
+        return ( postcode.outward_area, postcode.outward_district, postcode.outward_subdistrict,
+            postcode.inward_sector, postcode.inward_unit )
+
+    ## Generates a corpus of mostly nearly-valid postcode strings to compare parsers against.
+    #  @param random_source the random number generator to use.
+    #  @param count the number of strings to generate.
+    #  @returns a list of input strings.
+    @staticmethod
+    def generateCorpus(random_source, count):
+
+        letters = "ABNXZ"
+        numbers = "019"
+        lengths = [ 0, 1, 1, 1, 2, 2, 2, 3 ]
+        seperators = [ "", "", " ", " ", " ", "  ", "\t", "\n", " \t", "\u00a0", "-" ]
+        padding = [ "", "", "", "", "", "", " ", "\n", "a", "\u00b2" ]
+        corpus = []
+
+        for _ in range(count):
+            outward = "".join( random_source.choice(letters) for _ in range(random_source.choice(lengths)) )
+            outward += "".join( random_source.choice(numbers) for _ in range(random_source.choice(lengths)) )
+            outward += "".join( random_source.choice(letters) for _ in range(random_source.randint(0, 1)) )
+            inward = random_source.choice(numbers) + random_source.choice(letters) + random_source.choice(letters)
+            parts = [ random_source.choice(padding), outward, random_source.choice(seperators), inward, random_source.choice(padding) ]
+            # occasionally damage the string, so we aren't only testing well formed input.
+            if random_source.random() < 0.2:
+                position = random_source.randint(0, len(parts) - 1)
+                parts[position] = parts[position][::-1]
+            corpus.append( "".join(parts) )
+
+        return corpus
+
+    ## tests that creating a scanner with an unknown whitespace strategy fails predictably.
+    def test__StandardPostcodeScanner_ctor__bad_whitespace(self):
+        self.assertRaises(ValueError, StandardPostcodeScanner, 'unsupported')
+        self.assertRaises(ValueError, StandardPostcodeScanner, None)
+
+    ## tests that the scanner extracts the parts of a postcode as expected.
+    def test__StandardPostcodeScanner_scan(self):
+
+        test_list = [
+            (r"A1 2BC",     ("A",    1,  "",     2, "BC")),
+            (r"A12 3BC",    ("A",    12, "",     3, "BC")),
+            (r"A1B 2CD",    ("A",    1,  "B",    2, "CD")),
+            (r"AB1 2CD",    ("AB",   1,  "",     2, "CD")),
+            (r"AB12 3CD",   ("AB",   12, "",     3, "CD")),
+            (r"AB1C 2DE",   ("AB",   1,  "C",    2, "DE")),
+            (r"AB01 2DE",   ("AB",   1,  "",     2, "DE")),
+            (r"ABC 2DE",    None),
+            (r"A123 2DE",   None),
+            (r"AB1 23E",    None),
+            (r"ab1 2cd",    None),
+        ]
+
+        scanner = StandardPostcodeScanner('strict')
+
+        for test_string, expected_components in test_list:
+            self.assertEqual( scanner.scan(test_string), expected_components, test_string )
+            self.assertEqual( scanner(test_string), expected_components, test_string )
+
+    ## tests that the scanner gives exactly the same results as the regular expression
+    #  it replaces, using every whitespace strategy the parser supports.
+    def test__StandardPostcodeScanner_conformance(self):
+
+        corpus = self.generateCorpus( Random(20200619), 20000 )
+
+        for whitespace in self.WhitespaceStrategies:
+
+            whitespace_regex = PostcodeParser._get_whitespace_pattern(whitespace)
+            parse_regex = StandardPostcode.GetParseRegex(whitespace_regex)
+            scanner = StandardPostcodeScanner(whitespace)
+            matched = 0
+
+            for test_string in corpus:
+                expected_components = self.regexComponents(parse_regex, test_string)
+                matched += bool(expected_components)
+                self.assertEqual( scanner.scan(test_string), expected_components, f"{whitespace}: {test_string!r}" )
+
+            # make sure the corpus is actually exercising the successful path.
+            self.assertGreater(matched, 100, whitespace)
+
+    ## tests that a parser using scanners gives the same results as one that doesn't.
+    def test__StandardPostcodeScanner_parser_conformance(self):
+
+        corpus = self.generateCorpus( Random(19), 5000 ) + [ "BF1 2XX", "XM4 5HQ", "GIR 0AA", "BFPO 12" ]
+
+        # '$' allows a single trailing newline, lenient input shouldn't let a second one through.
+        corpus += [ "N1 1AA\n\n", "N11AA\n\n", "N1 1AA \n", "N1 1AA\n", "N1 \t 1AA\n" ]
+
+        for whitespace in self.WhitespaceStrategies:
+            for trim_whitespace in [ True, False ]:
+
+                options = { 'whitespace': whitespace, 'trim_whitespace': trim_whitespace, 'validate': False }
+                regex_parser = PostcodeParser(use_scanners=False, **options)
+                scanner_parser = PostcodeParser(use_scanners=True, **options)
+
+                regex_results = regex_parser.parse_many(corpus)
+                scanner_results = scanner_parser.parse_many(corpus)
+
+                for test_string, regex_result, scanner_result in zip(corpus, regex_results, scanner_results):
+                    self.assertEqual( regex_result.status, scanner_result.status, f"{whitespace}: {test_string!r}" )
+                    self.assertEqual( repr(regex_result.postcode), repr(scanner_result.postcode), f"{whitespace}: {test_string!r}" )
+
+
+if __name__ ==  "__main__":
+
+    ##
+    ## if this file is the main entry point, run the contained tests.
+    ##
+
+    from unittest import main as unit_test_entry_point
+    unit_test_entry_point()
\ No newline at end of file
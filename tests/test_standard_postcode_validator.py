@@ -216,6 +216,35 @@ class TestStandardPostcodeValidator(TestCase):
                 postcode = self.createStandardPostcode(fr"AA1 9X{character}")
                 check = StandardPostcodeValidator.CheckSecondUnitCharacterExcludes(postcode)
                 self.assertEqual(expected_result, check, postcode)
+
+
+    ## Tests that the compiled validator gives exactly the same results as applying each Check*
+    #  method in turn, over every area and a spread of districts, subdistricts and units.
+    def test__StandardPostcodeValidator_CompileValidator__conformance(self):
+
+        from itertools import product
+        from string import ascii_uppercase
+
+        validation_steps = StandardPostcode.ValidationSteps
+        fused_validator = StandardPostcodeValidator.CompileValidator(validation_steps)
+        fail_fast_validator = StandardPostcodeValidator.CompileValidator(validation_steps, fail_fast=True)
+        checks = [ (fault, getattr(StandardPostcodeValidator, name)) for fault, name in validation_steps ]
+
+        areas = list(ascii_uppercase) + [ a + b for a, b in product(ascii_uppercase, repeat=2) ]
+        districts = [ 0, 1, 2, 9, 10, 11, 99 ]
+        subdistricts = [ "", "A", "C", "P", "W", "X" ]
+        units = [ "AB", "CZ", "XK" ]
+        faults_seen = set()
+
+        for area, district, subdistrict, unit in product(areas, districts, subdistricts, units):
+            postcode = StandardPostcode.FromComponents(area, district, subdistrict, 1, unit)
+            expected_faults = [ fault for fault, check in checks if check(postcode) ]
+            self.assertEqual( fused_validator(area, district, subdistrict, unit), expected_faults, postcode )
+            self.assertEqual( fail_fast_validator(area, district, subdistrict, unit), expected_faults[:1], postcode )
+            faults_seen.update(expected_faults)
+
+        # make sure every rule was actually exercised.
+        self.assertEqual( len(faults_seen), len(validation_steps) )
         
     
 
@@ -42,6 +42,18 @@ class TestValidationError(TestCase):
         self.assertIs( error_object.postcode, mock_postcode)
         self.assertIs( error_object.faults, fault_reasons )
 
+    ## Tests that the error message is built (lazily) from the postcode and its faults.
+    def test__ValidationError_str(self):
+
+        fault_reasons = {
+            1001: "a reason this isn't a postcode",
+            1026: "another reason this isn't a postcode"
+        }
+
+        error_object = ValidationError("AB1 2CD", fault_reasons)
+        self.assertEqual( str(error_object), "'AB1 2CD' failed validation with 2 faults. "
+            "a reason this isn't a postcode another reason this isn't a postcode" )
+
 if __name__ ==  "__main__":
 
     ##
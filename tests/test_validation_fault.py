@@ -38,6 +38,25 @@ class TestValidationFault(TestCase):
         
         self.assertRaises(ValueError, ValidationFault, test_fault_number2, test_fault_description2)
 
+    ## Tests that faults can be converted to and from a bitmask.
+    def test__ValidationFault_mask(self):
+
+        from wintersdeep_postcode.postcode_types import StandardPostcode, ForcesPostcode
+
+        standard_faults = ( StandardPostcode.ExpectedSingleDigitDistrict, StandardPostcode.NoZeroDistrict, 
+            StandardPostcode.UnusedSecondCharacterInUnit )
+
+        self.assertEqual( ValidationFault.ToMask([]), 0 )
+        self.assertEqual( ValidationFault.ToMask(standard_faults), 0b100000000101 )
+        self.assertEqual( ValidationFault.ToMask([ 201, 203, 212 ]), 0b100000000101 )
+        self.assertEqual( ValidationFault.ToMask([ ForcesPostcode.InvalidDistrict ]), 0b1 )
+
+        self.assertEqual( ValidationFault.FromMask(0, StandardPostcode.ValidationFaultBase), () )
+        self.assertEqual( ValidationFault.FromMask(0b100000000101, StandardPostcode.ValidationFaultBase), standard_faults )
+        self.assertEqual( StandardPostcode.GetFaultsFromMask(0b100000000101), standard_faults )
+        self.assertEqual( ForcesPostcode.GetFaultsFromMask(0b1), ( ForcesPostcode.InvalidDistrict, ) )
+        self.assertRaises( ValueError, ForcesPostcode.GetFaultsFromMask, 0b10 )
+
 if __name__ ==  "__main__":
 
     ##
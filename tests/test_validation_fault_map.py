@@ -0,0 +1,101 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from unittest import TestCase
+
+# determine where we are running (needed to patch PYTHON_PATH)
+TEST_CASE_PATH = abspath( __file__ )
+TEST_CASE_DIRECTORY = dirname( TEST_CASE_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( TEST_CASE_DIRECTORY, ".." ) )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+from wintersdeep_postcode.exceptions.validation_fault_map import ValidationFaultMap
+
+## Unit Test class for ValidationFaultMap
+class TestValidationFaultMap(TestCase):
+
+    ## A stand-in for a postcode, which counts how often it is used to format a description.
+    class MockPostcode(object):
+
+        ## Creates a new instance of the mock postcode.
+        def __init__(self):
+            self.format_count = 0
+
+        ## Gets the arguments used to format fault descriptions, counting the call.
+        def get_format_arguments(self):
+            self.format_count += 1
+            return { 'outward_area': "AB" }
+
+    ## A stand-in for a validation fault.
+    class MockFault(object):
+
+        ## Creates a new instance of the mock fault.
+        def __init__(self, fault_id, description):
+            self.id = fault_id
+            self.description = description
+
+        ## Gets the fault identifier.
+        def __int__(self):
+            return self.id
+
+        ## Gets the (unformatted) fault description.
+        def __str__(self):
+            return self.description
+
+    ## tests that descriptions are only formatted when they are accessed, and only once.
+    def test__ValidationFaultMap_lazy_formatting(self):
+
+        postcode = self.MockPostcode()
+        faults = [ self.MockFault(1001, "first {outward_area}"), self.MockFault(1002, "second {outward_area}") ]
+        fault_map = ValidationFaultMap(postcode, faults)
+
+        self.assertEqual( len(fault_map), 2 )
+        self.assertEqual( list(fault_map), [ 1001, 1002 ] )
+        self.assertIn( 1001, fault_map )
+        self.assertNotIn( 1003, fault_map )
+        self.assertEqual( postcode.format_count, 0 )
+
+        self.assertEqual( fault_map[1001], "first AB" )
+        self.assertEqual( fault_map[1001], "first AB" )
+        self.assertEqual( postcode.format_count, 1 )
+
+        self.assertEqual( dict(fault_map), { 1001: "first AB", 1002: "second AB" } )
+        self.assertEqual( postcode.format_count, 2 )
+        self.assertRaises( KeyError, fault_map.__getitem__, 1003 )
+
+    ## tests that a postcode reuses its map, so its descriptions are only formatted once.
+    def test__ValidationFaultMap_reused_by_postcode(self):
+
+        from wintersdeep_postcode import PostcodeParser
+
+        postcode = PostcodeParser(ignored_faults=[ 201, 211, 212 ])("HX10 2CI")
+        fault_map = postcode.validation_faults
+
+        self.assertIs( postcode.validation_faults, fault_map )
+        self.assertEqual( postcode.validation_faults[201], fault_map.descriptions[201] )
+        self.assertEqual( sorted(fault_map), [ 201, 211, 212 ] )
+
+    ## tests the map formats real faults from a real postcode as expected.
+    def test__ValidationFaultMap_parsed_postcode(self):
+
+        from wintersdeep_postcode import PostcodeParser
+
+        postcode_parser = PostcodeParser(validate=True, ignored_faults=[ 201, 401 ])
+        self.assertEqual( postcode_parser("HX10 2XX").validation_faults, 
+            { 201: "Postcodes in area 'HX' are expected to have single digit districts." } )
+        self.assertEqual( postcode_parser("BF3 2XX").validation_faults, 
+            { 401: "3 is not a valid district for BF postcodes." } )
+        self.assertEqual( postcode_parser("N1C 4DN").validation_faults, {} )
+
+if __name__ ==  "__main__":
+
+    ##
+    ## if this file is the main entry point, run the contained tests.
+    ##
+
+    from unittest import main as unit_test_entry_point
+    unit_test_entry_point()
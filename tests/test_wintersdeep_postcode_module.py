@@ -0,0 +1,76 @@
+# python3 imports
+from os.path import abspath, dirname, join
+from sys import path as python_path
+from unittest import TestCase
+
+# determine where we are running (needed to patch PYTHON_PATH)
+TEST_CASE_PATH = abspath( __file__ )
+TEST_CASE_DIRECTORY = dirname( TEST_CASE_PATH )
+PROJECT_ROOT_DIRECTORY = abspath( join( TEST_CASE_DIRECTORY, ".." ) )
+
+# patch up PYTHON_PATH if required.
+if not PROJECT_ROOT_DIRECTORY in python_path:
+    python_path.insert(0, PROJECT_ROOT_DIRECTORY)
+
+# project imports
+import wintersdeep_postcode
+from wintersdeep_postcode import PostcodeParser, ParseError, ValidationError
+
+## Unit Test class for the wintersdeep_postcode module
+class TestWintersdeepPostcodeModule(TestCase):
+
+    ## makes sure each test starts (and leaves) the module with its default parser.
+    def setUp(self):
+        self.original_parser = wintersdeep_postcode.set_default_parser(None)
+
+    ## restores whatever default parser was in use before the test ran.
+    def tearDown(self):
+        wintersdeep_postcode.set_default_parser(self.original_parser)
+
+    ## tests that the default parser is created lazily, and then reused.
+    def test__get_default_parser__is_shared(self):
+        parser = wintersdeep_postcode.get_default_parser()
+        self.assertIsInstance(parser, PostcodeParser)
+        self.assertIs(parser, wintersdeep_postcode.get_default_parser())
+
+    ## tests that the default parser can be swapped for a configured one, and restored.
+    def test__set_default_parser(self):
+
+        strict_parser = PostcodeParser(whitespace='strict')
+        self.assertIsNone( wintersdeep_postcode.set_default_parser(strict_parser) )
+        self.assertIs( wintersdeep_postcode.get_default_parser(), strict_parser )
+        self.assertRaises( ParseError, wintersdeep_postcode.parse_postcode, "N1C4DN" )
+        self.assertIsNone( wintersdeep_postcode.try_parse_postcode("N1C4DN") )
+
+        self.assertIs( wintersdeep_postcode.set_default_parser(None), strict_parser )
+        self.assertEqual( str(wintersdeep_postcode.parse_postcode("N1C4DN")), "N1C 4DN" )
+
+        self.assertRaises( TypeError, wintersdeep_postcode.set_default_parser, object() )
+
+    ## tests the behaviour of the module level convenience functions.
+    def test__parse_postcode__and__try_parse_postcode(self):
+
+        self.assertEqual( str(wintersdeep_postcode.parse_postcode(" n1c 4dn ")), "N1C 4DN" )
+        self.assertRaises( ParseError, wintersdeep_postcode.parse_postcode, "NOT A POSTCODE" )
+        self.assertRaises( ValidationError, wintersdeep_postcode.parse_postcode, "LL9 2XX" )
+
+        self.assertIsNone( wintersdeep_postcode.try_parse_postcode("NOT A POSTCODE") )
+        self.assertEqual( wintersdeep_postcode.try_parse_postcode("LL9 2XX", "default"), "default" )
+        postcode = wintersdeep_postcode.try_parse_postcode("LL9 2XX", ignore_validation_errors=True)
+        self.assertEqual( str(postcode), "LL9 2XX" )
+        self.assertFalse( postcode.is_validated )
+
+    ## tests the module level validity check.
+    def test__is_valid_postcode(self):
+        self.assertTrue( wintersdeep_postcode.is_valid_postcode(" n1c 4dn ") )
+        self.assertFalse( wintersdeep_postcode.is_valid_postcode("NOT A POSTCODE") )
+        self.assertFalse( wintersdeep_postcode.is_valid_postcode("LL9 2XX") )
+
+if __name__ ==  "__main__":
+
+    ##
+    ## if this file is the main entry point, run the contained tests.
+    ##
+
+    from unittest import main as unit_test_entry_point
+    unit_test_entry_point()
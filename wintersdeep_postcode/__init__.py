@@ -16,21 +16,57 @@ __all__ = [
     "PostcodeError",
     "ValidationError",
     "ParseError",
+    "ParseResult",
+    "PostcodeRecord",
+    "PostcodeColumns",
     "parse_postcode",
-    "try_parse_postcode"
+    "try_parse_postcode",
+    "is_valid_postcode",
+    "get_default_parser",
+    "set_default_parser"
 ]
 
 # Import the most relevant classes up to the module scope.
 from wintersdeep_postcode.postcode_parser import PostcodeParser
+from wintersdeep_postcode.parse_result import ParseResult
+from wintersdeep_postcode.postcode_record import PostcodeRecord
+from wintersdeep_postcode.postcode_columns import PostcodeColumns
 from wintersdeep_postcode.exceptions import (PostcodeError, ValidationError, ParseError)
 
+## The parser shared by the module level convenience functions.
+#  @remarks created on first use by get_default_parser, replaced by set_default_parser.
+_default_parser = None
+
+## Gets the parser used by the module level convenience functions.
+#  @remarks the parser is created with default options the first time it is requested,
+#    and then reused so callers do not pay to recompile the parser on every call.
+#  @returns the shared PostcodeParser instance.
+def get_default_parser():
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = PostcodeParser()
+    return _default_parser
+
+## Replaces the parser used by the module level convenience functions.
+#  @param parser a configured PostcodeParser to share, or None to restore the default.
+#  @returns the parser that was previously in use (or None if one was never created).
+#  @throws TypeError if the parser is not a PostcodeParser (or None).
+def set_default_parser(parser):
+    global _default_parser
+    if parser is not None and not isinstance(parser, PostcodeParser):
+        error_message = f"parser is expected to be a PostcodeParser or None; actually got '{type(parser).__name__}'"
+        raise TypeError(error_message)
+    previous_parser = _default_parser
+    _default_parser = parser
+    return previous_parser
+
 ## Parses a postcode string using the default postcode parser.
 #  @param postcode_string the postcode string that should be parsed.
 #  @returns the postcode string as a postcode object.
 #  @throws ParseError if the postcode cannot be parsed.
 #  @throws ValidationError if the postcode cannot be parsed.
 def parse_postcode(postcode_string):
-    parser = PostcodeParser()
+    parser = get_default_parser()
     return parser(postcode_string)
 
 ## Parses a postcode using the default postcode parser, in a more forgiving manner.
@@ -38,10 +74,22 @@ def parse_postcode(postcode_string):
 #  @param default_value the value to return in the event that the postcode cannot be parsed.
 #  @param ignore_validation_errors will still return a postcode object, even if it doesn't validate.
 #  @returns the postcode object on success, or the default value on failure.
+#  @remarks this does not use exceptions internally, so is cheap even if most input fails.
 def try_parse_postcode(postcode_string, default_value=None, ignore_validation_errors=False):
-    try:
-        return parse_postcode(postcode_string)
-    except ValidationError as ex:
-        return ex.postcode if ignore_validation_errors else default_value
-    except ParseError as ex:
-        return default_value
\ No newline at end of file
+
+    parse_result = get_default_parser().try_parse(postcode_string)
+
+    if parse_result.status == ParseResult.Success:
+        return parse_result.postcode
+
+    if parse_result.status == ParseResult.ValidationFailed and ignore_validation_errors:
+        return parse_result.postcode
+
+    return default_value
+
+## Checks if a postcode string is valid using the default postcode parser.
+#  @param postcode_string the postcode string that should be checked.
+#  @returns True if the postcode can be parsed and validated, else False.
+#  @remarks this doesn't create a postcode object or raise an exception, see PostcodeParser.is_valid.
+def is_valid_postcode(postcode_string):
+    return get_default_parser().is_valid(postcode_string)
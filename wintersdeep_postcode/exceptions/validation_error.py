@@ -11,10 +11,10 @@ class ValidationError(PostcodeError):
     #  @param postcode the postcode that failed validation.
     #  @param validation_faults a map of one or more reasons that the validation failed.
     #  @remarks the map should contain error_id => error_message pairs.
+    #  @remarks the error message is only built if it is asked for, as errors are often caught
+    #    and discarded without ever being looked at.
     def __init__(self, postcode, validation_faults = {}):
-        localised_message = _(fr"'%s' failed validation with %i faults.")
-        formatter_arguments = ( str(postcode), len(validation_faults.items())  )
-        super().__init__( localised_message % formatter_arguments)
+        super().__init__(postcode, validation_faults)
         self.faults = validation_faults
         self.postcode = postcode
 
@@ -22,8 +22,10 @@ class ValidationError(PostcodeError):
     #  @param self the instance of the object that is invoking this method.
     #  @returns the error message as a string suitable for user consumption.
     def __str__(self):
+        localised_message = _(fr"'%s' failed validation with %i faults.")
+        formatter_arguments = ( str(self.postcode), len(self.faults) )
         return " ".join([ 
-            super().__str__(), 
+            localised_message % formatter_arguments, 
             *self.faults.values() 
     ])
 
@@ -5,6 +5,46 @@ class ValidationFault(object):
     #  @remarks ID's are loaded into this map when they are instanciated.
     Map = {}
     
+    ## The number of fault identifiers allocated to each postcode type.
+    #  @remarks e.g. StandardPostcode is allocated 200 -> 299, ForcesPostcode 400 -> 499.
+    IdentifiersPerType = 100
+
+    ## Converts a collection of validation faults into an integer bitmask.
+    #  @param faults a collection of ValidationFault objects or fault identifiers, all belonging 
+    #    to the same postcode type.
+    #  @returns an integer with bit (identifier - ValidationFaultBase - 1) set for each fault; e.g. 
+    #    faults 201 and 203 give 0b101.
+    #  @remarks postcodes only ever have faults from their own type, so the mask doesn't need to 
+    #    say which type they came from; but the type is needed to convert it back (see FromMask).
+    @staticmethod
+    def ToMask(faults):
+        fault_mask = 0
+        for fault in faults:
+            fault_mask |= 1 << ( int(fault) % ValidationFault.IdentifiersPerType - 1 )
+        return fault_mask
+
+    ## Converts an integer bitmask back into the validation faults it describes.
+    #  @param fault_mask an integer bitmask, as created by ToMask.
+    #  @param fault_base the ValidationFaultBase of the postcode type the faults belong to.
+    #  @returns a tuple of the ValidationFault objects described by the mask, in identifier order.
+    #  @throws ValueError if the mask describes a fault that doesn't exist.
+    @staticmethod
+    def FromMask(fault_mask, fault_base):
+
+        faults = []
+        fault_id = fault_base + 1
+
+        while fault_mask:
+            if fault_mask & 1:
+                fault = ValidationFault.Map.get(fault_id, None)
+                if fault is None:
+                    raise ValueError(f"Validation fault mask includes unknown fault #{fault_id}.")
+                faults.append(fault)
+            fault_mask >>= 1
+            fault_id += 1
+
+        return tuple(faults)
+
     ## Creates a new instance of the validation fault object.
     #  @param self the instance of the object that is invoking this method.
     #  @param fault_id the unique identifier this validation fault.
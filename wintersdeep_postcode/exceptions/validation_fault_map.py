@@ -0,0 +1,68 @@
+# python3 imports
+from collections.abc import Mapping
+
+## A read-only map of validation fault identifier => fault description.
+#  @remarks descriptions are only formatted (using the attributes of the postcode they describe)
+#    when they are actually accessed, and then remembered. Most callers only care if a postcode
+#    validated, or which faults it had, so formatting every description up front is wasted effort.
+class ValidationFaultMap(Mapping):
+
+    ## Creates a new instance of the validation fault map.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param postcode the postcode the faults were observed on.
+    #  @param faults a sequence of the ValidationFault objects that were observed.
+    def __init__(self, postcode, faults):
+        self.postcode = postcode
+        self.faults = { int(f): f for f in faults }
+        self.descriptions = {}
+
+    ## Gets the description of a validation fault, formatting it if this hasn't been done yet.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param fault_id the identifier of the validation fault to describe.
+    #  @returns the description of the fault, as it applies to this maps postcode.
+    #  @throws KeyError if the fault was not observed.
+    def __getitem__(self, fault_id):
+
+        description = self.descriptions.get(fault_id, None)
+
+        if description is None:
+            fault = self.faults[fault_id]
+            format_arguments = self.postcode.get_format_arguments()
+            description = str(fault).format(**format_arguments)
+            self.descriptions[fault_id] = description
+
+        return description
+
+    ## Iterates over the identifiers of the validation faults in this map.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns an iterator over the fault identifiers.
+    def __iter__(self):
+        return iter(self.faults)
+
+    ## Gets the number of validation faults in this map.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the number of faults.
+    def __len__(self):
+        return len(self.faults)
+
+    ## Checks if a fault was observed, without formatting its description.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param fault_id the identifier of the validation fault to look for.
+    #  @returns True if the fault is in this map, else False.
+    def __contains__(self, fault_id):
+        return fault_id in self.faults
+
+    ## Returns a technical description of the object suitable for a developer.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a string decsribing this object.
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
@@ -0,0 +1,201 @@
+# python3 imports
+from string import ascii_uppercase
+
+# third party imports
+#  @remarks numpy is optional, this module is only usable if it is installed (pip install numpy).
+import numpy
+
+# project imports
+from wintersdeep_postcode.exceptions.validation_fault import ValidationFault
+from wintersdeep_postcode.postcode_types import StandardPostcode, ForcesPostcode
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode_outward_table import StandardPostcodeOutwardTable
+
+## Parses and validates arrays of postcode strings, using numpy.
+#  @remarks each distinct input string is only scanned once; the components are then validated for
+#    every row at once, using table lookups (built from StandardPostcodeValidator's rules) rather
+#    than a function call per row.
+#  @remarks results are the same as the PostcodeParser given would produce, as a structured array;
+#    see GetResultType.
+class NumpyPostcodeParser(object):
+
+    ## The validation fault bitmask of every structurally possible standard outward code.
+    #  @remarks indexed as StandardPostcodeOutwardTable, built on first use; see GetOutwardFaultMasks.
+    OutwardFaultMasks = None
+
+    ## The validation fault bitmask of every standard inward unit ("AA" = 0, "AB" = 1, ... "ZZ" = 675).
+    #  @remarks built on first use; see GetInwardFaultMasks.
+    InwardFaultMasks = None
+
+    ## Creates a new instance of the numpy postcode parser.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param parser the PostcodeParser whose options should be applied; None uses the default parser.
+    def __init__(self, parser=None):
+
+        if parser is None:
+            from wintersdeep_postcode import get_default_parser
+            parser = get_default_parser()
+
+        self.parser = parser
+        self.scan = parser._build_scan_function()
+        self.postcode_types = { postcode_type.PostcodeType: postcode_type for _, postcode_type in parser.parser_list }
+
+        ignored_faults = [ int(f) for f in parser.ignored_faults ]
+        per_type = ValidationFault.IdentifiersPerType
+        self.ignored_masks = { name: ValidationFault.ToMask( f for f in ignored_faults \
+                if f - f % per_type == postcode_type.ValidationFaultBase )
+            for name, postcode_type in self.postcode_types.items() }
+
+    ## Gets the validation fault bitmasks of every structurally possible standard outward code.
+    #  @returns a numpy uint32 array, indexed as StandardPostcodeOutwardTable.
+    #  @remarks the table is calculated (which takes a moment) the first time this is called.
+    @staticmethod
+    def GetOutwardFaultMasks():
+
+        if NumpyPostcodeParser.OutwardFaultMasks is None:
+            outward_table = StandardPostcodeOutwardTable(StandardPostcode.OutwardValidationSteps, preload=True)
+            fault_set_masks = numpy.array( [ 0 ] + [ ValidationFault.ToMask(f) \
+                for f in outward_table.fault_sets[1:] ], dtype=numpy.uint32 )
+            entries = numpy.frombuffer( bytes(outward_table.entries), dtype=numpy.uint8 )
+            NumpyPostcodeParser.OutwardFaultMasks = fault_set_masks[entries]
+
+        return NumpyPostcodeParser.OutwardFaultMasks
+
+    ## Gets the validation fault bitmasks of every standard inward unit.
+    #  @returns a numpy uint32 array, indexed by (first letter * 26) + second letter.
+    @staticmethod
+    def GetInwardFaultMasks():
+
+        if NumpyPostcodeParser.InwardFaultMasks is None:
+            NumpyPostcodeParser.InwardFaultMasks = numpy.array( [
+                ValidationFault.ToMask( StandardPostcode.InwardValidator(a + b) ) \
+                    for a in ascii_uppercase for b in ascii_uppercase ], dtype=numpy.uint32 )
+
+        return NumpyPostcodeParser.InwardFaultMasks
+
+    ## Gets the numpy dtype of the structured arrays returned by parse_array.
+    #  @param type_width the number of characters needed for the postcode type.
+    #  @param area_width the number of characters needed for the area.
+    #  @param unit_width the number of characters needed for the unit.
+    #  @returns a numpy dtype with the fields of a PostcodeRecord (see get_components for what each
+    #    postcode type holds in them), except fault_ids which is a fault_mask.
+    #  @remarks missing values are an empty string, or -1; input that could not be parsed has an
+    #    empty postcode_type.
+    @staticmethod
+    def GetResultType(type_width=12, area_width=4, unit_width=3):
+        return numpy.dtype([
+            ( 'postcode_type', f'U{type_width}' ),
+            ( 'area',          f'U{area_width}' ),
+            ( 'district',      numpy.int16 ),
+            ( 'subdistrict',   'U1' ),
+            ( 'sector',        numpy.int8 ),
+            ( 'unit',          f'U{unit_width}' ),
+            ( 'is_valid',      numpy.bool_ ),
+            ( 'fault_mask',    numpy.uint32 ),
+        ])
+
+    ## Calculates the validation fault bitmasks of standard postcodes.
+    #  @param areas a numpy string array of the postcodes areas.
+    #  @param districts a numpy integer array of the postcodes districts.
+    #  @param subdistricts a numpy string array of the postcodes subdistricts.
+    #  @param units a numpy string array of the postcodes units.
+    #  @returns a numpy uint32 array of the fault bitmask of each postcode.
+    #  @remarks the components must be structurally valid, as they are when scanned by a parser.
+    @staticmethod
+    def GetStandardFaultMasks(areas, districts, subdistricts, units):
+
+        area_letters = numpy.asarray(areas).astype('U2').view(numpy.uint32).reshape(-1, 2).astype(numpy.int64)
+        area_indexes = ( area_letters[:, 0] - 65 ) * 27 + numpy.where( area_letters[:, 1] == 0, 0, area_letters[:, 1] - 64 )
+
+        subdistrict_letters = numpy.asarray(subdistricts).astype('U1').view(numpy.uint32).astype(numpy.int64)
+        subdistrict_indexes = numpy.where( subdistrict_letters == 0, 0, subdistrict_letters - 64 )
+
+        districts = districts.astype(numpy.int64)
+        district_offsets = numpy.where( districts < 10, districts * 27 + subdistrict_indexes, 260 + districts )
+        entry_indexes = area_indexes * StandardPostcodeOutwardTable.DistrictsPerArea + district_offsets
+
+        unit_letters = numpy.asarray(units).astype('U2').view(numpy.uint32).reshape(-1, 2).astype(numpy.int64)
+        unit_indexes = ( unit_letters[:, 0] - 65 ) * 26 + ( unit_letters[:, 1] - 65 )
+
+        outward_masks = NumpyPostcodeParser.GetOutwardFaultMasks()[entry_indexes]
+        inward_masks = NumpyPostcodeParser.GetInwardFaultMasks()[unit_indexes]
+        return outward_masks | inward_masks
+
+    ## Parses and validates an array of postcode strings.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param values an array (or anything numpy.asarray accepts) of postcode strings.
+    #  @returns a numpy structured array, with a row for each value; see GetResultType.
+    #  @remarks is_valid is True where the parser would return a postcode (respecting its validate
+    #    and ignored_faults options), fault_mask includes ignored faults (as fault_ids does).
+    def parse_array(self, values):
+
+        values = numpy.asarray(values)
+        unique_values, inverse = numpy.unique( values.astype(str).ravel(), return_inverse=True )
+
+        # scan each distinct value once.
+        type_names, areas, districts, subdistricts, sectors, units = [], [], [], [], [], []
+        other_rows = []
+
+        for index, value in enumerate( unique_values.tolist() ):
+            parsed = self.scan(value)
+            if parsed is None:
+                type_names.append("")
+                areas.append("")
+                districts.append(-1)
+                subdistricts.append("")
+                sectors.append(-1)
+                units.append("")
+                continue
+            postcode_type, (area, district, subdistrict, sector, unit) = parsed
+            type_names.append(postcode_type.PostcodeType)
+            areas.append(area or "")
+            districts.append(-1 if district is None else district)
+            subdistricts.append(subdistrict or "")
+            sectors.append(-1 if sector is None else sector)
+            units.append(unit or "")
+            if not postcode_type in ( StandardPostcode, ForcesPostcode ):
+                other_rows.append( (index, postcode_type, parsed[1]) )
+
+        result_type = NumpyPostcodeParser.GetResultType( max( map(len, type_names), default=0 ) or 1,
+            max( map(len, areas), default=0 ) or 1, max( map(len, units), default=0 ) or 1 )
+        results = numpy.zeros( len(unique_values), dtype=result_type )
+        results['postcode_type'] = type_names
+        results['area'] = areas
+        results['district'] = districts
+        results['subdistrict'] = subdistricts
+        results['sector'] = sectors
+        results['unit'] = units
+
+        is_parsed = results['postcode_type'] != ""
+
+        if self.parser.validate_postcodes:
+
+            fault_masks = numpy.zeros( len(unique_values), dtype=numpy.uint32 )
+
+            standard_rows = numpy.flatnonzero( results['postcode_type'] == StandardPostcode.PostcodeType )
+            fault_masks[standard_rows] = NumpyPostcodeParser.GetStandardFaultMasks( results['area'][standard_rows],
+                results['district'][standard_rows], results['subdistrict'][standard_rows], results['unit'][standard_rows] )
+
+            forces_rows = ( results['postcode_type'] == ForcesPostcode.PostcodeType ) & \
+                ( results['area'] == "BF" ) & ( results['district'] > 2 )
+            fault_masks[forces_rows] |= ValidationFault.ToMask([ ForcesPostcode.InvalidDistrict ])
+
+            for index, postcode_type, components in other_rows:
+                fault_masks[index] = ValidationFault.ToMask( postcode_type.ValidateComponents(*components) )
+
+            ignored_masks = numpy.array( [ self.ignored_masks.get(t, 0) for t in type_names ], dtype=numpy.uint32 )
+            results['fault_mask'] = fault_masks
+            results['is_valid'] = is_parsed & ( ( fault_masks & ~ignored_masks ) == 0 )
+
+        else:
+            results['is_valid'] = is_parsed
+
+        return results[inverse].reshape(values.shape)
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
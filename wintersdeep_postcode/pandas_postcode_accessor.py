@@ -0,0 +1,159 @@
+# third party imports
+#  @remarks pandas is optional, this module is only usable if it is installed (pip install pandas).
+import numpy
+import pandas
+from pandas.api.extensions import register_series_accessor
+
+# project imports
+from wintersdeep_postcode.numpy_postcode_parser import NumpyPostcodeParser
+
+## Adds a "postcode" accessor to pandas Series, so columns of strings can be processed in bulk.
+#  @remarks the accessor is registered when this module is imported, i.e.
+#    `import wintersdeep_postcode.pandas_postcode_accessor` then `df['pc'].postcode.parse()`.
+#  @remarks each distinct value is only processed once, and results are typed columns (categoricals
+#    for strings that repeat, nullable integers for numbers) rather than columns of objects. Missing
+#    values (None/NaN) are treated as input that isn't a postcode.
+#  @remarks methods accept the PostcodeParser whose options should be applied; properties always
+#    use the default parser.
+@register_series_accessor("postcode")
+class PostcodeSeriesAccessor(object):
+
+    ## Creates a new instance of the accessor; pandas does this when the accessor is used.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param series the pandas Series the accessor is for.
+    def __init__(self, series):
+        self.series = series
+
+    ## Gets the default parser, if no parser was given.
+    #  @param parser the PostcodeParser that was given, or None.
+    #  @returns the parser to use.
+    @staticmethod
+    def GetParser(parser):
+        if parser is None:
+            from wintersdeep_postcode import get_default_parser
+            parser = get_default_parser()
+        return parser
+
+    ## Creates a categorical from values for each distinct input, and the distinct value of each row.
+    #  @param unique_values a sequence of values, one for each distinct input; None for missing.
+    #  @param value_codes a numpy array, the index in unique_values of each row, or -1 if missing.
+    #  @returns a pandas Categorical, with a value for each row.
+    @staticmethod
+    def CreateCategorical(unique_values, value_codes):
+        unique_categorical = pandas.Categorical(unique_values)
+        category_codes = numpy.append(unique_categorical.codes, -1)
+        return pandas.Categorical.from_codes(category_codes[value_codes], unique_categorical.categories)
+
+    ## Creates a nullable integer array from a numpy integer array, where negative values are missing.
+    #  @param values a numpy integer array.
+    #  @returns a pandas IntegerArray.
+    @staticmethod
+    def CreateIntegerArray(values):
+        return pandas.arrays.IntegerArray(values, values < 0)
+
+    ## Gets each distinct value in the series, and which of them each row holds.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a tuple of (distinct values as a list of strings, numpy array of the index of each
+    #    rows value in that list, or -1 for missing values).
+    def _factorize(self):
+        value_codes, unique_values = pandas.factorize(self.series)
+        return [ str(v) for v in unique_values ], value_codes
+
+    ## Creates a Series, with this series index and name, from the given values.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param values the values of the new series.
+    #  @returns a pandas Series.
+    def _create_series(self, values):
+        return pandas.Series(values, index=self.series.index, name=self.series.name)
+
+    ## Parses and validates every value in the series.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param parser the PostcodeParser whose options should be applied; None uses the default parser.
+    #  @returns a pandas DataFrame with this series index, and the columns of
+    #    NumpyPostcodeParser.GetResultType; postcode_type, area, subdistrict and unit are categorical,
+    #    district and sector are nullable integers. Components are given for every value that is
+    #    recognised as a postcode, is_valid is True where the parser would return a postcode.
+    def parse(self, parser=None):
+
+        unique_values, value_codes = self._factorize()
+        unique_results = NumpyPostcodeParser( self.GetParser(parser) ).parse_array(unique_values)
+
+        create_categorical = lambda field: PostcodeSeriesAccessor.CreateCategorical(
+            [ v or None for v in unique_results[field].tolist() ], value_codes )
+
+        missing_result = numpy.zeros(1, dtype=unique_results.dtype)
+        missing_result['district'] = missing_result['sector'] = -1
+        results = numpy.append(unique_results, missing_result)[value_codes]
+
+        return pandas.DataFrame({
+            'postcode_type': create_categorical('postcode_type'),
+            'area':          create_categorical('area'),
+            'district':      PostcodeSeriesAccessor.CreateIntegerArray(results['district']),
+            'subdistrict':   create_categorical('subdistrict'),
+            'sector':        PostcodeSeriesAccessor.CreateIntegerArray(results['sector']),
+            'unit':          create_categorical('unit'),
+            'is_valid':      results['is_valid'],
+            'fault_mask':    results['fault_mask'],
+        }, index=self.series.index)
+
+    ## Converts every value in the series into its normalized postcode string.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param output_format the format of the strings to create; see PostcodeParser.normalize.
+    #  @param parser the PostcodeParser whose options should be applied; None uses the default parser.
+    #  @returns a pandas Series of strings (pandas "string" dtype), missing where the value isn't a
+    #    valid postcode.
+    #  @throws ValueError when output_format isn't a recognised format.
+    def normalize(self, output_format='spaced', parser=None):
+        unique_values, value_codes = self._factorize()
+        unique_strings = self.GetParser(parser).normalize_many(unique_values, output_format)
+        normalized_strings = pandas.array(unique_strings, dtype="string").take(value_codes, allow_fill=True)
+        return self._create_series(normalized_strings)
+
+    ## Checks if each value in the series is a valid postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param parser the PostcodeParser whose options should be applied; None uses the default parser.
+    #  @returns a pandas Series of bool, True where the parser would return a postcode.
+    def is_valid(self, parser=None):
+        unique_values, value_codes = self._factorize()
+        unique_validity = numpy.frombuffer( bytes( self.GetParser(parser).is_valid_many(unique_values) ), dtype=numpy.bool_ )
+        return self._create_series( numpy.append(unique_validity, False)[value_codes] )
+
+    ## The area of each value that is recognised as a postcode, as a categorical Series.
+    #  @param self the instance of the object that is invoking this method.
+    @property
+    def area(self):
+        return self._create_series( self.parse()['area'].array )
+
+    ## The outward code of each value that is recognised as a postcode, as a categorical Series.
+    #  @param self the instance of the object that is invoking this method.
+    @property
+    def outward(self):
+
+        unique_values, value_codes = self._factorize()
+        scan = self.GetParser(None)._build_scan_function()
+        unique_outwards = []
+
+        for parsed in map(scan, unique_values):
+            if parsed is None:
+                unique_outwards.append(None)
+            else:
+                postcode_type, components = parsed
+                unique_outwards.append( postcode_type.FormatComponents(*components)[0] )
+
+        return self._create_series( PostcodeSeriesAccessor.CreateCategorical(unique_outwards, value_codes) )
+
+    ## The validation fault bitmask of each value, as a uint32 Series; see ValidationFault.FromMask.
+    #  @param self the instance of the object that is invoking this method.
+    #  @remarks zero where no faults were found, or the value isn't recognised as a postcode.
+    @property
+    def faults(self):
+        return self._create_series( self.parse()['fault_mask'].to_numpy() )
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
@@ -0,0 +1,50 @@
+# python3 imports
+from collections import namedtuple
+
+# project imports
+from wintersdeep_postcode.exceptions.validation_fault import ValidationFault
+
+## The outcome of parsing a postcode string, without the expense of raising an exception.
+#  @remarks this is a (status, postcode, fault_ids) tuple, and can be unpacked as such.
+#  @remarks status is one of ParseResult.Success, ParseResult.ParseFailed or ParseResult.ValidationFailed.
+#  @remarks postcode is the postcode object, or None if the input could not be parsed.
+#  @remarks fault_ids is a tuple of the integer identifiers of any validation faults observed,
+#    this includes ignored faults (in which case the status can still be Success).
+class ParseResult(namedtuple("ParseResult", [ "status", "postcode", "fault_ids" ])):
+
+    ## prevents instances creating a __dict__, keeping results as small as the tuple.
+    __slots__ = ()
+
+    ## Status given when the input was parsed (and validated, if the parser validates).
+    Success = 'success'
+
+    ## Status given when the input does not match any supported postcode type.
+    #  @remarks this is the equivalent of the parser raising a ParseError.
+    ParseFailed = 'parse-failed'
+
+    ## Status given when the input was parsed, but failed validation.
+    #  @remarks this is the equivalent of the parser raising a ValidationError.
+    ValidationFailed = 'validation-failed'
+
+    ## Indicates if the input was successfully parsed (and validated).
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns True if the status is Success, else False.
+    @property
+    def is_success(self):
+        return self.status == ParseResult.Success
+
+    ## Gets the validation faults observed, as an integer bitmask.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns an integer with a bit set for each fault id; see ValidationFault.ToMask.
+    @property
+    def fault_mask(self):
+        return ValidationFault.ToMask(self.fault_ids)
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
\ No newline at end of file
@@ -0,0 +1,93 @@
+# python3 imports
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+## A bounded, least recently used, cache of parse results.
+#  @remarks results are keyed on the raw input string, so input that only differs by case or
+#    whitespace is cached seperately. Only str input is cached, anything else is parsed as normal.
+#  @remarks postcode objects (and so parse results) are immutable, so can be safely shared
+#    between every caller that parses the same input.
+#  @remarks the cache is guarded by a lock, so a parser can be shared between threads; input is
+#    parsed outside of the lock, so two threads that miss on the same input may both parse it.
+class ParseResultCache(object):
+
+    ## Statistics describing a caches usage; as returned by ParseResultCache.info.
+    Info = namedtuple("ParseResultCacheInfo", [ "hits", "misses", "evictions", "max_size", "size" ])
+
+    ## Creates a new instance of the parse result cache.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param parse_function the function used to parse input that isn't in the cache.
+    #  @param max_size the maximum number of results that should be held in the cache.
+    #  @throws ValueError if max_size is not a positive integer.
+    def __init__(self, parse_function, max_size):
+
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(f"max_size is expected to be a positive integer; actually got '{max_size}'")
+
+        self.parse_function = parse_function
+        self.max_size = max_size
+        self.results = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    ## Gets the result of parsing the input string, from the cache if possible.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param input_string the input string that is to be parsed.
+    #  @returns the ParseResult for the given input.
+    def __call__(self, input_string):
+
+        if input_string.__class__ is not str:
+            return self.parse_function(input_string)
+
+        results = self.results
+
+        with self.lock:
+            parse_result = results.get(input_string, None)
+            if parse_result is not None:
+                results.move_to_end(input_string)
+                self.hits += 1
+                return parse_result
+            self.misses += 1
+
+        parse_result = self.parse_function(input_string)
+
+        with self.lock:
+            results[input_string] = parse_result
+            if len(results) > self.max_size:
+                results.popitem(last=False)
+                self.evictions += 1
+
+        return parse_result
+
+    ## Gets the number of results currently held in the cache.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the number of cached results.
+    def __len__(self):
+        return len(self.results)
+
+    ## Gets statistics describing how the cache has been used.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a ParseResultCache.Info tuple.
+    def info(self):
+        with self.lock:
+            return ParseResultCache.Info(self.hits, self.misses, self.evictions, self.max_size, len(self.results))
+
+    ## Removes all results from the cache, and resets its statistics.
+    #  @param self the instance of the object that is invoking this method.
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
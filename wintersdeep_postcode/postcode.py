@@ -1,14 +1,40 @@
 #  python3 imports
 from re import compile as compile_regex
+from sys import intern
+
+# project imports
+from wintersdeep_postcode.exceptions.validation_fault import ValidationFault
+from wintersdeep_postcode.exceptions.validation_fault_map import ValidationFaultMap
 
 ## UK Postcode Class
 #  @summary This class represents the parsed form of a UK postcode.
+#  @remarks postcode objects are immutable once they have been parsed, their public attributes
+#    are read-only properties. This allows the parser to safely share (e.g. cache) results.
 class Postcode(object):
 
     ## The type of postcode represented by this object
     #  @param this should be overriden in derived classes.
     PostcodeType = 'unspecified'
 
+    ## The attributes held by every postcode object.
+    #  @remarks postcodes are slotted (have no per-instance __dict__) as large numbers of them may be held
+    #    in memory at once; derived classes must declare slots for any attributes they add.
+    #  @remarks __weakref__ allows postcodes to be shared through a PostcodeRegistry.
+    __slots__ = ( '_original_regex_match', '_validation_faults', '_validation_fault_map', '_is_validated', 
+        '_postcode_key', '_postcode_strings', '__weakref__' )
+
+    ## The names of the public attributes that describe postcodes of this type.
+    #  @remarks these are made available to validation fault descriptions when they are formatted.
+    #  @remarks this should be extended in derived classes.
+    PublicAttributes = ( 'postcode_type', 'is_validated' )
+
+    ## The base number from which validation faults in this class start.
+    #  @remarks this should be overriden in derived classes; see ValidationFault.IdentifiersPerType.
+    ValidationFaultBase = 0
+
+    ## An empty set of validation faults, shared by postcodes that have none.
+    NoValidationFaults = ()
+
     ## Helper method used to compile regular expressions.
     #  @param args parts of the regular expression to join and compile.
     #  @remarks prevents having to specifically import re imto implementations, 
@@ -19,6 +45,39 @@ class Postcode(object):
             [ r'^' ] + [ *args ] + [ r'$' ]
         ))
 
+    ## Get a scanner that can be used to parse postcodes of this type without a regular expression.
+    #  @param whitespace the whitespace handling strategy; 'strict', 'tolerant' or 'lenient'.
+    #  @returns a function accepting an input string, and returning a postcode of this type or
+    #    None if the input was not recognised; or None if this type does not provide a scanner.
+    #  @remarks a scanner must recognise exactly the same input as the types parse regex.
+    @staticmethod
+    def GetParseScanner(whitespace):
+        return None
+
+    ## Get a scanner that can be used to parse postcodes of this type into their components.
+    #  @param whitespace the whitespace handling strategy; 'strict', 'tolerant' or 'lenient'.
+    #  @returns a function accepting an input string, and returning the components of the postcode 
+    #    (see get_components) or None if the input was not recognised; or None if this type does 
+    #    not provide a scanner.
+    #  @remarks this lets the parser skip creating a postcode object when it isn't going to return one.
+    @staticmethod
+    def GetComponentScanner(whitespace):
+        return None
+
+    ## Given the components of a postcode, should build its outward and inward codes.
+    #  Raises an error when an implementor forgets to implement this function.
+    #  @param cls the type of class that is invoking this method.
+    #  @param area the postcodes area; see get_components.
+    #  @param district the postcodes district; see get_components.
+    #  @param subdistrict the postcodes subdistrict; see get_components.
+    #  @param sector the postcodes sector; see get_components.
+    #  @param unit the postcodes unit; see get_components.
+    #  @returns a tuple of the (outward code, inward code) strings.
+    @classmethod
+    def FormatComponents(cls, area, district, subdistrict, sector, unit):
+        invoking_class = cls.__name__
+        raise NotImplementedError(f"{invoking_class} does not implement FormatComponents.")
+
     ## Given a postcode, should validate it conforms to any rules.
     #  Raises an error when an implementor forgets to implement this function.
     #  @param cls the type of class that is invoking this method.
@@ -29,14 +88,148 @@ class Postcode(object):
         invoking_class = cls.__name__
         raise NotImplementedError(f"{invoking_class} does not implement validate; cannot validate '{postcode}'.")
 
+    ## Given the components of a postcode, should validate they conform to any rules.
+    #  Raises an error when an implementor forgets to implement this function.
+    #  @param cls the type of class that is invoking this method.
+    #  @param area the postcodes area; see get_components.
+    #  @param district the postcodes district; see get_components.
+    #  @param subdistrict the postcodes subdistrict; see get_components.
+    #  @param sector the postcodes sector; see get_components.
+    #  @param unit the postcodes unit; see get_components.
+    #  @returns a list of validation faults observed with the postcode.
+    #  @remarks this must observe the same faults as Validate would for the equivalent postcode.
+    @classmethod
+    def ValidateComponents(cls, area, district, subdistrict, sector, unit):
+        invoking_class = cls.__name__
+        raise NotImplementedError(f"{invoking_class} does not implement ValidateComponents.")
+
+    ## Compiles the function a parser uses to validate the components of postcodes of this type.
+    #  @param cls the type of class that is invoking this method.
+    #  @param skipped_faults a collection of fault identifiers that should not be checked for.
+    #  @param fail_fast when True validation stops at the first fault that isn't skipped.
+    #  @param plan_options options that only some postcode types use (e.g. the outward_cache_size
+    #    of StandardPostcode), types that don't use an option ignore it.
+    #  @returns a function accepting (area, district, subdistrict, sector, unit) and returning a 
+    #    sequence of the validation faults observed; see ValidateComponents.
+    #  @remarks derived classes should override this to leave skipped checks out entirely, this 
+    #    default still makes every check and discards the skipped faults.
+    @classmethod
+    def CompileValidationPlan(cls, skipped_faults=(), fail_fast=False, **plan_options):
+
+        skipped_faults = frozenset( map(int, skipped_faults) )
+        validate_components = cls.ValidateComponents
+
+        if not skipped_faults and not fail_fast:
+            return validate_components
+
+        def validation_plan(area, district, subdistrict, sector, unit):
+            faults = validate_components(area, district, subdistrict, sector, unit)
+            faults = [ f for f in faults if not int(f) in skipped_faults ]
+            return faults[:1] if fail_fast else faults
+
+        return validation_plan
+
     ## Creates a new instance of the postcode class.
     #  @param self the instance of the object that is invoking this method.
     #  @param regex_match the regular expression that triggered building this object.
+    #  @remarks derived classes must take everything they need from regex_match here, the parser 
+    #    discards it once the postcode is created (unless created with retain_regex_match).
     def __init__(self, regex_match):
         self._original_regex_match = regex_match
-        self.validation_faults = {}
-        self.is_validated = False
-    
+        self._validation_faults = Postcode.NoValidationFaults
+        self._validation_fault_map = None
+        self._is_validated = False
+        self._postcode_key = None
+        self._postcode_strings = None
+
+    ## Encodes this postcode as an integer.
+    #  Raises an error when an implementor forgets to implement this function.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns an integer that uniquely identifies this postcode, in postal hierarchy order.
+    def to_int(self):
+        invoking_class = self.__class__.__name__
+        raise NotImplementedError(f"{invoking_class} does not implement to_int; cannot encode '{self}'.")
+
+    ## Calculates the key used to compare and hash this postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the postcodes integer encoding; see to_int.
+    #  @remarks derived classes can override this if to_int can't encode every postcode of their type.
+    def _build_postcode_key(self):
+        return self.to_int()
+
+    ## Gets the key used to compare and hash this postcode, calculating it the first time it is needed.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the postcodes compact (integer) key.
+    #  @remarks postcodes are immutable, so the key can never go stale once calculated.
+    def _get_postcode_key(self):
+        postcode_key = self._postcode_key
+        if postcode_key is None:
+            postcode_key = self._postcode_key = self._build_postcode_key()
+        return postcode_key
+
+    ## The validation faults observed when this postcode was parsed.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a read-only map of fault identifier => fault description.
+    #  @remarks the map is created the first time it is needed and then reused, so each description
+    #    is only formatted once (on demand) for this postcode; see ValidationFaultMap.
+    @property
+    def validation_faults(self):
+        validation_fault_map = self._validation_fault_map
+        if validation_fault_map is None:
+            validation_fault_map = self._validation_fault_map = ValidationFaultMap(self, self._validation_faults)
+        return validation_fault_map
+
+    ## The validation faults observed when this postcode was parsed, as an integer bitmask.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns an integer with a bit set for each fault; see ValidationFault.ToMask.
+    @property
+    def fault_mask(self):
+        return ValidationFault.ToMask(self._validation_faults)
+
+    ## Converts a validation fault bitmask back into the faults of this postcode type.
+    #  @param cls the type of class that is invoking this method.
+    #  @param fault_mask an integer bitmask, as given by fault_mask.
+    #  @returns a tuple of ValidationFault objects; use ValidationFaultMap to get their descriptions 
+    #    as they apply to a particular postcode.
+    #  @throws ValueError if the mask describes a fault that this type doesn't have.
+    @classmethod
+    def GetFaultsFromMask(cls, fault_mask):
+        return ValidationFault.FromMask(fault_mask, cls.ValidationFaultBase)
+
+    ## Indicates if this postcode passed validation when it was parsed.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns True if the postcode was validated, else False.
+    @property
+    def is_validated(self):
+        return self._is_validated
+
+    ## Records the outcome of validating this postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param validation_faults a sequence of the ValidationFault objects that were observed.
+    #  @param is_validated indicates if the postcode should be considered valid.
+    #  @remarks this is for the parser's use while the postcode is being created; a postcode 
+    #    should be treated as immutable once it has been returned to the caller.
+    def _set_validation_result(self, validation_faults, is_validated):
+        self._validation_faults = tuple(validation_faults) or Postcode.NoValidationFaults
+        self._validation_fault_map = None
+        self._is_validated = is_validated
+
+    ## Gets the components of this postcode.
+    #  Raises an error when an implementor forgets to implement this function.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a tuple of (area, district, subdistrict, sector, unit).
+    #  @remarks every postcode type uses the same tuple, so they can be stored side by side; see the 
+    #    derived classes for how their postcodes are described by it.
+    def get_components(self):
+        invoking_class = self.__class__.__name__
+        raise NotImplementedError(f"{invoking_class} does not implement get_components; cannot describe '{self}'.")
+
+    ## Gets the arguments used to format the descriptions of this postcodes validation faults.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a dict of public attribute name => value.
+    def get_format_arguments(self):
+        return { name: getattr(self, name) for name in self.__class__.PublicAttributes }
+
     ## The type of postcode that this represents.
     #  @param self the instance of the object that is invoking this method
     #  @retuns a string identifying this postcode type. 
@@ -44,6 +237,113 @@ class Postcode(object):
     def postcode_type(self):
         return self.__class__.PostcodeType
 
+    ## Builds the canonical string forms of this postcode.
+    #  Raises an error when an implementor forgets to implement this function.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a tuple of (outward code, inward code, full postcode) strings.
+    def _build_postcode_strings(self):
+        invoking_class = self.__class__.__name__
+        raise NotImplementedError(f"{invoking_class} does not implement _build_postcode_strings.")
+
+    ## Gets the canonical string forms of this postcode, building them the first time they are needed.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a tuple of (outward code, inward code, full postcode) strings.
+    #  @remarks postcodes are immutable, so the strings can never go stale once built.
+    def _get_postcode_strings(self):
+        postcode_strings = self._postcode_strings
+        if postcode_strings is None:
+            postcode_strings = self._postcode_strings = self._build_postcode_strings()
+        return postcode_strings
+
+    ## Interns the strings held by this postcode, so they are shared with every other postcode that uses them.
+    #  @param self the instance of the object that is invoking this method.
+    #  @remarks derived classes should extend this to intern any component strings they hold.
+    def _intern_strings(self):
+        self._postcode_strings = tuple( map(intern, self._get_postcode_strings()) )
+
+    ## Gets the postcodes outward code.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the postcodes outward code as a string.
+    @property
+    def outward_code(self):
+        return ( self._postcode_strings or self._get_postcode_strings() )[0]
+
+    ## Gets the postcodes inward code.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the postcodes inward code as a string.
+    @property
+    def inward_code(self):
+        return ( self._postcode_strings or self._get_postcode_strings() )[1]
+
+    ## Returns a simple string representation of the object.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a string representation of this object suitable for user consumption.
+    def __str__(self):
+        return ( self._postcode_strings or self._get_postcode_strings() )[2]
+
+    ## Gets a hash of this postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the hash of the postcodes compact key.
+    #  @remarks postcodes compare (and hash) by value; postcodes that print the same are equal, 
+    #    regardless of how they were parsed or validated. They order by area, district, subdistrict, 
+    #    sector and then unit; then BFPO numbers, then special cases (see to_int).
+    def __hash__(self):
+        return hash( self._get_postcode_key() )
+
+    ## Checks if this postcode is the same postcode as another.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param other the object this postcode is being compared to.
+    #  @returns True or False, or NotImplemented if other is not a postcode.
+    def __eq__(self, other):
+        if not isinstance(other, Postcode):
+            return NotImplemented
+        return self._get_postcode_key() == other._get_postcode_key()
+
+    ## Checks if this postcode is not the same postcode as another.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param other the object this postcode is being compared to.
+    #  @returns True or False, or NotImplemented if other is not a postcode.
+    def __ne__(self, other):
+        if not isinstance(other, Postcode):
+            return NotImplemented
+        return self._get_postcode_key() != other._get_postcode_key()
+
+    ## Checks if this postcode comes before another.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param other the object this postcode is being compared to.
+    #  @returns True or False, or NotImplemented if other is not a postcode.
+    def __lt__(self, other):
+        if not isinstance(other, Postcode):
+            return NotImplemented
+        return self._get_postcode_key() < other._get_postcode_key()
+
+    ## Checks if this postcode comes before, or is the same postcode as another.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param other the object this postcode is being compared to.
+    #  @returns True or False, or NotImplemented if other is not a postcode.
+    def __le__(self, other):
+        if not isinstance(other, Postcode):
+            return NotImplemented
+        return self._get_postcode_key() <= other._get_postcode_key()
+
+    ## Checks if this postcode comes after another.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param other the object this postcode is being compared to.
+    #  @returns True or False, or NotImplemented if other is not a postcode.
+    def __gt__(self, other):
+        if not isinstance(other, Postcode):
+            return NotImplemented
+        return self._get_postcode_key() > other._get_postcode_key()
+
+    ## Checks if this postcode comes after, or is the same postcode as another.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param other the object this postcode is being compared to.
+    #  @returns True or False, or NotImplemented if other is not a postcode.
+    def __ge__(self, other):
+        if not isinstance(other, Postcode):
+            return NotImplemented
+        return self._get_postcode_key() >= other._get_postcode_key()
+
     ## Returns a technical description of the object suitable for a developer.
     #  @param self the instance of the object that is invoking this method.
     #  @returns a string decsribing this object.
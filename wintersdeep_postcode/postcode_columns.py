@@ -0,0 +1,114 @@
+# python3 imports
+from array import array
+
+# project imports
+from wintersdeep_postcode.exceptions.validation_fault import ValidationFault
+from wintersdeep_postcode.parse_result import ParseResult
+from wintersdeep_postcode.postcode_record import PostcodeRecord
+
+## A batch of parsed postcodes, held as columns of machine values rather than a list of objects.
+#  @remarks each row takes 16 bytes; strings (areas, subdistricts, units and postcode types) are
+#    held once in a shared string table, and the columns hold their index in it.
+#  @remarks missing values (e.g. the components of input that could not be parsed, or the sector 
+#    of a "BFPO nnnn" postcode) are -1 in numeric columns, and 0 (None) in string code columns.
+#  @remarks use PostcodeParser.parse_columns to create these; see PostcodeRecord for what the 
+#    components of each postcode type are.
+class PostcodeColumns(object):
+
+    ## Creates a new (empty) set of postcode columns.
+    #  @param self the instance of the object that is invoking this method.
+    def __init__(self):
+
+        ## the shared string table; index 0 is None.
+        self.strings = [ None ]
+        self.string_codes = { None: 0 }
+
+        ## postcode type of each row (string code); 0 if the input could not be parsed.
+        self.type_codes = array('H')
+        ## outward area of each row (string code).
+        self.area_codes = array('H')
+        ## outward district of each row (or BFPO number).
+        self.districts = array('h')
+        ## outward subdistrict of each row (string code).
+        self.subdistrict_codes = array('H')
+        ## inward sector of each row.
+        self.sectors = array('b')
+        ## inward unit of each row (string code).
+        self.unit_codes = array('H')
+        ## 1 for each row that parsed (and validated, if the parser validates), else 0.
+        self.is_valid = bytearray()
+        ## the validation faults observed for each row; see ValidationFault.ToMask.
+        self.fault_masks = array('I')
+
+    ## Gets the code of a string in the shared string table, adding it if needed.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param value the string (or None) to get the code of.
+    #  @returns the strings index in the string table.
+    def get_string_code(self, value):
+        string_code = self.string_codes.get(value, None)
+        if string_code is None:
+            string_code = self.string_codes[value] = len(self.strings)
+            self.strings.append(value)
+        return string_code
+
+    ## Adds a parse result to the end of the columns.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param parse_result a ParseResult whose postcode is a tuple of PostcodeRecord fields, or None.
+    def append(self, parse_result):
+
+        status, fields, fault_ids = parse_result
+        get_string_code = self.get_string_code
+
+        if fields is None:
+            postcode_type = area = subdistrict = unit = None
+            district = sector = -1
+        else:
+            postcode_type, area, district, subdistrict, sector, unit, _, _ = fields
+
+        self.type_codes.append( get_string_code(postcode_type) )
+        self.area_codes.append( get_string_code(area) )
+        self.districts.append( -1 if district is None else district )
+        self.subdistrict_codes.append( get_string_code(subdistrict) )
+        self.sectors.append( -1 if sector is None else sector )
+        self.unit_codes.append( get_string_code(unit) )
+        self.is_valid.append( status == ParseResult.Success )
+        self.fault_masks.append( ValidationFault.ToMask(fault_ids) )
+
+    ## Gets the number of rows in the columns.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the number of rows.
+    def __len__(self):
+        return len(self.type_codes)
+
+    ## Gets a row of the columns as a record.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param index the index of the row to get.
+    #  @returns a PostcodeRecord, or None if the rows input could not be parsed.
+    #  @remarks is_validated is taken from is_valid, so is True for every parsed row of a parser that
+    #    doesn't validate (where a PostcodeRecord from that parser would say False).
+    def get_record(self, index):
+
+        from wintersdeep_postcode.postcode_types import postcode_type_map
+
+        postcode_type = self.strings[ self.type_codes[index] ]
+
+        if postcode_type is None:
+            return None
+
+        district, sector = self.districts[index], self.sectors[index]
+        fault_mask = self.fault_masks[index]
+        faults = postcode_type_map[postcode_type].GetFaultsFromMask(fault_mask) if fault_mask else ()
+
+        return PostcodeRecord( postcode_type, self.strings[ self.area_codes[index] ], 
+            None if district < 0 else district, self.strings[ self.subdistrict_codes[index] ],
+            None if sector < 0 else sector, self.strings[ self.unit_codes[index] ],
+            bool( self.is_valid[index] ), tuple( map(int, faults) ) )
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
@@ -1,6 +1,14 @@
 # python3 imports
 from re import compile
 
+# project imports
+from wintersdeep_postcode.parse_result import ParseResult
+from wintersdeep_postcode.parse_result_cache import ParseResultCache
+from wintersdeep_postcode.postcode_registry import PostcodeRegistry
+from wintersdeep_postcode.postcode_record import PostcodeRecord
+from wintersdeep_postcode.postcode_columns import PostcodeColumns
+from wintersdeep_postcode.exceptions import ParseError, ValidationError
+
 ## Class responsible for parsing a postcode object.
 #  @remarks will parse a string into a Postcode object.
 class PostcodeParser(object):
@@ -20,6 +28,25 @@ class PostcodeParser(object):
     #  @remarks use 'whitespace': 'lenient' to use this option - see PostcodeParser._get_whitepsace_pattern
     LenientWhitespace = r"(?:\s*)"
 
+    ## Maps each output option onto the factory used to create parse results.
+    #  @remarks factories are called with (postcode_type, area, district, subdistrict, sector, unit, 
+    #    is_validated, fault_ids); None means postcode objects are returned.
+    OutputFactories = {
+        'postcode': None,
+        'record':   PostcodeRecord,
+        'tuple':    lambda *fields: fields
+    }
+
+    ## Maps each normalized string format onto the function that builds it from an outward and inward code.
+    #  @remarks 'spaced' is the canonical form ("N1C 4DN"), 'unspaced' has no seperator ("N1C4DN")
+    #    and 'fixed' pads the outward code to four characters ("N1C 4DN", "N1  4DN", "SW1A1AA"), 
+    #    giving seven character keys for standard postcodes (as used by the ONS "PCD7" format).
+    NormalizeFormats = {
+        'spaced':   lambda outward_code, inward_code: f"{outward_code} {inward_code}" if inward_code else outward_code,
+        'unspaced': lambda outward_code, inward_code: outward_code + inward_code,
+        'fixed':    lambda outward_code, inward_code: outward_code.ljust(4) + inward_code
+    }
+
     ## Creates a new instance of the postcode parser object.
     #  @param self the instance of the object that is invoking this method.
     #  @param kwargs the keyword arguments that are being applied to this object.
@@ -51,7 +78,62 @@ class PostcodeParser(object):
 
             ## gives a list of fault identifers that will not raise an exception if they are observed.
             #  @remarks the fault will still be stored in the validation_faults property, but is_validated will be True
-            'ignored_faults': []
+            'ignored_faults': [],
+
+            ## determines if postcode types which provide a hand written scanner should use it.
+            #  @remarks defaults to True; scanners recognise exactly the same input as the types regex, 
+            #    but are faster. When False every postcode type is parsed using its regex.
+            'use_scanners': True,
+
+            ## the maximum number of parse results to cache, keyed on the raw input string.
+            #  @remarks defaults to None (no caching); when set, repeated input is served from a
+            #    least recently used cache rather than being parsed again.
+            #  @remarks cached results are shared between callers, so this cannot be combined with
+            #    result_factory (whose results may be mutable). The cache is safe to use from many threads.
+            'cache_size': None,
+
+            ## determines if postcodes should keep a reference to the regex match that created them.
+            #  @remarks defaults to False; a match holds on to the input string and the compiled 
+            #    pattern, which adds up when large numbers of postcodes are held in memory. Postcode 
+            #    types take everything they need from the match when they are created.
+            'retain_regex_match': False,
+
+            ## the maximum number of distinct postcodes to share (intern) between parse results.
+            #  @remarks defaults to None (no interning); when set, equal postcodes are returned as the
+            #    same shared instance (while it is in use), and their component strings are interned.
+            #  @remarks only postcode objects are shared, so this cannot be combined with output or 
+            #    result_factory.
+            'intern_size': None,
+
+            ## determines what the parser returns for each postcode it parses.
+            #  @remarks available options are 'postcode', 'record' and 'tuple'; see OutputFactories.
+            #  @remarks defaults to 'postcode' (postcode objects). 'record' returns a PostcodeRecord,
+            #    and 'tuple' a plain tuple of the same fields; neither creates a postcode object 
+            #    where the postcode type provides a component scanner.
+            'output': 'postcode',
+
+            ## a callable used to create whatever the parser should return for each postcode.
+            #  @remarks defaults to None (use output); when set it is called with (postcode_type, area, 
+            #    district, subdistrict, sector, unit, is_validated, fault_ids) - see PostcodeRecord - and 
+            #    what it returns is used in place of the postcode object. Cannot be combined with output.
+            'result_factory': None,
+
+            ## determines if validation should stop at the first fault that isn't ignored.
+            #  @remarks defaults to False (every fault is reported). When True ignored faults are not
+            #    checked for at all, and postcodes that fail validation only report the first fault found.
+            'fail_fast': False,
+
+            ## the maximum number of outward codes whose validation results each of the parser's
+            #  standard postcode validation plans remembers.
+            #  @remarks defaults to 4096; None remembers every outward code seen. Most postcodes share one
+            #    of a few thousand outward codes, so this avoids repeating most of the validation work.
+            'outward_cache_size': 4096,
+
+            ## determines if standard outward codes are validated using a table of precomputed results.
+            #  @remarks defaults to False (outward_cache_size is used instead). When True each entry is
+            #    calculated the first time it is seen; when 'preload' every entry is calculated when the 
+            #    parser is created (this takes a moment, and uses ~250KB). See StandardPostcodeOutwardTable.
+            'outward_fault_table': False
 
         }
 
@@ -87,6 +169,25 @@ class PostcodeParser(object):
 
         return whitespace_pattern
 
+    ## Checks the options passed to each postcode types CompileValidationPlan.
+    #  @param outward_cache_size the maximum number of outward codes to remember results for, or None.
+    #  @param outward_fault_table False, True or 'preload'; see the outward_fault_table keyword argument.
+    #  @returns a dict of the validation plan options, see Postcode.CompileValidationPlan.
+    #  @throws ValueError when either option isn't one of the supported values.
+    @staticmethod
+    def _get_validation_options(outward_cache_size, outward_fault_table):
+
+        if outward_cache_size is not None and not ( isinstance(outward_cache_size, int) and outward_cache_size > 0 ):
+            raise ValueError(f"outward_cache_size is expected to be None or a positive integer; actually got '{outward_cache_size}'")
+
+        if not outward_fault_table in ( False, True, 'preload' ):
+            raise ValueError(f"outward_fault_table is expected to be one of - False, True, preload; actually got '{outward_fault_table}'")
+
+        return {
+            'outward_cache_size': outward_cache_size,
+            'outward_fault_table': outward_fault_table
+        }
+
     ## Returns a list of regular expressions and assocaited postcode factories.
     #  @param whitespace_regex the regular expression pattern to use for delimiting whitespace.
     #  @param type_list a list of postcode types to support as strings (if None, all types will be loaded).
@@ -121,25 +222,128 @@ class PostcodeParser(object):
         return parser_regex
 
 
+    ## Combines the regular expressions from a parser list into a single dispatch regex.
+    #  @param parser_list a list of (regex, postcode factory) tuples, in priority order.
+    #  @returns a tuple of the combined regex, and a list that maps the index of the last 
+    #    group to match back onto the postcode factory that owns it; or (None, None) if the
+    #    regular expressions cannot be safely combined.
+    #  @remarks the alternatives are tried in the order given, so priority is preserved.
+    #  @remarks patterns can only be combined if they each define at least one capture group
+    #    (so we can tell which matched), and no two of them define the same group name.
+    @staticmethod
+    def _build_dispatch_regex(parser_list):
+
+        seen_group_names = set()
+        dispatch_factories = [ None ]   # group zero is the entire match, so has no owner.
+
+        for parse_regex, postcode_factory in parser_list:
+
+            group_names = set( parse_regex.groupindex.keys() )
+
+            if parse_regex.groups == 0 or group_names & seen_group_names:
+                return None, None
+
+            seen_group_names |= group_names
+            dispatch_factories.extend( [ postcode_factory ] * parse_regex.groups )
+
+        combined_pattern = "|".join([ f"(?:{r.pattern})" for r, _ in parser_list ])
+        return compile(combined_pattern), dispatch_factories
+
+    ## Builds the ordered list of functions the parser uses to recognise input.
+    #  @param parser_list a list of (regex, postcode factory) tuples, in priority order.
+    #  @param whitespace the whitespace handling strategy; 'strict', 'tolerant' or 'lenient'.
+    #  @param use_scanners when True, postcode types that provide a scanner will use it.
+    #  @param retain_regex_match when False, postcodes created from a regex won't keep a 
+    #    reference to the match (and so the input string and pattern) once they are created.
+    #  @param component_output when True, stages return a tuple of (postcode type, components) 
+    #    rather than a postcode, and scanners don't create a postcode object at all.
+    #  @returns a list of functions which accept the input string, and return a postcode or None.
+    #  @remarks consecutive regex parsers are combined into a single dispatch regex, so the
+    #    priority order of the parser list is preserved.
+    @staticmethod
+    def _build_dispatch_stages(parser_list, whitespace, use_scanners=True, retain_regex_match=False,
+            component_output=False):
+
+        dispatch_stages = []
+        pending_regexes = []
+
+        def regex_stage(dispatch_regex, dispatch_factories):
+
+            if component_output:
+                def parse_stage(input_string):
+                    regex_match = dispatch_regex.match(input_string)
+                    if regex_match:
+                        postcode_obj = dispatch_factories[regex_match.lastindex](regex_match)
+                        return postcode_obj.__class__, postcode_obj.get_components()
+                return parse_stage
+
+            if retain_regex_match:
+                def parse_stage(input_string):
+                    regex_match = dispatch_regex.match(input_string)
+                    if regex_match:
+                        return dispatch_factories[regex_match.lastindex](regex_match)
+                return parse_stage
+
+            def parse_stage(input_string):
+                regex_match = dispatch_regex.match(input_string)
+                if regex_match:
+                    postcode_obj = dispatch_factories[regex_match.lastindex](regex_match)
+                    postcode_obj._original_regex_match = None
+                    return postcode_obj
+            return parse_stage
+
+        def flush_pending_regexes():
+            if pending_regexes:
+                dispatch_regex, dispatch_factories = PostcodeParser._build_dispatch_regex(pending_regexes)
+                if dispatch_regex:
+                    dispatch_stages.append( regex_stage(dispatch_regex, dispatch_factories) )
+                else:
+                    # these could not be combined - try each parser in turn.
+                    for parse_regex, postcode_factory in pending_regexes:
+                        factories = [ postcode_factory ] * (parse_regex.groups + 1)
+                        dispatch_stages.append( regex_stage(parse_regex, factories) )
+                pending_regexes.clear()
+
+        def component_scanner_stage(scanner, postcode_type):
+            def parse_stage(input_string):
+                components = scanner(input_string)
+                if components:
+                    return postcode_type, components
+            return parse_stage
+
+        for parse_regex, postcode_factory in parser_list:
+
+            if component_output:
+                scanner = postcode_factory.GetComponentScanner(whitespace) if use_scanners else None
+                scanner = component_scanner_stage(scanner, postcode_factory) if scanner else None
+            else:
+                scanner = postcode_factory.GetParseScanner(whitespace) if use_scanners else None
+
+            if scanner:
+                flush_pending_regexes()
+                dispatch_stages.append(scanner)
+            else:
+                pending_regexes.append( (parse_regex, postcode_factory) )
+
+        flush_pending_regexes()
+        return dispatch_stages
+
     ## creates a pipeline to translate parser input.
     #  @param trim_input when true input will be trimmed of leading/tailing whitespace
     #  @param uppercase_input when true input will be converted to uppercase.
     #  @returns a function that can be used to translate input into a parsable form.
+    #  @remarks each combination is a single function (rather than a chain of them) as this
+    #    is called for every input the parser sees.
     @staticmethod
     def _build_input_translater(trim=True, uppercase=True):
-        
-        translation_pipeline = [ str ]
 
-        if trim:        translation_pipeline.append( str.strip )
-        if uppercase:   translation_pipeline.append( str.upper )
-
-        if len(translation_pipeline) == 1:
-            return translation_pipeline[0]
-        else:
-            def compose(lhs, rhs):
-                return lambda input_: rhs( lhs(input_) )
-            from functools import reduce
-            return reduce( compose, translation_pipeline)
+        if trim and uppercase:
+            return lambda input_: str(input_).strip().upper()
+        if trim:
+            return lambda input_: str(input_).strip()
+        if uppercase:
+            return lambda input_: str(input_).upper()
+        return str
 
     ## Configures the object using keyword arguments
     #  @param self the instance of the object that is invoking this method.
@@ -151,6 +355,7 @@ class PostcodeParser(object):
         whitespace_stratergy = kwargs.pop('whitespace', 'tolerant')
         whitespace_translate = PostcodeParser._get_whitespace_pattern
         self.whitespace_regex = whitespace_translate(whitespace_stratergy)
+        self.whitespace = whitespace_stratergy
 
         # load other options
         self.validate_postcodes = kwargs.pop('validate', True)
@@ -168,48 +373,425 @@ class PostcodeParser(object):
         self.parser_list = parser_loader_fn(self.whitespace_regex, postcode_types)
         self.postcode_types = [ t[1].PostcodeType for t in self.parser_list ]
 
-    ## Parses an input string into a postcode.
+        # compile the checks each postcode type needs to make.
+        self.fail_fast = bool( kwargs.pop('fail_fast', False) )
+        self.validation_options = PostcodeParser._get_validation_options(
+            outward_cache_size = kwargs.pop('outward_cache_size', 4096),
+            outward_fault_table = kwargs.pop('outward_fault_table', False)
+        )
+        self.validation_plans = { postcode_type: postcode_type.CompileValidationPlan(
+                self.ignored_faults if self.fail_fast else (), self.fail_fast, **self.validation_options ) 
+            for _, postcode_type in self.parser_list }
+        self.check_plans = None
+
+        # and work out the quickest way to recognise input, while respecting priority.
+        use_scanners = bool( kwargs.pop('use_scanners', True) )
+        retain_regex_match = bool( kwargs.pop('retain_regex_match', False) )
+        dispatch_builder_fn = PostcodeParser._build_dispatch_stages
+        self.dispatch_stages = dispatch_builder_fn(self.parser_list, self.whitespace, 
+            use_scanners, retain_regex_match)
+
+        # work out what the parser should return.
+        output = kwargs.pop('output', 'postcode')
+        if not output in PostcodeParser.OutputFactories:
+            supported_outputs = ", ".join( PostcodeParser.OutputFactories.keys() )
+            raise ValueError(f"output is expected to be one of - {supported_outputs}; actually got '{output}'")
+        self.output = output
+        self.output_factory = PostcodeParser.OutputFactories[output]
+
+        result_factory = kwargs.pop('result_factory', None)
+        if result_factory is not None:
+            if not callable(result_factory):
+                raise TypeError(f"result_factory is expected to be callable; actually got '{type(result_factory).__name__}'")
+            if output != 'postcode':
+                raise ValueError(f"result_factory cannot be used with output '{output}'.")
+            self.output_factory = result_factory
+
+        # share postcodes between results if asked to.
+        intern_size = kwargs.pop('intern_size', None)
+        if intern_size and self.output_factory is not None:
+            raise ValueError(f"intern_size cannot be used with output '{output}' or a result_factory, only postcode objects are shared.")
+        self.postcode_registry = PostcodeRegistry(intern_size) if intern_size else None
+
+        # finally, compile all of that into the function that does the actual parsing.
+        self.use_scanners = use_scanners
+        self.component_stages = None
+        self._validity_function = None
+        self._normalize_functions = {}
+        self._tuple_parse_function = None
+        self._postcode_parse_function = self._build_parse_function()
+        self._parse_function = self._postcode_parse_function
+
+        if self.output_factory is not None:
+            self._parse_function = self._build_output_parse_function()
+
+        # and if asked to, remember the results of that function.
+        cache_size = kwargs.pop('cache_size', None)
+        if cache_size and result_factory is not None:
+            raise ValueError("cache_size cannot be used with a result_factory, as cached results are shared between callers.")
+        self.result_cache = ParseResultCache(self._parse_function, cache_size) if cache_size else None
+        if self.result_cache is not None:
+            self._parse_function = self.result_cache
+
+    ## Builds the function the parser uses to turn an input string into a ParseResult.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a function accepting an input string and returning a ParseResult.
+    #  @remarks the parsers configuration is bound into the function once, so that parsing 
+    #    (and in particular bulk parsing) doesn't repeat any attribute lookups or setup per input.
+    #    as such changes to the parser's configuration after it is created will have no effect.
+    def _build_parse_function(self):
+
+        translate_input = self.translate_input
+        dispatch_stages = tuple(self.dispatch_stages)
+        validate_postcodes = self.validate_postcodes
+        ignored_faults = frozenset(self.ignored_faults)
+        validation_plans = self.validation_plans
+        postcode_registry = self.postcode_registry
+        get_shared_postcode = postcode_registry.get if postcode_registry is not None else None
+        register_postcode = postcode_registry.register if postcode_registry is not None else None
+
+        success = ParseResult.Success
+        validation_failed = ParseResult.ValidationFailed
+        parse_failed_result = ParseResult(ParseResult.ParseFailed, None, ())
+        new_result = ParseResult._make
+
+        def parse_function(input_string):
+
+            transformed_string = translate_input(input_string)
+
+            # attempt to find a parser that understands the input.
+            for parse_stage in dispatch_stages:
+                postcode_obj = parse_stage(transformed_string)
+                if postcode_obj is not None:
+                    break
+            else:
+                return parse_failed_result
+
+            # reuse the shared instance of this postcode, if there is one (its already validated).
+            if get_shared_postcode is not None:
+                shared_postcode = get_shared_postcode( postcode_obj._get_postcode_key() )
+                if shared_postcode is not None:
+                    if not validate_postcodes:
+                        return new_result( (success, shared_postcode, ()) )
+                    fault_ids = tuple( map(int, shared_postcode._validation_faults) )
+                    status = success if shared_postcode._is_validated else validation_failed
+                    return new_result( (status, shared_postcode, fault_ids) )
+
+            if not validate_postcodes:
+                if register_postcode is not None:
+                    register_postcode(postcode_obj)
+                return new_result( (success, postcode_obj, ()) )
+
+            # validate the postcode.
+            # (fault descriptions are only formatted if someone asks for them).
+            validation_faults = validation_plans[postcode_obj.__class__]( *postcode_obj.get_components() )
+            fault_ids = tuple( map(int, validation_faults) ) if validation_faults else ()
+
+            # check ignored faults to give a final chance to validate - if all the errors in 
+            # the validation result are marked to be ignored, mark it as passed even though its not.
+            is_validated = ignored_faults.issuperset(fault_ids)
+            postcode_obj._set_validation_result(validation_faults, is_validated)
+
+            if register_postcode is not None:
+                register_postcode(postcode_obj)
+
+            return new_result( (success if is_validated else validation_failed, postcode_obj, fault_ids) )
+
+        return parse_function
+
+    ## Gets the stages used to recognise input without creating postcode objects, building them if needed.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a list of functions which accept the input string, and return a tuple of 
+    #    (postcode type, components) or None; see _build_dispatch_stages.
+    def _get_component_stages(self):
+        if self.component_stages is None:
+            self.component_stages = PostcodeParser._build_dispatch_stages(self.parser_list, 
+                self.whitespace, self.use_scanners, False, True)
+        return self.component_stages
+
+    ## Builds a function that recognises input, without validating it or creating a result.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a function accepting an input string and returning a tuple of (postcode type, 
+    #    components) or None if the input isn't recognised; see _build_dispatch_stages.
+    #  @remarks for bulk processors that validate the components themselves.
+    def _build_scan_function(self):
+
+        translate_input = self.translate_input
+        dispatch_stages = tuple(self._get_component_stages())
+
+        def scan_function(input_string):
+            transformed_string = translate_input(input_string)
+            for parse_stage in dispatch_stages:
+                parsed = parse_stage(transformed_string)
+                if parsed is not None:
+                    return parsed
+            return None
+
+        return scan_function
+
+    ## Gets the checks used when only a pass or fail answer is needed, compiling them if needed.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a dict of postcode type => validation plan; ignored faults are not checked for, 
+    #    and validation stops at the first fault. See Postcode.CompileValidationPlan.
+    def _get_check_plans(self):
+        if self.check_plans is None:
+            self.check_plans = { postcode_type: postcode_type.CompileValidationPlan(self.ignored_faults, True,
+                    **self.validation_options) for _, postcode_type in self.parser_list }
+        return self.check_plans
+
+    ## Builds the function the parser uses to check if an input string is a valid postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a function accepting an input string and returning True if parse would succeed.
+    #  @remarks postcodes are validated from their components, and no result is created; ignored
+    #    faults aren't checked for, and validation stops at the first fault (see _get_check_plans).
+    def _build_validity_function(self):
+
+        translate_input = self.translate_input
+        dispatch_stages = tuple(self._get_component_stages())
+        validate_postcodes = self.validate_postcodes
+        check_plans = self._get_check_plans()
+
+        def validity_function(input_string):
+
+            transformed_string = translate_input(input_string)
+
+            for parse_stage in dispatch_stages:
+                parsed = parse_stage(transformed_string)
+                if parsed is not None:
+                    break
+            else:
+                return False
+
+            if not validate_postcodes:
+                return True
+
+            postcode_type, components = parsed
+            return not check_plans[postcode_type](*components)
+
+        return validity_function
+
+    ## Builds the function the parser uses to turn an input string into a normalized postcode string.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param output_format the format of the string to create; see NormalizeFormats.
+    #  @returns a function accepting an input string and returning the normalized string, or None 
+    #    if parse would raise an exception.
+    #  @throws ValueError when output_format isn't a recognised format.
+    #  @remarks postcodes are validated from their components, and no result is created.
+    def _build_normalize_function(self, output_format):
+
+        format_code = PostcodeParser.NormalizeFormats.get(output_format, None)
+
+        if format_code is None:
+            supported_formats = ", ".join( PostcodeParser.NormalizeFormats.keys() )
+            raise ValueError(f"output_format is expected to be one of - {supported_formats}; actually got '{output_format}'")
+
+        translate_input = self.translate_input
+        dispatch_stages = tuple(self._get_component_stages())
+        validate_postcodes = self.validate_postcodes
+        check_plans = self._get_check_plans()
+
+        def normalize_function(input_string):
+
+            transformed_string = translate_input(input_string)
+
+            for parse_stage in dispatch_stages:
+                parsed = parse_stage(transformed_string)
+                if parsed is not None:
+                    break
+            else:
+                return None
+
+            postcode_type, components = parsed
+
+            if validate_postcodes and check_plans[postcode_type](*components):
+                return None
+
+            return format_code( *postcode_type.FormatComponents(*components) )
+
+        return normalize_function
+
+    ## Gets the function used to normalize input to the given format, building it if needed.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param output_format the format of the string to create; see NormalizeFormats.
+    #  @returns a function accepting an input string and returning the normalized string, or None.
+    def _get_normalize_function(self, output_format):
+        normalize_function = self._normalize_functions.get(output_format, None)
+        if normalize_function is None:
+            normalize_function = self._build_normalize_function(output_format)
+            self._normalize_functions[output_format] = normalize_function
+        return normalize_function
+
+    ## Builds the function the parser uses to turn an input string into a ParseResult, when the
+    #  parser returns something other than postcode objects.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param output_factory the factory used to create the results postcode; see OutputFactories.
+    #    when None the parsers output_factory is used.
+    #  @returns a function accepting an input string and returning a ParseResult; its postcode
+    #    being whatever the output factory creates.
+    #  @remarks postcodes are validated from their components, so where a type provides a component
+    #    scanner no postcode object is ever created.
+    def _build_output_parse_function(self, output_factory=None):
+
+        translate_input = self.translate_input
+        dispatch_stages = tuple(self._get_component_stages())
+        validate_postcodes = self.validate_postcodes
+        ignored_faults = frozenset(self.ignored_faults)
+        validation_plans = self.validation_plans
+        output_factory = output_factory or self.output_factory
+
+        success = ParseResult.Success
+        validation_failed = ParseResult.ValidationFailed
+        parse_failed_result = ParseResult(ParseResult.ParseFailed, None, ())
+        new_result = ParseResult._make
+
+        def parse_function(input_string):
+
+            transformed_string = translate_input(input_string)
+
+            # attempt to find a parser that understands the input.
+            for parse_stage in dispatch_stages:
+                parsed = parse_stage(transformed_string)
+                if parsed is not None:
+                    break
+            else:
+                return parse_failed_result
+
+            postcode_type, components = parsed
+
+            if not validate_postcodes:
+                output = output_factory(postcode_type.PostcodeType, *components, False, ())
+                return new_result( (success, output, ()) )
+
+            validation_faults = validation_plans[postcode_type](*components)
+            fault_ids = tuple( map(int, validation_faults) ) if validation_faults else ()
+            is_validated = ignored_faults.issuperset(fault_ids)
+
+            output = output_factory(postcode_type.PostcodeType, *components, is_validated, fault_ids)
+            return new_result( (success if is_validated else validation_failed, output, fault_ids) )
+
+        return parse_function
+
+    ## Parses an input string into a postcode, without raising an exception if it cannot.
     #  @param self the instance of the object that is invoking this method
     #  @param input_string the input string to be parsed into a postcode.
-    #  @returns a Postcode object that was parsed from the input string.
-    def parse(self, input_string):
+    #  @returns a ParseResult describing the outcome; see wintersdeep_postcode.parse_result.
+    #  @remarks this is considerably cheaper than parse when a lot of input is expected to fail.
+    def try_parse(self, input_string):
+        return self._parse_function(input_string)
 
-        transformed_string = self.translate_input(input_string)
+    ## Gets statistics describing the parsers result cache.
+    #  @param self the instance of the object that is invoking this method
+    #  @returns a ParseResultCache.Info tuple of (hits, misses, evictions, max_size, size), or 
+    #    None if this parser was not created with a cache_size.
+    def cache_info(self):
+        return self.result_cache.info() if self.result_cache is not None else None
+
+    ## Removes all results from the parsers result cache, and resets its statistics.
+    #  @param self the instance of the object that is invoking this method
+    #  @remarks does nothing if this parser was not created with a cache_size.
+    def cache_clear(self):
+        if self.result_cache is not None:
+            self.result_cache.clear()
+
+    ## Checks if an input string is a valid postcode.
+    #  @param self the instance of the object that is invoking this method
+    #  @param input_string the input string to be checked.
+    #  @returns True if parse would return a postcode (respecting validate and ignored_faults), 
+    #    False if it would raise an exception.
+    #  @remarks this doesn't create a postcode (where the postcode type provides a component
+    #    scanner), result or exception; so is the cheapest way to get a yes or no answer.
+    def is_valid(self, input_string):
+        if self._validity_function is None:
+            self._validity_function = self._build_validity_function()
+        return self._validity_function(input_string)
+
+    ## Checks if each of the input strings is a valid postcode.
+    #  @param self the instance of the object that is invoking this method
+    #  @param input_strings an iterable of input strings to be checked.
+    #  @returns a bytearray containing 1 for each valid input string and 0 for each invalid one, in order.
+    def is_valid_many(self, input_strings):
+        if self._validity_function is None:
+            self._validity_function = self._build_validity_function()
+        return bytearray( map(self._validity_function, input_strings) )
+
+    ## Converts an input string into its normalized postcode string.
+    #  @param self the instance of the object that is invoking this method
+    #  @param input_string the input string to be normalized.
+    #  @param output_format the format of the string to create; 'spaced', 'unspaced' or 'fixed' 
+    #    (see NormalizeFormats).
+    #  @returns the normalized postcode string (e.g. " n1c4dn " => "N1C 4DN"), or None if parse
+    #    would raise an exception.
+    #  @throws ValueError when output_format isn't a recognised format.
+    #  @remarks this doesn't create a postcode (where the postcode type provides a component
+    #    scanner), result or exception; so is the cheapest way to create postcode join keys.
+    def normalize(self, input_string, output_format='spaced'):
+        return self._get_normalize_function(output_format)(input_string)
+
+    ## Converts each of the input strings into its normalized postcode string.
+    #  @param self the instance of the object that is invoking this method
+    #  @param input_strings an iterable of input strings to be normalized.
+    #  @param output_format the format of the strings to create; see normalize.
+    #  @returns a list containing the normalized string (or None) for each input string, in order.
+    #  @throws ValueError when output_format isn't a recognised format.
+    def normalize_many(self, input_strings, output_format='spaced'):
+        return list( map(self._get_normalize_function(output_format), input_strings) )
+
+    ## Parses each of the input strings into a set of columns.
+    #  @param self the instance of the object that is invoking this method
+    #  @param input_strings an iterable of input strings to be parsed into postcodes.
+    #  @returns a PostcodeColumns object, with a row for each input string in order.
+    #  @remarks no postcode objects are created (where the postcode type provides a component 
+    #    scanner), and each row takes 16 bytes; see PostcodeColumns.
+    def parse_columns(self, input_strings):
 
-        # attempt to find a parser that understands the input.
-        for parse_regex, postcode_factory in self.parser_list:
+        if self._tuple_parse_function is None:
+            tuple_factory = PostcodeParser.OutputFactories['tuple']
+            self._tuple_parse_function = self._build_output_parse_function(tuple_factory)
 
-            regex_match = parse_regex.match(transformed_string)
+        postcode_columns = PostcodeColumns()
+        append_row = postcode_columns.append
 
-            if regex_match:
+        for parse_result in map(self._tuple_parse_function, input_strings):
+            append_row(parse_result)
 
-                postcode_obj = postcode_factory(regex_match)
+        return postcode_columns
 
-                if self.validate_postcodes:
+    ## Lazily parses each of the input strings, without raising exceptions.
+    #  @param self the instance of the object that is invoking this method
+    #  @param input_strings an iterable of input strings to be parsed into postcodes.
+    #  @returns an iterator yielding a ParseResult for each input string, in order.
+    #  @remarks use this rather than calling try_parse in a loop, it avoids the per call overhead.
+    def parse_iter(self, input_strings):
+        return map(self._parse_function, input_strings)
 
-                    # validate the postcode.
-                    validation_faults = postcode_factory.Validate(postcode_obj)
-                    faults_format_args = vars(postcode_obj)
-                    faults_dict = { int(f): str(f).format(**faults_format_args) for f in validation_faults }
-                    postcode_obj.is_validated = not bool(validation_faults)
-                    postcode_obj.validation_faults = faults_dict
+    ## Parses each of the input strings, without raising exceptions.
+    #  @param self the instance of the object that is invoking this method
+    #  @param input_strings an iterable of input strings to be parsed into postcodes.
+    #  @returns a list containing a ParseResult for each input string, in order.
+    def parse_many(self, input_strings):
+        return list( map(self._parse_function, input_strings) )
 
-                    # check ignored faults to give a final chance to validate, and
-                    # determine if we should throw an error
-                    if validation_faults:
-                        for fault in validation_faults:
-                            if not int(fault) in self.ignored_faults:
-                                from wintersdeep_postcode.exceptions import ValidationError
-                                raise ValidationError(postcode_obj, faults_dict)
+    ## Parses an input string into a postcode.
+    #  @param self the instance of the object that is invoking this method
+    #  @param input_string the input string to be parsed into a postcode.
+    #  @returns a Postcode object that was parsed from the input string.
+    #  @throws ParseError if the input does not match any supported postcode type.
+    #  @throws ValidationError if the postcode fails validation.
+    def parse(self, input_string):
 
-                        # if we got here - then all errors in the validation result are
-                        # marked to be ignored... so... mark is as passed even though its not.
-                        postcode_obj.is_validated = True
+        parse_result = self.try_parse(input_string)
 
-                return postcode_obj
+        if parse_result.status == ParseResult.Success:
+            return parse_result.postcode
+
+        if parse_result.status == ParseResult.ValidationFailed:
+            # the error describes its faults using a postcode object, whatever the parser returns.
+            postcode_obj = parse_result.postcode if self.output_factory is None else \
+                self._postcode_parse_function(input_string).postcode
+            raise ValidationError(postcode_obj, postcode_obj.validation_faults)
 
         # we are unable to parse the given input - raise a parse error
-        from wintersdeep_postcode.exceptions import ParseError
+        transformed_string = self.translate_input(input_string)
         raise ParseError(transformed_string, self)
 
     ## allows directly invoking the class to parse input
@@ -0,0 +1,33 @@
+# python3 imports
+from collections import namedtuple
+
+# project imports
+from wintersdeep_postcode.exceptions.validation_fault import ValidationFault
+
+## A parsed postcode as a plain record, rather than a postcode object.
+#  @remarks this is what a PostcodeParser created with output='record' returns in place of postcode
+#    objects; its cheaper to create, and holds just the components and the validation outcome.
+#  @remarks postcode_type is the postcode types identifier (e.g. 'standard'), and area, district, 
+#    subdistrict, sector and unit are as described by that types get_components method.
+#  @remarks is_validated and fault_ids are as described by Postcode.is_validated and ParseResult.fault_ids.
+class PostcodeRecord(namedtuple("PostcodeRecord", [ "postcode_type", "area", "district", 
+        "subdistrict", "sector", "unit", "is_validated", "fault_ids" ])):
+
+    ## prevents instances creating a __dict__, keeping records as small as the tuple.
+    __slots__ = ()
+
+    ## Gets the validation faults observed, as an integer bitmask.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns an integer with a bit set for each fault id; see ValidationFault.ToMask.
+    @property
+    def fault_mask(self):
+        return ValidationFault.ToMask(self.fault_ids)
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
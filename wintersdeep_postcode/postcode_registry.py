@@ -0,0 +1,65 @@
+# python3 imports
+from weakref import WeakValueDictionary
+
+## A bounded registry of shared (interned) postcode objects.
+#  @remarks postcodes are held by weak reference, keyed on their compact key (see Postcode.to_int),
+#    so a postcode is only shared for as long as something else is holding on to it.
+#  @remarks postcode objects are immutable, so one instance can be safely shared by every caller 
+#    that parses the same postcode; and identity becomes a valid (and fast) test for equality.
+class PostcodeRegistry(object):
+
+    ## Creates a new instance of the postcode registry.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param max_size the maximum number of postcodes that should be held in the registry.
+    #  @throws ValueError if max_size is not a positive integer.
+    def __init__(self, max_size):
+
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(f"max_size is expected to be a positive integer; actually got '{max_size}'")
+
+        self.max_size = max_size
+        self.postcodes = WeakValueDictionary()
+
+    ## Gets the shared instance of a postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param postcode_key the compact key of the postcode to look for.
+    #  @returns the shared postcode object, or None if there isn't one.
+    def get(self, postcode_key):
+        return self.postcodes.get(postcode_key, None)
+
+    ## Makes a postcode the shared instance of itself.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param postcode the postcode to register, its strings are interned as it is registered.
+    #  @returns the postcode object.
+    #  @remarks if the registry is full the oldest entry is forgotten; the postcode itself is 
+    #    unaffected, but later postcodes equal to it won't share its instance.
+    def register(self, postcode):
+
+        postcodes = self.postcodes
+        postcode._intern_strings()
+        postcodes[ postcode._get_postcode_key() ] = postcode
+
+        if len(postcodes) > self.max_size:
+            postcodes.pop( next( iter(postcodes) ), None )
+
+        return postcode
+
+    ## Gets the number of postcodes currently held in the registry.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the number of registered postcodes that are still alive.
+    def __len__(self):
+        return len(self.postcodes)
+
+    ## Removes all postcodes from the registry.
+    #  @param self the instance of the object that is invoking this method.
+    def clear(self):
+        self.postcodes.clear()
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
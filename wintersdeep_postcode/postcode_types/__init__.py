@@ -17,4 +17,17 @@ postcode_type_keys = [ cls_.PostcodeType for cls_ in postcode_type_objects ]
 
 ## a map for translating a postcode type identifier to an implementation object.
 #  @remarks auto generated from the object list - for reference only.
-postcode_type_map = { cls_.PostcodeType: cls_ for cls_ in postcode_type_objects }
\ No newline at end of file
+postcode_type_map = { cls_.PostcodeType: cls_ for cls_ in postcode_type_objects }
+
+## Creates a postcode from an integer created by one of the postcode types to_int methods.
+#  @param value the integer to decode.
+#  @returns a postcode object of the type that the integer encodes.
+#  @throws ValueError if the value does not encode a postcode.
+#  @remarks types are tried in order of priority, so "BFn nXX" integers decode as ForcesPostcode.
+def postcode_from_int(value):
+    for postcode_type in postcode_type_objects:
+        try:
+            return postcode_type.from_int(value)
+        except ValueError:
+            pass
+    raise ValueError(f"{value} is not an integer encoded postcode.")
@@ -1,6 +1,7 @@
 # python3 imports
 from re import compile as compile_regex
 from gettext import gettext as _
+from sys import intern
 
 # project imports
 from wintersdeep_postcode.postcode import Postcode
@@ -13,6 +14,13 @@ class ForcesPostcode(Postcode):
     ## The type of postcode this class represents.
     PostcodeType = 'forces'
 
+    ## The attributes held by forces postcode objects, in addition to those of Postcode.
+    __slots__ = ( '_is_bfpo_format', '_bfpo', '_outward_area', '_outward_district', '_inward_sector', '_inward_unit' )
+
+    ## The names of the public attributes that describe postcodes of this type.
+    PublicAttributes = Postcode.PublicAttributes + ( 'is_bfpo_format', 'bfpo', 'outward_area', 
+        'outward_district', 'inward_sector', 'inward_unit' )
+
     ## Regular expression pattern expressing the BFPO outward code string. 
     BfpoRegex = r"(?:BFPO)"
 
@@ -22,13 +30,15 @@ class ForcesPostcode(Postcode):
     ## UK postcode compatible BFPO address - technically the district can only be 1 or 2, but we'll accept
     #  double digits, as all BF is allocated to BFPO and it might be used in the future. We'll handle 
     #  actual validation in Validate() - we'll ignore subdistrcts for now however.
-    DistrictRegex = r"(?:BF)(?P<district>[0-9]{1,2})"
+    #  @remarks group names are prefixed so they don't clash with StandardPostcode's when the parser
+    #    combines the regular expressions of every postcode type into a single pattern.
+    DistrictRegex = r"(?:BF)(?P<bf_district>[0-9]{1,2})"
 
     ## Regular expression pattern expressing the format of the "sector" portion of a postcode.
-    SectorRegex = r"(?P<sector>[0-9])"
+    SectorRegex = r"(?P<bf_sector>[0-9])"
 
     ## Regular expression pattern expressing the format of the "subsector" portion of a postcode.
-    UnitRegex = r"(?P<unit>[A-Z]{2})"
+    UnitRegex = r"(?P<bf_unit>[A-Z]{2})"
 
     ## The base number from which validation faults in this class start
     #  @remarks each class has 100 numbers allocated to it; ForcesPostcode - 400 -> 499
@@ -36,7 +46,7 @@ class ForcesPostcode(Postcode):
     
     ## Validation fault raised when the district is not valid for a forces postcode.
     InvalidDistrict = ValidationFault( ValidationFaultBase + 1, 
-        _("{district} is not a valid district for BF postcodes."))
+        _("{outward_district} is not a valid district for BF postcodes."))
 
     ## Get a regular expression that can be used to parse postcodes of this type.
     #  @param whitespace_regex the regular expression used to parse any delimiting whitespace.
@@ -59,21 +69,53 @@ class ForcesPostcode(Postcode):
 
         return Postcode.CompileRegex(fr"^({bfpo_regex}|{bf_regex})$")
 
+    ## The first integer used to encode "BFPO nnnn" postcodes; see to_int.
+    #  @remarks placed immediately after the standard postcode integers, BFPO numbers are 0 to 9999.
+    BfpoIntegerBase = 1708387200
+
+    ## The number of integers used to encode "BFPO nnnn" postcodes.
+    BfpoIntegerCount = 10000
+
     ## Determine if the given postcode appears to be valid.
     #  @param cls the class that is invoking this method.
     #  @param postcode the postcode to be checked.
     #  @returns a list of validation fault objects describing any problems with the postcode.
     @classmethod
     def Validate(cls, postcode):
+        return ForcesPostcode.ValidateComponents( *postcode.get_components() )
+
+    ## Determine if the components of a postcode appear to be valid.
+    #  @param cls the class that is invoking this method.
+    #  @param area "BF" or "BFPO"; see get_components.
+    #  @param district the postcodes outward district, or its BFPO number.
+    #  @param subdistrict unused (forces postcodes have no subdistrict).
+    #  @param sector the postcodes inward sector as an integer, or None.
+    #  @param unit the postcodes inward unit, or None.
+    #  @returns a list of validation fault objects describing any problems with the postcode.
+    @classmethod
+    def ValidateComponents(cls, area, district, subdistrict, sector, unit):
 
         faults = []
 
-        if not postcode.is_bfpo_format:
-            if postcode.outward_district > 2:
+        if area == "BF":
+            if district > 2:
                 faults.append(ForcesPostcode.InvalidDistrict)
 
         return faults
 
+    ## Compiles the function a parser uses to validate the components of forces postcodes.
+    #  @param cls the class that is invoking this method.
+    #  @param skipped_faults a collection of fault identifiers that should not be checked for.
+    #  @param fail_fast unused, forces postcodes only have one check.
+    #  @param plan_options unused, see Postcode.CompileValidationPlan.
+    #  @returns a function accepting (area, district, subdistrict, sector, unit) and returning a 
+    #    sequence of the validation faults observed; see ValidateComponents.
+    @classmethod
+    def CompileValidationPlan(cls, skipped_faults=(), fail_fast=False, **plan_options):
+        if int(ForcesPostcode.InvalidDistrict) in frozenset( map(int, skipped_faults) ):
+            return lambda area, district, subdistrict, sector, unit: ()
+        return ForcesPostcode.ValidateComponents
+
     ## Creates a new instance of the forces postcode object.
     #  @param self the instance of the object that is invoking this method,
     #  @param regex_match regular expression match describing the postcode.
@@ -83,40 +125,172 @@ class ForcesPostcode(Postcode):
         
         bfpo = regex_match.group("bfpo")
         
-        self.is_bfpo_format = bool(bfpo)
-
-        if self.is_bfpo_format:
-            self.bfpo = int(bfpo)
-            self.outward_area = None
-            self.outward_district = None
-            self.inward_sector = None
-            self.inward_unit = None
+        self._is_bfpo_format = bool(bfpo)
+
+        if self._is_bfpo_format:
+            self._bfpo = int(bfpo)
+            self._outward_area = None
+            self._outward_district = None
+            self._inward_sector = None
+            self._inward_unit = None
         else:
-            self.bfpo = None
-            self.outward_area = "BF"
-            self.outward_district = int(regex_match.group("district"))
-            self.inward_sector = int(regex_match.group("sector"))
-            self.inward_unit = regex_match.group("unit")
+            self._bfpo = None
+            self._outward_area = "BF"
+            self._outward_district = int(regex_match.group("bf_district"))
+            self._inward_sector = int(regex_match.group("bf_sector"))
+            self._inward_unit = regex_match.group("bf_unit")
 
-    ## Gets the postcodes outward code.
+    ## Creates a new "BFn nXX" forces postcode from its already parsed parts.
+    #  @param cls the type of class that is invoking this method.
+    #  @param district the postcodes outward district as an integer (e.g. 1).
+    #  @param sector the postcodes inward sector as an integer (e.g. 4).
+    #  @param unit the postcodes inward unit (e.g. "DN").
+    #  @returns a new ForcesPostcode object.
+    @classmethod
+    def FromComponents(cls, district, sector, unit):
+        postcode = cls.__new__(cls)
+        Postcode.__init__(postcode, None)
+        postcode._is_bfpo_format   = False
+        postcode._bfpo             = None
+        postcode._outward_area     = "BF"
+        postcode._outward_district = district
+        postcode._inward_sector    = sector
+        postcode._inward_unit      = unit
+        return postcode
+
+    ## Creates a new "BFPO nnnn" forces postcode from its BFPO number.
+    #  @param cls the type of class that is invoking this method.
+    #  @param bfpo the BFPO number as an integer (e.g. 1234).
+    #  @returns a new ForcesPostcode object.
+    @classmethod
+    def FromBfpoNumber(cls, bfpo):
+        postcode = cls.__new__(cls)
+        Postcode.__init__(postcode, None)
+        postcode._is_bfpo_format   = True
+        postcode._bfpo             = bfpo
+        postcode._outward_area     = None
+        postcode._outward_district = None
+        postcode._inward_sector    = None
+        postcode._inward_unit      = None
+        return postcode
+
+    ## Creates a forces postcode from an integer created by to_int.
+    #  @param cls the type of class that is invoking this method.
+    #  @param value the integer to decode.
+    #  @returns a new ForcesPostcode object.
+    #  @throws ValueError if the value is not a forces postcode integer.
+    #  @remarks the postcode is not validated.
+    @classmethod
+    def from_int(cls, value):
+
+        from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode import StandardPostcode
+
+        bfpo = value - ForcesPostcode.BfpoIntegerBase
+        if 0 <= bfpo < ForcesPostcode.BfpoIntegerCount:
+            return cls.FromBfpoNumber(bfpo)
+
+        area, district, subdistrict, sector, unit = StandardPostcode.DecodeComponents(value)
+        if area != "BF" or subdistrict:
+            raise ValueError(f"{value} is not an integer encoded forces postcode.")
+
+        return cls.FromComponents(district, sector, unit)
+
+    ## Encodes this postcode as an integer.
     #  @param self the instance of the object that is invoking this method.
-    #  @returns the postcodes outward code as a string.
+    #  @returns "BFn nXX" postcodes are encoded as standard postcodes (see StandardPostcode.EncodeComponents),
+    #    "BFPO nnnn" postcodes as BfpoIntegerBase + nnnn; so both fit a signed 32-bit integer.
+    def to_int(self):
+
+        if self._is_bfpo_format:
+            return ForcesPostcode.BfpoIntegerBase + self._bfpo
+
+        from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode import StandardPostcode
+        return StandardPostcode.EncodeComponents( self._outward_area, self._outward_district, "",
+            self._inward_sector, self._inward_unit )
+
+    ## Indicates if this postcode uses the traditional "BFPO nnnn" format.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns True if this is a "BFPO nnnn" postcode, False if its a "BFn nXX" one.
     @property
-    def outward_code(self):
-        return  "BFPO" if self.is_bfpo_format else f"{self.outward_area}{self.outward_district}"
-    
-    ## Gets the postcodes inward code.
+    def is_bfpo_format(self):
+        return self._is_bfpo_format
+
+    ## Gets the postcodes BFPO number.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the BFPO number as an integer, or None if not is_bfpo_format.
+    @property
+    def bfpo(self):
+        return self._bfpo
+
+    ## Gets the postcodes outward area.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns "BF", or None if is_bfpo_format.
+    @property
+    def outward_area(self):
+        return self._outward_area
+
+    ## Gets the postcodes outward district.
     #  @param self the instance of the object that is invoking this method.
-    #  @returns the postcodes outward code as s string.
+    #  @returns the district as an integer, or None if is_bfpo_format.
     @property
-    def inward_code(self):
-        return  str(self.bfpo) if self.is_bfpo_format else f"{self.inward_sector}{self.inward_unit}"
+    def outward_district(self):
+        return self._outward_district
 
-    ## Returns a simple string representation of the object.
+    ## Gets the postcodes inward sector.
     #  @param self the instance of the object that is invoking this method.
-    #  @returns a string representation of this object suitable for user consumption.
-    def __str__(self):
-        return f"{self.outward_code} {self.inward_code}"
+    #  @returns the sector as an integer, or None if is_bfpo_format.
+    @property
+    def inward_sector(self):
+        return self._inward_sector
+
+    ## Gets the postcodes inward unit.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the two letter unit as a string, or None if is_bfpo_format.
+    @property
+    def inward_unit(self):
+        return self._inward_unit
+
+    ## Gets the components of this postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a tuple of (area, district, subdistrict, sector, unit); "BFn nXX" postcodes are 
+    #    ("BF", n, "", n, "XX"), and "BFPO nnnn" postcodes ("BFPO", nnnn, None, None, None).
+    def get_components(self):
+        if self._is_bfpo_format:
+            return ( "BFPO", self._bfpo, None, None, None )
+        return ( self._outward_area, self._outward_district, "", self._inward_sector, self._inward_unit )
+
+    ## Interns the strings held by this postcode, so they are shared with every other postcode that uses them.
+    #  @param self the instance of the object that is invoking this method.
+    def _intern_strings(self):
+        super()._intern_strings()
+        if not self._is_bfpo_format:
+            self._outward_area = intern(self._outward_area)
+            self._inward_unit = intern(self._inward_unit)
+
+    ## Builds the outward and inward codes of a postcode from its components.
+    #  @param cls the type of class that is invoking this method.
+    #  @param area "BF" or "BFPO"; see get_components.
+    #  @param district the postcodes outward district, or its BFPO number.
+    #  @param subdistrict unused (forces postcodes have no subdistrict).
+    #  @param sector the postcodes inward sector as an integer, or None.
+    #  @param unit the postcodes inward unit, or None.
+    #  @returns a tuple of the (outward code, inward code) strings; e.g. ("BFPO", "12").
+    @classmethod
+    def FormatComponents(cls, area, district, subdistrict, sector, unit):
+        if area == "BFPO":
+            return "BFPO", str(district)
+        return f"{area}{district}", f"{sector}{unit}"
+
+    ## Builds the canonical string forms of this postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a tuple of (outward code, inward code, full postcode) strings; e.g. ("BFPO", "12", "BFPO 12").
+    def _build_postcode_strings(self):
+        if self._is_bfpo_format:
+            outward_code, inward_code = "BFPO", str(self._bfpo)
+        else:
+            outward_code = f"{self._outward_area}{self._outward_district}"
+            inward_code = f"{self._inward_sector}{self._inward_unit}"
+        return outward_code, inward_code, f"{outward_code} {inward_code}"
         
 if __name__ == "__main__":
     
@@ -1,3 +1,6 @@
+# python3 imports
+from sys import intern
+
 # project imports
 from wintersdeep_postcode.postcode import Postcode
 from wintersdeep_postcode.postcode_types.special_case_postcode.special_case import SpecialCase
@@ -10,6 +13,12 @@ class SpecialCasePostcode(Postcode):
     ## The type of postcode this class represents.
     PostcodeType = 'special-case'
 
+    ## The attributes held by special case postcode objects, in addition to those of Postcode.
+    __slots__ = ( '_special_case', '_postcode_parts' )
+
+    ## The names of the public attributes that describe postcodes of this type.
+    PublicAttributes = Postcode.PublicAttributes + ( 'special_case', 'postcode_parts' )
+
     ## The base number from which validation faults in this class start
     #  @remarks each class has 100 numbers allocated to it; SpecialCasePostcode - 300 -> 399
     ValidationFaultBase = 300
@@ -19,6 +28,10 @@ class SpecialCasePostcode(Postcode):
     # (We are running against a specific string at this point - theres nothing to validate)
     #
 
+    ## The first integer used to encode special case postcodes; see to_int.
+    #  @remarks placed immediately after the integers used by ForcesPostcode.
+    IntegerBase = 1708397200
+
     ## Get a regular expression that can be used to parse postcodes of this type.
     #  @param whitespace_regex the regular expression used to parse any delimiting whitespace.
     #  @returns a compiled regular expression that can be used to parse a regeex of this type. 
@@ -39,6 +52,28 @@ class SpecialCasePostcode(Postcode):
         # object type, validation was the very act of parsing...
         return [ ]
 
+    ## Determine if the components of a postcode appear to be valid.
+    #  @param cls the class that is invoking this method.
+    #  @param area the postcodes area; see get_components.
+    #  @param district the postcodes district; see get_components.
+    #  @param subdistrict the postcodes subdistrict; see get_components.
+    #  @param sector the postcodes sector; see get_components.
+    #  @param unit the postcodes unit; see get_components.
+    #  @returns an empty list, special cases are valid by definition.
+    @classmethod
+    def ValidateComponents(cls, area, district, subdistrict, sector, unit):
+        return [ ]
+
+    ## Compiles the function a parser uses to validate the components of special case postcodes.
+    #  @param cls the class that is invoking this method.
+    #  @param skipped_faults unused, special cases have no checks.
+    #  @param fail_fast unused, special cases have no checks.
+    #  @param plan_options unused, see Postcode.CompileValidationPlan.
+    #  @returns ValidateComponents.
+    @classmethod
+    def CompileValidationPlan(cls, skipped_faults=(), fail_fast=False, **plan_options):
+        return SpecialCasePostcode.ValidateComponents
+
     ## Gets the special case definition from a regex match. Does this by working out
     #  which regex matched (by looking at named groups), and using the label to map
     #  back to the definition class.
@@ -99,31 +134,106 @@ class SpecialCasePostcode(Postcode):
     #  @param regex_match regular expression match describing the postcode.
     def __init__(self, regex_match):
         super().__init__(regex_match)
-        self.special_case = SpecialCasePostcode.GetDefinitionFromRegex(regex_match)
-        self.postcode_parts = SpecialCasePostcode.GetPostcodePartsFromRegex(
-            self.special_case.identifier, regex_match
-        )
+        self._special_case = SpecialCasePostcode.GetDefinitionFromRegex(regex_match)
+        self._postcode_parts = tuple( SpecialCasePostcode.GetPostcodePartsFromRegex(
+            self._special_case.identifier, regex_match
+        ) )
+
+    ## Gets the postcodes that special cases are encoded as integers with.
+    #  @returns a sorted list of every special case example postcode.
+    #  @remarks special cases are encoded by their position in this list, so their integers depend on
+    #    which special cases are loaded, and are only stable for as long as the definitions are.
+    @staticmethod
+    def GetIntegerCodes():
+        return sorted( example for sc in SpecialCase.Map.values() for example in sc.examples )
+
+    ## Creates a special case postcode from an integer created by to_int.
+    #  @param cls the type of class that is invoking this method.
+    #  @param value the integer to decode.
+    #  @returns a new SpecialCasePostcode object.
+    #  @throws ValueError if the value is not a special case postcode integer.
+    @classmethod
+    def from_int(cls, value):
+
+        integer_codes = SpecialCasePostcode.GetIntegerCodes()
+        code_index = value - SpecialCasePostcode.IntegerBase
+
+        if not 0 <= code_index < len(integer_codes):
+            raise ValueError(f"{value} is not an integer encoded special case postcode.")
 
+        regex_match = SpecialCasePostcode.GetParseRegex().match(integer_codes[code_index])
+        postcode = cls(regex_match)
+        postcode._original_regex_match = None
+        return postcode
 
-    ## Gets the postcodes outward code.
+    ## Encodes this postcode as an integer.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns IntegerBase plus the postcodes position in GetIntegerCodes.
+    #  @throws ValueError if this postcode is not one of the special cases examples.
+    def to_int(self):
+        integer_codes = SpecialCasePostcode.GetIntegerCodes()
+        return SpecialCasePostcode.IntegerBase + integer_codes.index( str(self) )
+
+    ## Calculates the key used to compare and hash this postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the postcodes integer encoding; or, if it isn't one of the special case examples, an
+    #    integer (following every example) made from the bytes of the postcode string.
+    def _build_postcode_key(self):
+        try:
+            return self.to_int()
+        except ValueError:
+            integer_codes_end = SpecialCasePostcode.IntegerBase + len( SpecialCasePostcode.GetIntegerCodes() )
+            return integer_codes_end + int.from_bytes( str(self).encode("utf-8"), "big" )
+
+    ## Gets the definition of the special case this postcode matched.
     #  @param self the instance of the object that is invoking this method.
-    #  @returns the postcodes outward code as a string.
+    #  @returns the SpecialCase definition object.
     @property
-    def outward_code(self):
-        return  self.postcode_parts[0]
+    def special_case(self):
+        return self._special_case
 
-    ## Gets the postcodes inward code.
+    ## Gets the parts (whitespace seperated blocks) of this postcode.
     #  @param self the instance of the object that is invoking this method.
-    #  @returns the postcodes outward code as s string.
+    #  @returns the postcode parts as a tuple of strings.
     @property
-    def inward_code(self):
-        return  self.postcode_parts[-1] if len(self.postcode_parts) > 1 else ""
+    def postcode_parts(self):
+        return self._postcode_parts
+
+
+    ## Gets the components of this postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a tuple of (area, district, subdistrict, sector, unit); special cases don't follow
+    #    the usual structure, so this is (outward code, None, None, None, inward code).
+    def get_components(self):
+        return ( self.outward_code, None, None, None, self.inward_code )
+
+    ## Interns the strings held by this postcode, so they are shared with every other postcode that uses them.
+    #  @param self the instance of the object that is invoking this method.
+    def _intern_strings(self):
+        super()._intern_strings()
+        self._postcode_parts = tuple( map(intern, self._postcode_parts) )
+
+    ## Builds the outward and inward codes of a postcode from its components.
+    #  @param cls the type of class that is invoking this method.
+    #  @param area the postcodes outward code; see get_components.
+    #  @param district unused.
+    #  @param subdistrict unused.
+    #  @param sector unused.
+    #  @param unit the postcodes inward code; see get_components.
+    #  @returns a tuple of the (outward code, inward code) strings.
+    #  @remarks special cases with more than two parts only have their first and last part described.
+    @classmethod
+    def FormatComponents(cls, area, district, subdistrict, sector, unit):
+        return area, unit
 
-    ## Returns a simple string representation of the object.
+    ## Builds the canonical string forms of this postcode.
     #  @param self the instance of the object that is invoking this method.
-    #  @returns a string representation of this object suitable for user consumption.
-    def __str__(self):
-        return " ".join(self.postcode_parts)
+    #  @returns a tuple of (outward code, inward code, full postcode) strings; the outward code is 
+    #    the first part, the inward code is the last part (or empty if there is only one part).
+    def _build_postcode_strings(self):
+        postcode_parts = self._postcode_parts
+        inward_code = postcode_parts[-1] if len(postcode_parts) > 1 else ""
+        return postcode_parts[0], inward_code, " ".join(postcode_parts)
 
 
 if __name__ == "__main__":
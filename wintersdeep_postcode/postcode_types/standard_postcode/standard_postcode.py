@@ -1,11 +1,14 @@
 # python3 imports
 from re import compile as compile_regex
 from gettext import gettext as _
+from sys import intern
 
 # project imports
 from wintersdeep_postcode.postcode import Postcode
 from wintersdeep_postcode.exceptions.validation_fault import ValidationFault
 from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode_validator import StandardPostcodeValidator
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode_scanner import StandardPostcodeScanner
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode_outward_table import StandardPostcodeOutwardTable
 
 ## A standard UK postcode.
 #  @remarks this represents standard UK domestic/commercial postcode 
@@ -15,6 +18,13 @@ class StandardPostcode(Postcode):
     ## The type of postcode this class represents.
     PostcodeType = 'standard'
 
+    ## The attributes held by standard postcode objects, in addition to those of Postcode.
+    __slots__ = ( '_outward_area', '_outward_district', '_outward_subdistrict', '_inward_sector', '_inward_unit' )
+
+    ## The names of the public attributes that describe postcodes of this type.
+    PublicAttributes = Postcode.PublicAttributes + ( 'outward_area', 'outward_district', 
+        'outward_subdistrict', 'inward_sector', 'inward_unit' )
+
     ## Regular expression pattern expressing the format of the "area" portion of a postcode.
     AreaRegex = r"(?P<area>[A-Z]{1,2})"
 
@@ -98,32 +108,224 @@ class StandardPostcode(Postcode):
             StandardPostcode.UnitRegex
         )
 
+    ## Get a scanner that can be used to parse postcodes of this type into their components.
+    #  @param whitespace the whitespace handling strategy; 'strict', 'tolerant' or 'lenient'.
+    #  @returns a function accepting an input string, and returning a tuple of (area, district,
+    #    subdistrict, sector, unit) or None.
+    #  @remarks see StandardPostcodeScanner; this recognises exactly the same input as GetParseRegex.
+    @staticmethod
+    def GetComponentScanner(whitespace):
+        return StandardPostcodeScanner(whitespace).scan
+
+    ## Get a scanner that can be used to parse postcodes of this type without a regular expression.
+    #  @param whitespace the whitespace handling strategy; 'strict', 'tolerant' or 'lenient'.
+    #  @returns a function accepting an input string, and returning a StandardPostcode or None.
+    #  @remarks see StandardPostcodeScanner; this recognises exactly the same input as GetParseRegex.
+    @staticmethod
+    def GetParseScanner(whitespace):
+
+        scan = StandardPostcode.GetComponentScanner(whitespace)
+        from_components = StandardPostcode.FromComponents
+
+        def scan_postcode(input_string):
+            components = scan(input_string)
+            return from_components(*components) if components else None
+
+        return scan_postcode
+
+    ## Creates a new standard postcode from its already parsed parts.
+    #  @param cls the type of class that is invoking this method.
+    #  @param area the postcodes outward area (e.g. "N").
+    #  @param district the postcodes outward district as an integer (e.g. 1).
+    #  @param subdistrict the postcodes outward subdistrict, or an empty string (e.g. "C").
+    #  @param sector the postcodes inward sector as an integer (e.g. 4).
+    #  @param unit the postcodes inward unit (e.g. "DN").
+    #  @returns a new StandardPostcode object.
+    @classmethod
+    def FromComponents(cls, area, district, subdistrict, sector, unit):
+        postcode = cls.__new__(cls)
+        Postcode.__init__(postcode, None)
+        postcode._outward_area        = area
+        postcode._outward_district    = district
+        postcode._outward_subdistrict = subdistrict
+        postcode._inward_sector       = sector
+        postcode._inward_unit         = unit
+        return postcode
+
+    ## The rules standard postcodes outward codes are validated against, and the fault raised when each is broken.
+    #  @remarks tuples of (fault, StandardPostcodeValidator check name), in the order faults are reported.
+    #  @remarks these only depend on the area, district and subdistrict; see StandardPostcodeOutwardTable.
+    OutwardValidationSteps = (
+        (ExpectedSingleDigitDistrict,      'CheckAreasWithOnlySingleDigitDistricts'),
+        (ExpectedDoubleDigitDistrict,      'CheckAreasWithOnlyDoubleDigitDistricts'),
+        (NoZeroDistrict,                   'CheckAreasWithDistrictZero'),
+        (NoTenDistrict,                    'CheckAreasWithoutDistrictTen'),
+        (SubdistrictsUnsupported,          'CheckAreasWithSubdistricts'),
+        (UnexpectedDistrictSubdivision,    'CheckAreasWithSpecificSubdistricts'),
+        (UnusedCharacterInFirstPosition,   'CheckFirstPositionExcludes'),
+        (UnusedCharacterInSecondPosition,  'CheckSecondPositionExcludes'),
+        (UnusedSingleDigitAreaSubdistrict, 'CheckSingleDigitAreaSubdistricts'),
+        (UnusedDoubleDigitAreaSubdistrict, 'CheckDoubleDigitAreaSubdistricts'),
+    )
+
+    ## The rules standard postcodes inward codes are validated against, and the fault raised when each is broken.
+    InwardValidationSteps = (
+        (UnusedFirstCharacterInUnit,       'CheckFirstUnitCharacterExcludes'),
+        (UnusedSecondCharacterInUnit,      'CheckSecondUnitCharacterExcludes'),
+    )
+
+    ## All of the rules standard postcodes are validated against.
+    ValidationSteps = OutwardValidationSteps + InwardValidationSteps
+
+    ## The default number of outward codes whose validation results are remembered.
+    #  @remarks used by OutwardValidator, and by validation plans unless told otherwise.
+    OutwardValidationCacheSize = 4096
+
+    ## Function accepting (area, district, subdistrict) which applies the OutwardValidationSteps.
+    #  @remarks results are remembered for the most recently seen outward codes, as almost all 
+    #    postcodes share one of a few thousand. This is only used by Validate and ValidateComponents, 
+    #    parsers validate using the plans they compile; see CompileValidationPlan.
+    OutwardValidator = staticmethod( StandardPostcodeValidator.CompileCachedValidator( 
+        OutwardValidationSteps, ( 'area', 'district', 'subdistrict' ), OutwardValidationCacheSize ) )
+
+    ## Function accepting (unit) which applies the InwardValidationSteps.
+    #  @remarks results are remembered, there are only 676 possible units.
+    InwardValidator = staticmethod( StandardPostcodeValidator.CompileCachedValidator(
+        InwardValidationSteps, ( 'unit', ), 1024 ) )
+
+    ## The number of distinct integers used to encode standard postcodes.
+    #  @remarks integers 0 to IntegerCodeLimit - 1 are standard postcodes; see EncodeComponents.
+    IntegerCodeLimit = StandardPostcodeOutwardTable.EntryCount * 10 * 676
+
+    ## Encodes the parts of a standard postcode as an integer.
+    #  @param area the postcodes outward area (e.g. "N").
+    #  @param district the postcodes outward district as an integer (e.g. 1).
+    #  @param subdistrict the postcodes outward subdistrict, or an empty string (e.g. "C").
+    #  @param sector the postcodes inward sector as an integer (e.g. 4).
+    #  @param unit the postcodes inward unit (e.g. "DN").
+    #  @returns an integer between 0 and IntegerCodeLimit (~1.7 billion, so it fits a signed 32-bit integer).
+    #  @throws ValueError if the parts don't describe a structurally valid standard postcode.
+    #  @remarks the integer is ((outward code * 10) + sector) * 676 + unit; where the outward code is
+    #    its index in StandardPostcodeOutwardTable and the unit is its two letters in base 26. Ordering
+    #    postcodes by their integer is the same as ordering them by area, district, subdistrict,
+    #    sector and then unit; i.e. "A1 1AA" < "A1A 1AA" < "A10 1AA" < "AA1 1AA" < "B1 1AA".
+    @staticmethod
+    def EncodeComponents(area, district, subdistrict, sector, unit):
+
+        outward_index = StandardPostcodeOutwardTable.GetEntryIndex(area, district, subdistrict)
+
+        if outward_index is None or not sector in range(10) or len(unit) != 2 or \
+                not "A" <= unit[0] <= "Z" or not "A" <= unit[1] <= "Z":
+            raise ValueError(f"Cannot encode '{area}{district}{subdistrict} {sector}{unit}' as a standard postcode.")
+
+        unit_index = ( ord(unit[0]) - 65 ) * 26 + ( ord(unit[1]) - 65 )
+        return ( outward_index * 10 + sector ) * 676 + unit_index
+
+    ## Decodes an integer created by EncodeComponents into the parts of a standard postcode.
+    #  @param value the integer to decode.
+    #  @returns a tuple of (area, district, subdistrict, sector, unit).
+    #  @throws ValueError if the value is not a standard postcode integer.
+    @staticmethod
+    def DecodeComponents(value):
+
+        if not 0 <= value < StandardPostcode.IntegerCodeLimit:
+            raise ValueError(f"{value} is not an integer encoded standard postcode.")
+
+        inward_index, unit_index = divmod(value, 676)
+        outward_index, sector = divmod(inward_index, 10)
+        area, district, subdistrict = StandardPostcodeOutwardTable.GetOutwardCode(outward_index)
+        unit = chr( 65 + unit_index // 26 ) + chr( 65 + unit_index % 26 )
+        return area, district, subdistrict, sector, unit
+
+    ## Creates a standard postcode from an integer created by to_int.
+    #  @param cls the type of class that is invoking this method.
+    #  @param value the integer to decode.
+    #  @returns a new StandardPostcode object.
+    #  @throws ValueError if the value is not a standard postcode integer.
+    #  @remarks the postcode is not validated.
+    @classmethod
+    def from_int(cls, value):
+        return cls.FromComponents( *StandardPostcode.DecodeComponents(value) )
+
+    ## Encodes this postcode as an integer.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns an integer between 0 and IntegerCodeLimit; see EncodeComponents.
+    def to_int(self):
+        return StandardPostcode.EncodeComponents( self._outward_area, self._outward_district,
+            self._outward_subdistrict, self._inward_sector, self._inward_unit )
+
     ## Determine if the given postcode appears to be valid.
     #  @param cls the class that is invoking this method.
     #  @param postcode the postcode to be checked.
     #  @returns a list of validation fault objects describing any problems with the postcode.
+    #  @remarks see ValidateComponents.
     @classmethod
     def Validate(cls, postcode):
+        return StandardPostcode.ValidateComponents( postcode._outward_area, postcode._outward_district,
+            postcode._outward_subdistrict, postcode._inward_sector, postcode._inward_unit )
+
+    ## Determine if the components of a postcode appear to be valid.
+    #  @param cls the class that is invoking this method.
+    #  @param area the postcodes outward area (e.g. "N").
+    #  @param district the postcodes outward district as an integer (e.g. 1).
+    #  @param subdistrict the postcodes outward subdistrict, or an empty string (e.g. "C").
+    #  @param sector the postcodes inward sector as an integer (e.g. 4).
+    #  @param unit the postcodes inward unit (e.g. "DN").
+    #  @returns a list of validation fault objects describing any problems with the postcode.
+    #  @remarks the outward and inward codes are validated seperately, as their results can then 
+    #    be reused for other postcodes sharing the same outward or inward code.
+    @classmethod
+    def ValidateComponents(cls, area, district, subdistrict, sector, unit):
+        outward_faults = StandardPostcode.OutwardValidator(area, district, subdistrict)
+        inward_faults = StandardPostcode.InwardValidator(unit)
+        return [ *outward_faults, *inward_faults ]
+
+    ## Compiles the function a parser uses to validate the components of standard postcodes.
+    #  @param cls the class that is invoking this method.
+    #  @param skipped_faults a collection of fault identifiers that should not be checked for.
+    #  @param fail_fast when True validation stops at the first fault that isn't skipped.
+    #  @param outward_cache_size the maximum number of outward codes whose results are remembered, 
+    #    or None for no limit.
+    #  @param outward_fault_table when True outward codes are validated using a table of precomputed
+    #    results (see StandardPostcodeOutwardTable), each calculated the first time it is seen; when
+    #    'preload' every entry is calculated now (this takes a moment, and uses ~250KB).
+    #  @param plan_options unused, see Postcode.CompileValidationPlan.
+    #  @returns a function accepting (area, district, subdistrict, sector, unit) and returning a 
+    #    sequence of the validation faults observed; see ValidateComponents. The function's 
+    #    outward_validator attribute is the (cached or tabulated) outward code validator it uses.
+    #  @remarks skipped checks are left out of the compiled validators entirely, and with fail_fast
+    #    the inward code is only checked if the outward code passed.
+    #  @remarks every plan has its own outward cache (or table), so plans don't share any state and 
+    #    always use the rules that were loaded when they were compiled.
+    @classmethod
+    def CompileValidationPlan(cls, skipped_faults=(), fail_fast=False, outward_cache_size=OutwardValidationCacheSize, 
+            outward_fault_table=False, **plan_options):
 
-        f = StandardPostcode
-        v = StandardPostcodeValidator
-
-        validation_steps = [
-            (f.ExpectedSingleDigitDistrict,      v.CheckAreasWithOnlySingleDigitDistricts),
-            (f.ExpectedDoubleDigitDistrict,      v.CheckAreasWithOnlyDoubleDigitDistricts),
-            (f.NoZeroDistrict,                   v.CheckAreasWithDistrictZero),
-            (f.NoTenDistrict,                    v.CheckAreasWithoutDistrictTen),
-            (f.SubdistrictsUnsupported,          v.CheckAreasWithSubdistricts),
-            (f.UnexpectedDistrictSubdivision,    v.CheckAreasWithSpecificSubdistricts),
-            (f.UnusedCharacterInFirstPosition,   v.CheckFirstPositionExcludes),
-            (f.UnusedCharacterInSecondPosition,  v.CheckSecondPositionExcludes),
-            (f.UnusedSingleDigitAreaSubdistrict, v.CheckSingleDigitAreaSubdistricts),
-            (f.UnusedDoubleDigitAreaSubdistrict, v.CheckDoubleDigitAreaSubdistricts),
-            (f.UnusedFirstCharacterInUnit,       v.CheckFirstUnitCharacterExcludes),
-            (f.UnusedSecondCharacterInUnit,      v.CheckSecondUnitCharacterExcludes),
-        ]
-
-        return [ fault for fault, check in validation_steps if check(postcode) ]
+        skipped_faults = frozenset( map(int, skipped_faults) )
+        outward_steps = [ s for s in StandardPostcode.OutwardValidationSteps if not int(s[0]) in skipped_faults ]
+        inward_steps = [ s for s in StandardPostcode.InwardValidationSteps if not int(s[0]) in skipped_faults ]
+
+        if outward_fault_table:
+            outward_table = StandardPostcodeOutwardTable(outward_steps, outward_fault_table == 'preload')
+            outward_lookup = outward_table.lookup
+            outward_validator = ( lambda area, district, subdistrict: outward_lookup(area, district, subdistrict)[:1] ) \
+                if fail_fast else outward_lookup
+        else:
+            outward_validator = StandardPostcodeValidator.CompileCachedValidator( outward_steps, 
+                ( 'area', 'district', 'subdistrict' ), outward_cache_size, fail_fast )
+
+        inward_validator = StandardPostcodeValidator.CompileCachedValidator( inward_steps, 
+            ( 'unit', ), 1024, fail_fast )
+
+        if fail_fast:
+            def validation_plan(area, district, subdistrict, sector, unit):
+                return outward_validator(area, district, subdistrict) or inward_validator(unit)
+        else:
+            def validation_plan(area, district, subdistrict, sector, unit):
+                return [ *outward_validator(area, district, subdistrict), *inward_validator(unit) ]
+
+        validation_plan.outward_validator = outward_validator
+        return validation_plan
 
     ## Creates a new instance of the standard postcode object.
     #  @param self the instance of the object that is invoking this method,
@@ -132,35 +334,82 @@ class StandardPostcode(Postcode):
         
         super().__init__(regex_match)
 
-        self.outward_area        = regex_match.group("area")    
-        self.outward_district    = int(regex_match.group("district") or \
-                                        regex_match.group("district_m") )
-        self.outward_subdistrict = regex_match.group("district_n") or ""
-        self.inward_sector       = int(regex_match.group("sector"))
-        self.inward_unit         = regex_match.group("unit")
+        self._outward_area        = regex_match.group("area")    
+        self._outward_district    = int(regex_match.group("district") or \
+                                         regex_match.group("district_m") )
+        self._outward_subdistrict = regex_match.group("district_n") or ""
+        self._inward_sector       = int(regex_match.group("sector"))
+        self._inward_unit         = regex_match.group("unit")
 
-    ## Gets the postcodes outward code.
+    ## Gets the postcodes outward area.
     #  @param self the instance of the object that is invoking this method.
-    #  @returns the postcodes outward code as a string.
+    #  @returns the one or two letter area as a string (e.g. "N").
     @property
-    def outward_code(self):
-        return  self.outward_area           + \
-                str(self.outward_district)  + \
-                self.outward_subdistrict
-    
-    ## Gets the postcodes inward code.
+    def outward_area(self):
+        return self._outward_area
+
+    ## Gets the postcodes outward district.
     #  @param self the instance of the object that is invoking this method.
-    #  @returns the postcodes outward code as s string.
+    #  @returns the district as an integer (e.g. 1).
     @property
-    def inward_code(self):
-        return  str(self.inward_sector)     + \
-                self.inward_unit
+    def outward_district(self):
+        return self._outward_district
+
+    ## Gets the postcodes outward subdistrict.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the subdistrict letter, or an empty string if there is none (e.g. "C").
+    @property
+    def outward_subdistrict(self):
+        return self._outward_subdistrict
+
+    ## Gets the postcodes inward sector.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the sector as an integer (e.g. 4).
+    @property
+    def inward_sector(self):
+        return self._inward_sector
+
+    ## Gets the postcodes inward unit.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns the two letter unit as a string (e.g. "DN").
+    @property
+    def inward_unit(self):
+        return self._inward_unit
+
+    ## Gets the components of this postcode.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a tuple of (area, district, subdistrict, sector, unit); e.g. ("N", 1, "C", 4, "DN").
+    def get_components(self):
+        return ( self._outward_area, self._outward_district, self._outward_subdistrict, 
+            self._inward_sector, self._inward_unit )
+
+    ## Interns the strings held by this postcode, so they are shared with every other postcode that uses them.
+    #  @param self the instance of the object that is invoking this method.
+    def _intern_strings(self):
+        super()._intern_strings()
+        self._outward_area = intern(self._outward_area)
+        self._outward_subdistrict = intern(self._outward_subdistrict)
+        self._inward_unit = intern(self._inward_unit)
+
+    ## Builds the outward and inward codes of a postcode from its components.
+    #  @param cls the type of class that is invoking this method.
+    #  @param area the postcodes outward area (e.g. "N").
+    #  @param district the postcodes outward district as an integer (e.g. 1).
+    #  @param subdistrict the postcodes outward subdistrict, or an empty string (e.g. "C").
+    #  @param sector the postcodes inward sector as an integer (e.g. 4).
+    #  @param unit the postcodes inward unit (e.g. "DN").
+    #  @returns a tuple of the (outward code, inward code) strings; e.g. ("N1C", "4DN").
+    @classmethod
+    def FormatComponents(cls, area, district, subdistrict, sector, unit):
+        return f"{area}{district}{subdistrict}", f"{sector}{unit}"
 
-    ## Returns a simple string representation of the object.
+    ## Builds the canonical string forms of this postcode.
     #  @param self the instance of the object that is invoking this method.
-    #  @returns a string representation of this object suitable for user consumption.
-    def __str__(self):
-        return f"{self.outward_code} {self.inward_code}"
+    #  @returns a tuple of (outward code, inward code, full postcode) strings; e.g. ("N1C", "4DN", "N1C 4DN").
+    def _build_postcode_strings(self):
+        outward_code = f"{self._outward_area}{self._outward_district}{self._outward_subdistrict}"
+        inward_code = f"{self._inward_sector}{self._inward_unit}"
+        return outward_code, inward_code, f"{outward_code} {inward_code}"
 
 if __name__ == "__main__":
     
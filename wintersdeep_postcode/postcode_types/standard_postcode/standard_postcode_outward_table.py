@@ -0,0 +1,183 @@
+# python3 imports
+from string import ascii_uppercase
+
+# project imports
+from wintersdeep_postcode.postcode_types.standard_postcode.standard_postcode_validator import StandardPostcodeValidator
+
+## A table of the validation faults for every structurally possible standard outward code.
+#  @remarks most standard postcode rules only depend on the outward code (area, district and
+#    subdistrict), of which there are a fixed number; 702 areas ("A" to "ZZ") and 360 district/
+#    subdistrict combinations ("0" to "99", and "0A" to "9Z"). Rather than evaluating each rule
+#    we can look the result up, calculating it the first time each outward code is seen.
+#  @remarks entries are held in a bytearray (one byte per outward code) indexing a list of the
+#    distinct fault tuples observed; so the whole table is ~250KB when every entry is populated.
+#  @remarks use lookup(area, district, subdistrict) to get the tuple of faults for an outward code.
+class StandardPostcodeOutwardTable(object):
+
+    ## Maps each possible area onto its row in the table.
+    #  @remarks single letter areas are A=0, B=27, ... two letter areas fill the gaps between, AA=1, AB=2, ...
+    AreaIndexes = {
+        **{ a: ( ord(a) - 65 ) * 27 for a in ascii_uppercase },
+        **{ a + b: ( ord(a) - 65 ) * 27 + ( ord(b) - 64 ) for a in ascii_uppercase for b in ascii_uppercase }
+    }
+
+    ## Maps each possible subdistrict onto its offset within a district.
+    SubdistrictIndexes = { "": 0, **{ s: ord(s) - 64 for s in ascii_uppercase } }
+
+    ## The number of district/subdistrict combinations in each area.
+    #  @remarks districts 0 to 9 with each of 27 subdistricts ("" and "A" to "Z"), then districts 10 to 99.
+    DistrictsPerArea = 10 * 27 + 90
+
+    ## The number of entries in the table.
+    EntryCount = 702 * DistrictsPerArea
+
+    ## The maximum number of distinct fault tuples the table can index.
+    MaximumFaultSets = 255
+
+    ## Creates a new instance of the outward code table.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param validation_steps a sequence of (fault, check name) tuples, these must only depend on
+    #    the outward code; see StandardPostcodeValidator.CompileValidator.
+    #  @param preload when True every entry is calculated now, rather than when it is first needed.
+    def __init__(self, validation_steps, preload=False):
+        outward_parameters = ( 'area', 'district', 'subdistrict' )
+        self.validator = StandardPostcodeValidator.CompileValidator(validation_steps, outward_parameters)
+        self.entries = bytearray(StandardPostcodeOutwardTable.EntryCount)
+        self.fault_sets = [ None ]  # entry zero means "not calculated yet".
+        self.fault_set_indexes = {}
+        self.lookup = self._build_lookup_function()
+        if preload:
+            self.preload()
+
+    ## Gets the offset of each district within an area, for each subdistrict.
+    #  @returns a dict of subdistrict => list of offsets, indexed by district.
+    #  @remarks subdistricts are only used with single digit districts, so only the list for
+    #    the empty subdistrict covers districts 10 to 99.
+    @staticmethod
+    def GetDistrictOffsets():
+        table = StandardPostcodeOutwardTable
+        district_offsets = { s: [ d * 27 + i for d in range(10) ] for s, i in table.SubdistrictIndexes.items() }
+        district_offsets[""].extend( 260 + d for d in range(10, 100) )
+        return district_offsets
+
+    ## Gets the index of the table entry for an outward code.
+    #  @param area the postcodes outward area.
+    #  @param district the postcodes outward district.
+    #  @param subdistrict the postcodes outward subdistrict (or an empty string).
+    #  @returns the index of the entry, or None if the outward code isn't structurally valid.
+    @staticmethod
+    def GetEntryIndex(area, district, subdistrict):
+
+        table = StandardPostcodeOutwardTable
+        area_index = table.AreaIndexes.get(area, None)
+        subdistrict_index = table.SubdistrictIndexes.get(subdistrict, None)
+
+        if area_index is None or subdistrict_index is None or not 0 <= district <= 99:
+            return None
+
+        if district < 10:
+            return area_index * table.DistrictsPerArea + district * 27 + subdistrict_index
+
+        if subdistrict_index:
+            return None # subdistricts are only used with single digit districts.
+
+        return area_index * table.DistrictsPerArea + 260 + district
+
+    ## Gets the outward code that a table entry is for; the inverse of GetEntryIndex.
+    #  @param entry_index the index of the table entry.
+    #  @returns a tuple of (area, district, subdistrict).
+    #  @throws ValueError if the entry index is not in the table.
+    @staticmethod
+    def GetOutwardCode(entry_index):
+
+        table = StandardPostcodeOutwardTable
+
+        if not 0 <= entry_index < table.EntryCount:
+            raise ValueError(f"{entry_index} is not a valid outward code table entry.")
+
+        area_index, district_offset = divmod(entry_index, table.DistrictsPerArea)
+        first_letter, second_letter = divmod(area_index, 27)
+        area = chr(65 + first_letter) + ( chr(64 + second_letter) if second_letter else "" )
+
+        if district_offset >= 270:
+            return area, district_offset - 260, ""
+
+        district, subdistrict_index = divmod(district_offset, 27)
+        subdistrict = chr(64 + subdistrict_index) if subdistrict_index else ""
+        return area, district, subdistrict
+
+    ## Builds the function used to look up the validation faults for an outward code.
+    #  @param self the instance of the object that is invoking this method.
+    #  @returns a function accepting (area, district, subdistrict) and returning a tuple of the 
+    #    validation faults observed.
+    #  @remarks the tables are bound to locals, and the entry index precomputed as far as 
+    #    possible, as this is called every time a postcode is validated.
+    def _build_lookup_function(self):
+
+        table = StandardPostcodeOutwardTable
+        area_rows = { a: i * table.DistrictsPerArea for a, i in table.AreaIndexes.items() }
+        district_offsets = table.GetDistrictOffsets()
+        entries = self.entries
+        fault_sets = self.fault_sets
+        populate = self._populate
+        validator = self.validator
+
+        def lookup(area, district, subdistrict):
+
+            try:
+                entry_index = area_rows[area] + district_offsets[subdistrict][district]
+            except (KeyError, IndexError, TypeError):
+                entry_index = None
+
+            if entry_index is None or district < 0:
+                return tuple( validator(area, district, subdistrict) )
+
+            return fault_sets[ entries[entry_index] or populate(entry_index, area, district, subdistrict) ]
+
+        return lookup
+
+    ## Calculates a table entry.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param entry_index the index of the table entry.
+    #  @param area the postcodes outward area.
+    #  @param district the postcodes outward district.
+    #  @param subdistrict the postcodes outward subdistrict (or an empty string).
+    #  @returns the index of the entries fault set.
+    #  @throws OverflowError if the rules produce more distinct fault sets than can be indexed.
+    def _populate(self, entry_index, area, district, subdistrict):
+
+        faults = tuple( self.validator(area, district, subdistrict) )
+        fault_set_index = self.fault_set_indexes.get(faults, None)
+
+        if fault_set_index is None:
+            fault_set_index = len(self.fault_sets)
+            if fault_set_index > StandardPostcodeOutwardTable.MaximumFaultSets:
+                raise OverflowError(f"Outward code rules produce more than {fault_set_index - 1} distinct results.")
+            self.fault_sets.append(faults)
+            self.fault_set_indexes[faults] = fault_set_index
+
+        self.entries[entry_index] = fault_set_index
+        return fault_set_index
+
+    ## Calculates every entry in the table that hasn't been calculated yet.
+    #  @param self the instance of the object that is invoking this method.
+    def preload(self):
+
+        table = StandardPostcodeOutwardTable
+        district_parts = [ (d, s) for d in range(10) for s in table.SubdistrictIndexes ]
+        district_parts += [ (d, "") for d in range(10, 100) ]
+
+        for area in table.AreaIndexes:
+            for district, subdistrict in district_parts:
+                entry_index = table.GetEntryIndex(area, district, subdistrict)
+                if not self.entries[entry_index]:
+                    self._populate(entry_index, area, district, subdistrict)
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
@@ -0,0 +1,151 @@
+# python3 imports
+from string import ascii_uppercase, digits
+
+## A hand written scanner for standard postcodes.
+#  @remarks this recognises exactly the same input as StandardPostcode.GetParseRegex, but
+#    does so with a few table lookups rather than a general purpose regex match.
+#  @remarks a standard postcode is always its outward code, a whitespace seperator, and a
+#    three character inward code - so we can slice the input by position and classify each
+#    part, rather than searching it.
+class StandardPostcodeScanner(object):
+
+    ## Character class assigned to the characters A-Z.
+    Letter = "L"
+
+    ## Character class assigned to the characters 0-9.
+    Digit = "D"
+
+    ## Translation table mapping each character onto its character class.
+    #  @remarks characters not in the table are left as they are, which is never a valid class.
+    CharacterClasses = str.maketrans({ **dict.fromkeys(ascii_uppercase, Letter), **dict.fromkeys(digits, Digit) })
+
+    ## The character classes an inward code must have (sector digit, and a two letter unit).
+    InwardLayout = "DLL"
+
+    ## Maps the character classes of a valid outward code onto where its parts end.
+    #  @remarks values are (end of area, end of district) - anything after that is the subdistrict.
+    OutwardLayouts = {
+        "LD":   (1, 2),     # A1
+        "LDD":  (1, 3),     # A11
+        "LDL":  (1, 2),     # A1A
+        "LLD":  (2, 3),     # AA1
+        "LLDD": (2, 4),     # AA11
+        "LLDL": (2, 3),     # AA1A
+    }
+
+    ## The seperators that can be matched without any further processing for each whitespace strategy.
+    #  @remarks lenient input using any other whitespace is compacted before it is scanned.
+    WhitespaceSeperators = {
+        'strict':   ( " ", ),
+        'tolerant': ( "", " " ),
+        'lenient':  ( "", " " )
+    }
+
+    ## Maps the strings of one or two digits onto their integer value.
+    #  @remarks the regex allows districts with a leading zero (e.g. "01") so these are included.
+    NumberValues = {
+        **{ d: int(d) for d in digits },
+        **{ f"{d}{d2}": int(f"{d}{d2}") for d in digits for d2 in digits }
+    }
+
+    ## Creates a new instance of the scanner.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param whitespace the whitespace handling to apply; 'strict', 'tolerant' or 'lenient'.
+    #  @throws ValueError when whitespace isn't a supported strategy.
+    def __init__(self, whitespace='strict'):
+
+        seperators = StandardPostcodeScanner.WhitespaceSeperators
+
+        if not whitespace in seperators:
+            supported_types = ", ".join( seperators.keys() )
+            error_message = f"whitespace is expected to be one of - {supported_types}; actually got '{whitespace}'"
+            raise ValueError(error_message)
+
+        self.whitespace = whitespace
+        self.layouts = StandardPostcodeScanner.GetLayoutTable( seperators[whitespace] )
+        self.compacted_layouts = StandardPostcodeScanner.GetLayoutTable( ( "", ), line_endings=( "", ) )
+        self.scan = StandardPostcodeScanner._build_scan_function(whitespace, self.layouts, self.compacted_layouts)
+
+    ## Builds a table mapping the character classes of an entire postcode onto where its parts are.
+    #  @param seperators the strings which may seperate the outward and inward codes.
+    #  @param line_endings the strings which may follow the inward code.
+    #  @returns a dict of character class string => (end of area, end of district, end of outward 
+    #    code, start of inward code).
+    #  @remarks the regex is anchored with '$' which will also match before a trailing newline, so
+    #    by default layouts ending in a newline are included too.
+    @staticmethod
+    def GetLayoutTable(seperators, line_endings=( "", "\n" )):
+
+        layout_table = {}
+
+        for outward_classes, (area_end, district_end) in StandardPostcodeScanner.OutwardLayouts.items():
+            for seperator in seperators:
+                for line_ending in line_endings:
+                    layout = "".join([ outward_classes, seperator, StandardPostcodeScanner.InwardLayout, line_ending ])
+                    outward_end = len(outward_classes)
+                    inward_start = outward_end + len(seperator)
+                    layout_table[layout] = ( area_end, district_end, outward_end, inward_start )
+
+        return layout_table
+
+    ## Builds the function used to scan input using the given whitespace handling.
+    #  @param whitespace the whitespace handling to apply; 'strict', 'tolerant' or 'lenient'.
+    #  @param layouts the layout table to scan with, see GetLayoutTable.
+    #  @param compacted_layouts the layout table to scan lenient input with once its seperator (and
+    #    any trailing newline) has been removed; this has no newline layouts, as '$' only allows one.
+    #  @returns a function accepting an input string, and returning a tuple of (area, district,
+    #    subdistrict, sector, unit), or None if the input is not a standard postcode.
+    #  @remarks the tables are bound to locals as this is the parsers innermost loop.
+    @staticmethod
+    def _build_scan_function(whitespace, layouts, compacted_layouts):
+
+        character_classes = StandardPostcodeScanner.CharacterClasses
+        number_values = StandardPostcodeScanner.NumberValues
+        is_lenient = whitespace == 'lenient'
+
+        def scan(input_string):
+
+            layout = layouts.get( input_string.translate(character_classes), None )
+
+            if layout is None:
+
+                if not is_lenient:
+                    return None
+
+                # \s* will match any run of whitespace (exactly what str.isspace does) so remove
+                # whatever seperates the inward code, and try again.
+                if input_string[-1:] == "\n":
+                    input_string = input_string[:-1]
+
+                input_string = input_string[:-3].rstrip() + input_string[-3:]
+                layout = compacted_layouts.get( input_string.translate(character_classes), None )
+
+                if layout is None:
+                    return None
+
+            area_end, district_end, outward_end, inward_start = layout
+
+            return (
+                input_string[:area_end],
+                number_values[ input_string[area_end:district_end] ],
+                input_string[district_end:outward_end],
+                number_values[ input_string[inward_start] ],
+                input_string[inward_start + 1:inward_start + 3]
+            )
+
+        return scan
+
+    ## allows directly invoking the scanner to scan input.
+    #  @param self the instance of the object that is invoking this method.
+    #  @param input_string the string to be scanned.
+    def __call__(self, input_string):
+        return self.scan(input_string)
+
+if __name__ == "__main__":
+
+    ##
+    ##  If this is the main entry point - someone might be a little lost?
+    ##
+
+    print(f"{__file__} ran, but doesn't do anything on its own.")
+    print(f"Check 'https://www.github.com/wintersdeep/wintersdeep_postcode' for usage.")
\ No newline at end of file
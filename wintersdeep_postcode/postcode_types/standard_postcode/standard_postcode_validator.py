@@ -1,5 +1,6 @@
 # python3 imports
 from re import compile as compile_regex
+from functools import lru_cache
 from gettext import gettext as _
 
 # project imports
@@ -8,13 +9,84 @@ from wintersdeep_postcode.exceptions.validation_fault import ValidationFault
 
 ## A wrapper for validation of standard postcodes
 #  @remarks see \ref wintersdeep_postcode.postcode_types.standard_postcode 
+#  @remarks each Check* method has an equivalent expression in CheckExpressions, these are used 
+#    to compile a single function that applies every rule in one pass (see CompileValidator).
 class StandardPostcodeValidator(object):
 
-
+    ## Python expressions equivalent to each of the Check* methods.
+    #  @remarks each is evaluated with the variables area, district, subdistrict and unit (the 
+    #    parts of the postcode), and the rule tables of this class available by name. 
+    #  @remarks these must give the same results as the methods they replace - see CompileValidator.
+    CheckExpressions = {
+        'CheckAreasWithOnlySingleDigitDistricts':   "district >= 10 and area in AreasWithOnlySingleDigitDistricts",
+        'CheckAreasWithOnlyDoubleDigitDistricts':   "district <= 9 and area in AreasWithOnlyDoubleDigitDistricts",
+        'CheckAreasWithDistrictZero':               "district == 0 and not area in AreasWithDistrictZero",
+        'CheckAreasWithoutDistrictTen':             "district == 10 and area in AreasWithoutDistrictTen",
+        'CheckAreasWithSubdistricts':               "subdistrict and not (area, district) in DistrictsWithSubdistricts",
+        'CheckAreasWithSpecificSubdistricts':       "subdistrict and (area, district) in SpecificSubdistricts and not subdistrict in SpecificSubdistricts[(area, district)]",
+        'CheckFirstPositionExcludes':               "area[0] in FirstPositionExcludes",
+        'CheckSecondPositionExcludes':              "len(area) > 1 and area[1] in SecondPositionExcludes",
+        'CheckSingleDigitAreaSubdistricts':         "subdistrict and len(area) == 1 and not subdistrict in SingleDigitAreaSubdistricts",
+        'CheckDoubleDigitAreaSubdistricts':         "subdistrict and len(area) == 2 and not subdistrict in DoubleDigitAreaSubdistricts",
+        'CheckFirstUnitCharacterExcludes':          "unit[0] in UnitExcludes",
+        'CheckSecondUnitCharacterExcludes':         "unit[1] in UnitExcludes",
+    }
+
+    ## The parameters accepted by compiled validators, unless told otherwise.
+    ValidatorParameters = ( 'area', 'district', 'subdistrict', 'unit' )
+
+    ## Compiles a single function that checks a postcode against a number of rules.
+    #  @param validation_steps a sequence of (fault, check name) tuples; check names are the names
+    #    of the Check* methods of this class.
+    #  @param parameters the parts of the postcode the function should accept, in order; any of 
+    #    ValidatorParameters that are left out are None (so must not be needed by the rules).
+    #  @param fail_fast when True the function stops at the first rule the postcode violates.
+    #  @returns a function accepting the given parameters and returning a list of the faults whose 
+    #    rule the postcode violates, in the order they were given (at most one if fail_fast).
+    #  @remarks this avoids a method call (and several attribute lookups) per rule; the rule tables
+    #    are bound when this is called, so it should be called after they are loaded.
+    @staticmethod
+    def CompileValidator(validation_steps, parameters=ValidatorParameters, fail_fast=False):
+
+        v = StandardPostcodeValidator
+        namespace = { name: getattr(v, name) for name in v.RuleTables }
+        source_lines = [ f"def validate({', '.join(parameters)}):" ]
+        source_lines += [ f"    {p} = None" for p in v.ValidatorParameters if not p in parameters ]
+        source_lines.append( "    faults = []" )
+
+        for index, (fault, check_name) in enumerate(validation_steps):
+            namespace[f"fault_{index}"] = fault
+            action = f"return [ fault_{index} ]" if fail_fast else f"faults.append(fault_{index})"
+            source_lines.append(f"    if {v.CheckExpressions[check_name]}: {action}")
+
+        source_lines.append("    return faults")
+        exec( "\n".join(source_lines), namespace )
+        return namespace["validate"]
+
+    ## Compiles a function that checks part of a postcode against a number of rules, and remembers
+    #  the results for the most recently seen inputs.
+    #  @param validation_steps a sequence of (fault, check name) tuples, see CompileValidator.
+    #  @param parameters the parts of the postcode the function should accept, see CompileValidator.
+    #  @param max_size the maximum number of results to remember.
+    #  @param fail_fast when True the function stops at the first rule the postcode violates.
+    #  @returns a function accepting the given parameters and returning a tuple of faults; this
+    #    also provides cache_info() and cache_clear(), see functools.lru_cache.
+    #  @remarks a lot of postcodes share the same parts (there are only ~3,000 outward codes in use), 
+    #    so this is worthwhile where parameters doesn't include every part of a postcode.
+    @staticmethod
+    def CompileCachedValidator(validation_steps, parameters, max_size, fail_fast=False):
+
+        validator = StandardPostcodeValidator.CompileValidator(validation_steps, parameters, fail_fast)
+
+        @lru_cache(maxsize=max_size)
+        def cached_validator(*args):
+            return tuple( validator(*args) )
+
+        return cached_validator
 
     ## Areas that only have single digit districts (ignoring sub-divisions)
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
-    AreasWithOnlySingleDigitDistricts = []
+    AreasWithOnlySingleDigitDistricts = frozenset()
 
     ## Checks if a postcode is in an area with only single digit districts and if 
     #  so - that the district specified is only a single digit.
@@ -33,7 +105,7 @@ class StandardPostcodeValidator(object):
 
     ## Areas that only have double digit districts (ignoring sub-divisions)
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
-    AreasWithOnlyDoubleDigitDistricts = []
+    AreasWithOnlyDoubleDigitDistricts = frozenset()
         
     ## Checks if a postcode is in an area with only double digit districts and 
     #  if so - that the district specified has two digits as required.
@@ -52,7 +124,7 @@ class StandardPostcodeValidator(object):
 
     ## Areas that have a district zero.
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
-    AreasWithDistrictZero = []
+    AreasWithDistrictZero = frozenset()
         
     ## Checks if a postcode has a district zero if it specified one.
     #  @param cls the type of class that is invoking this method.
@@ -70,7 +142,7 @@ class StandardPostcodeValidator(object):
 
     ## Areas that do not have a district 10
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
-    AreasWithoutDistrictTen = []
+    AreasWithoutDistrictTen = frozenset()
         
     ## Checks if a postcode has a district ten if it specified one.
     #  @param cls the type of class that is invoking this method.
@@ -88,8 +160,17 @@ class StandardPostcodeValidator(object):
 
     ## Only a few areas have subdivided districts
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
+    #  @remarks map of area => { district => frozenset of subdistricts, or None if any are used }
     AreasWithSubdistricts = {}
 
+    ## The (area, district) pairs which are subdivided.
+    #  @remarks compiled from AreasWithSubdistricts when it is loaded.
+    DistrictsWithSubdistricts = frozenset()
+
+    ## Map of (area, district) => frozenset of subdistricts, for districts only using specific subdistricts.
+    #  @remarks compiled from AreasWithSubdistricts when it is loaded.
+    SpecificSubdistricts = {}
+
     ## If a postcode has subdistricts, check its supposed to.
     #  @param cls the type of class that is invoking this method.
     #  @param postcode the postcode to check for conformance to this rule.
@@ -125,7 +206,7 @@ class StandardPostcodeValidator(object):
 
     ## Charactesr that are not used in the first position.
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
-    FirstPositionExcludes = []
+    FirstPositionExcludes = frozenset()
     
     ## Checks that a postcode does not include usued characters in the first postition.
     #  @param cls the type of class that is invoking this method.
@@ -141,7 +222,7 @@ class StandardPostcodeValidator(object):
 
     ## Charactesr that are not used in the second position.
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
-    SecondPositionExcludes = []
+    SecondPositionExcludes = frozenset()
     
     ## Checks that a postcode does not include unused characters in the second postition.
     #  @param cls the type of class that is invoking this method.
@@ -159,7 +240,7 @@ class StandardPostcodeValidator(object):
 
     ## Charactesr that are used in the third apha position (for single digit areas).
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
-    SingleDigitAreaSubdistricts = []
+    SingleDigitAreaSubdistricts = frozenset()
     
     ## Checks that a postcode does not include unused subdistricts for single digit areas.
     #  @param cls the type of class that is invoking this method.
@@ -177,7 +258,7 @@ class StandardPostcodeValidator(object):
 
     ## Charactesr that are used in the fourth apha position (for double digit areas).
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
-    DoubleDigitAreaSubdistricts = []
+    DoubleDigitAreaSubdistricts = frozenset()
     
     ## Checks that a postcode does not include unused subdistricts for double digit areas.
     #  @param cls the type of class that is invoking this method.
@@ -197,7 +278,7 @@ class StandardPostcodeValidator(object):
 
     ## Charactesr that are not used in the unit string.
     #  @remarks loaded from JSON file 'standard_postcode_validator.json'
-    UnitExcludes = []
+    UnitExcludes = frozenset()
     
     ## Checks that a postcode does not include characters in the first character of the unit string that are unused.
     #  @remarks we check the first/second unit character seperately to provide more comprehensive errors.
@@ -221,6 +302,12 @@ class StandardPostcodeValidator(object):
         impacted_by_rule = character in cls.UnitExcludes
         return impacted_by_rule
 
+    ## The names of the rule tables which are made available to CheckExpressions.
+    RuleTables = ( 'AreasWithOnlySingleDigitDistricts', 'AreasWithOnlyDoubleDigitDistricts', 
+        'AreasWithDistrictZero', 'AreasWithoutDistrictTen', 'DistrictsWithSubdistricts', 
+        'SpecificSubdistricts', 'FirstPositionExcludes', 'SecondPositionExcludes', 
+        'SingleDigitAreaSubdistricts', 'DoubleDigitAreaSubdistricts', 'UnitExcludes' )
+
 
 ## Loads various static members used for validation of standard postcodes from
 #  a JSON file - this is expected to be co-located with this class.
@@ -234,21 +321,30 @@ def load_validator_params_from_json():
     with open(json_configuration_file, 'r') as file_handle:
         config_json = load(file_handle)
 
-    StandardPostcodeValidator.AreasWithDistrictZero = config_json['has-district-zero']
-    StandardPostcodeValidator.AreasWithoutDistrictTen = config_json['no-district-ten']
-    StandardPostcodeValidator.AreasWithOnlyDoubleDigitDistricts = config_json['double-digit-districts']
-    StandardPostcodeValidator.AreasWithOnlySingleDigitDistricts = config_json['single-digit-districts']
-    StandardPostcodeValidator.SingleDigitAreaSubdistricts = config_json['single-digit-area-subdistricts']
-    StandardPostcodeValidator.DoubleDigitAreaSubdistricts = config_json['double-digit-area-subdistricts']
-    StandardPostcodeValidator.SecondPositionExcludes = config_json['second-position-excludes']
-    StandardPostcodeValidator.FirstPositionExcludes = config_json['first-position-excludes']
-    StandardPostcodeValidator.UnitExcludes = config_json['unit-excludes']
+    # lists are loaded as frozensets, as they are only ever used for membership tests.
+    StandardPostcodeValidator.AreasWithDistrictZero = frozenset( config_json['has-district-zero'] )
+    StandardPostcodeValidator.AreasWithoutDistrictTen = frozenset( config_json['no-district-ten'] )
+    StandardPostcodeValidator.AreasWithOnlyDoubleDigitDistricts = frozenset( config_json['double-digit-districts'] )
+    StandardPostcodeValidator.AreasWithOnlySingleDigitDistricts = frozenset( config_json['single-digit-districts'] )
+    StandardPostcodeValidator.SingleDigitAreaSubdistricts = frozenset( config_json['single-digit-area-subdistricts'] )
+    StandardPostcodeValidator.DoubleDigitAreaSubdistricts = frozenset( config_json['double-digit-area-subdistricts'] )
+    StandardPostcodeValidator.SecondPositionExcludes = frozenset( config_json['second-position-excludes'] )
+    StandardPostcodeValidator.FirstPositionExcludes = frozenset( config_json['first-position-excludes'] )
+    StandardPostcodeValidator.UnitExcludes = frozenset( config_json['unit-excludes'] )
     
     subdivision_map = config_json["subdivided-districts"]
     StandardPostcodeValidator.AreasWithSubdistricts = {  k: { 
-        int(k1): v1 for k1, v1 in v.items()
+        int(k1): frozenset(v1) if v1 else None for k1, v1 in v.items()
     } for k, v in subdivision_map.items() }
 
+    # and flattened into (area, district) keyed tables, so rules need only a single lookup. An 
+    # area without a list of districts allows subdistricts in any of them.
+    district_subdivisions = { (area, district): subdistricts 
+        for area, districts in StandardPostcodeValidator.AreasWithSubdistricts.items()
+        for district, subdistricts in ( districts.items() or dict.fromkeys( range(100) ).items() ) }
+    StandardPostcodeValidator.DistrictsWithSubdistricts = frozenset( district_subdivisions.keys() )
+    StandardPostcodeValidator.SpecificSubdistricts = { k: v for k, v in district_subdivisions.items() if v }
+
 
 load_validator_params_from_json()
 